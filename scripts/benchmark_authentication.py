@@ -0,0 +1,92 @@
+"""Benchmark the authentication throughput with API keys.
+
+Compares verifying an API key with bcrypt on every request (the previous
+behavior) with the verified-credential cache, using multiple threads like
+the server does. The key is verified through `APIKeyInternalResponse`, the
+same code path which authenticates API keys in the server.
+
+Usage:
+    python scripts/benchmark_authentication.py
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from uuid import uuid4
+
+from zenml.models import (
+    APIKeyInternalResponse,
+    APIKeyResponseBody,
+    APIKeyResponseMetadata,
+)
+from zenml.utils.time_utils import utc_now
+from zenml.utils.verification_cache import (
+    get_bcrypt_context,
+    verified_credentials,
+)
+
+NUM_REQUESTS = 200
+NUM_THREADS = 8
+
+
+def measure(verify: Callable[[], bool]) -> float:
+    """Measures the authentication throughput.
+
+    Args:
+        verify: Function that verifies the key once.
+
+    Returns:
+        The number of authentications per second.
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        results = list(executor.map(lambda _: verify(), range(NUM_REQUESTS)))
+    assert all(results)
+    return NUM_REQUESTS / (time.perf_counter() - start)
+
+
+def create_api_key(key: str) -> APIKeyInternalResponse:
+    """Creates an API key model which stores the hash of a key.
+
+    Args:
+        key: The key.
+
+    Returns:
+        The API key model.
+    """
+    now = utc_now()
+    return APIKeyInternalResponse(
+        id=uuid4(),
+        name="benchmark",
+        # The service account is not needed to verify the key
+        body=APIKeyResponseBody.model_construct(
+            created=now,
+            updated=now,
+            key=get_bcrypt_context().hash(key),
+            active=True,
+        ),
+        metadata=APIKeyResponseMetadata(
+            description="", retain_period_minutes=0
+        ),
+    )
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    key = "ZENKEY_benchmark"
+    api_key = create_api_key(key)
+
+    # Cached verifications expire immediately without a TTL
+    ttl = verified_credentials.ttl
+    verified_credentials.ttl = 0
+    uncached = measure(lambda: api_key.verify_key(key))
+    verified_credentials.ttl = ttl
+    # Warm up the cache like the first request of a client would
+    api_key.verify_key(key)
+    cached = measure(lambda: api_key.verify_key(key))
+    print(f"{'uncached (auth/s)':>18} {'cached (auth/s)':>16}")
+    print(f"{uncached:>18.1f} {cached:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark parsing deployment configurations when hydrating step runs.
+
+Compares parsing the deployment configurations once per step run (the
+previous behavior) with the cached parsed deployment configuration for runs
+of different sizes.
+
+Usage:
+    python scripts/benchmark_step_run_hydration.py
+"""
+
+import json
+import time
+from typing import Callable, Dict, Tuple
+
+from zenml.config.pipeline_configurations import PipelineConfiguration
+from zenml.config.source import Source, SourceType
+from zenml.config.step_configurations import (
+    Step,
+    StepConfiguration,
+    StepSpec,
+)
+from zenml.zen_stores.schemas.pipeline_deployment_schemas import (
+    ParsedDeploymentConfiguration,
+)
+
+RUN_SIZES = (10, 100, 1000)
+
+
+def build_configurations(num_steps: int) -> Tuple[str, str]:
+    """Builds the JSON configurations of a deployment.
+
+    Args:
+        num_steps: The number of steps of the deployment.
+
+    Returns:
+        The JSON pipeline and step configurations.
+    """
+    source = Source(module="steps", attribute="my_step", type=SourceType.USER)
+    steps: Dict[str, Dict[str, object]] = {}
+    for index in range(num_steps):
+        name = f"step_{index}"
+        step = Step(
+            spec=StepSpec(
+                source=source,
+                upstream_steps=[f"step_{index - 1}"] if index else [],
+            ),
+            config=StepConfiguration(name=name, parameters={"index": index}),
+        )
+        steps[name] = step.model_dump(mode="json")
+
+    pipeline_configuration = PipelineConfiguration(name="benchmark")
+    return pipeline_configuration.model_dump_json(), json.dumps(steps)
+
+
+def hydrate_uncached(
+    pipeline_configuration: str, step_configurations: str, num_steps: int
+) -> None:
+    """Parses the configurations for each step run.
+
+    Args:
+        pipeline_configuration: The JSON pipeline configuration.
+        step_configurations: The JSON step configurations.
+        num_steps: The number of steps of the deployment.
+    """
+    for index in range(num_steps):
+        Step.model_validate(json.loads(step_configurations)[f"step_{index}"])
+        PipelineConfiguration.model_validate_json(pipeline_configuration)
+
+
+def hydrate_cached(
+    pipeline_configuration: str, step_configurations: str, num_steps: int
+) -> None:
+    """Decodes the step configurations once for all step runs.
+
+    Args:
+        pipeline_configuration: The JSON pipeline configuration.
+        step_configurations: The JSON step configurations.
+        num_steps: The number of steps of the deployment.
+    """
+    parsed_configuration = ParsedDeploymentConfiguration(
+        pipeline_configuration=pipeline_configuration,
+        step_configurations=step_configurations,
+    )
+    for index in range(num_steps):
+        parsed_configuration.get_step_configuration(f"step_{index}")
+        _ = parsed_configuration.pipeline_configuration
+
+
+def measure(func: Callable[[str, str, int], None], num_steps: int) -> float:
+    """Measures the duration of hydrating a run.
+
+    Args:
+        func: The hydration function.
+        num_steps: The number of steps of the run.
+
+    Returns:
+        The duration in seconds.
+    """
+    pipeline_configuration, step_configurations = build_configurations(
+        num_steps
+    )
+    start = time.perf_counter()
+    func(pipeline_configuration, step_configurations, num_steps)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    print(f"{'steps':>6} {'uncached (s)':>14} {'cached (s)':>12}")
+    for num_steps in RUN_SIZES:
+        uncached = measure(hydrate_uncached, num_steps)
+        cached = measure(hydrate_cached, num_steps)
+        print(f"{num_steps:>6} {uncached:>14.4f} {cached:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,7 @@ from zenml.model.utils import (
 )
 from zenml.artifacts.artifact_config import ArtifactConfig
 from zenml.artifacts.external_artifact import ExternalArtifact
+from zenml.artifacts.load_config import ArtifactLoadConfig
 from zenml.model.model import Model
 from zenml.pipelines import get_pipeline_context, pipeline
 from zenml.steps import step, get_step_context
@@ -53,6 +54,7 @@ from zenml.entrypoints import entrypoint
 
 __all__ = [
     "ArtifactConfig",
+    "ArtifactLoadConfig",
     "ExternalArtifact",
     "get_pipeline_context",
     "get_step_context",
@@ -0,0 +1,545 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Node-local read-through cache for artifacts in remote artifact stores.
+
+The cache is disabled by default and can be enabled by setting the
+`ZENML_ARTIFACT_CACHE_MAX_SIZE` environment variable to the maximum size of
+the cache in MiB. Files are cached in the directory specified by the
+`ZENML_ARTIFACT_CACHE_PATH` environment variable, or in a subdirectory of the
+global config directory if not set.
+
+Reads are only served from the cache while loading a specific artifact
+version (see `cache_artifact_reads`), which makes sure that cache entries are
+keyed by the immutable artifact version instead of a mutable file path.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from typing import OrderedDict as OrderedDictType
+from uuid import UUID, uuid4
+
+from zenml.constants import (
+    ENV_ZENML_ARTIFACT_CACHE_MAX_SIZE,
+    ENV_ZENML_ARTIFACT_CACHE_PATH,
+    handle_int_env_var,
+)
+from zenml.io import fileio
+from zenml.logger import get_logger
+from zenml.utils import io_utils
+
+logger = get_logger(__name__)
+
+ARTIFACT_CACHE_DIRECTORY_NAME = "artifact_cache"
+LAST_ACCESS_FILE_NAME = ".last_access"
+TEMPORARY_FILE_SUFFIX = ".tmp"
+EVICTED_ENTRY_SUFFIX = ".evicted"
+READ_MODES = {"r", "rb"}
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# The artifact version ID and URI of the artifact that is currently being
+# loaded in this thread/task.
+_active_artifact: ContextVar[Optional[Tuple[UUID, str]]] = ContextVar(
+    "active_artifact", default=None
+)
+
+
+class LocalArtifactCache:
+    """Size-bounded LRU cache for artifact files on the local disk.
+
+    Each artifact version gets its own cache entry directory, which contains
+    the cached files of the artifact at their path relative to the artifact
+    URI. Files are downloaded to a temporary file and atomically moved into
+    place, and entries are atomically renamed before they're deleted, which
+    makes it safe for multiple processes to share a cache directory.
+
+    The sizes and access order of the entries are kept in memory, so that
+    files can be added without scanning the cache directory. The index is
+    built from the cache directory on first use and rebuilt whenever another
+    process sharing the cache directory evicted one of its entries.
+    """
+
+    def __init__(self, root: str, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            root: The directory in which to cache files.
+            max_size: The maximum size of all cached files in bytes.
+        """
+        self.root = root
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # Sizes of the cache entries by path, least recently used first
+        self._entries: Optional[OrderedDictType[str, int]] = None
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Metrics of this cache for the current process.
+
+        Returns:
+            The number of cache hits, misses and evicted entries.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    @staticmethod
+    def get_entry_name(artifact_version_id: UUID, uri: str) -> str:
+        """Gets the name of the cache entry for an artifact version.
+
+        Args:
+            artifact_version_id: The ID of the artifact version.
+            uri: The URI of the artifact version.
+
+        Returns:
+            The cache entry name.
+        """
+        return hashlib.sha256(
+            f"{artifact_version_id}:{uri}".encode()
+        ).hexdigest()
+
+    def get_file(
+        self,
+        artifact_version_id: UUID,
+        uri: str,
+        path: str,
+        download: Callable[[str], None],
+    ) -> str:
+        """Gets the local path of a cached artifact file.
+
+        Args:
+            artifact_version_id: The ID of the artifact version.
+            uri: The URI of the artifact version.
+            path: The path of the file in the artifact store.
+            download: Function that downloads the file to the given local
+                path. This will be called if the file is not cached yet.
+
+        Returns:
+            The local path of the cached file.
+        """
+        entry_path = os.path.join(
+            self.root, self.get_entry_name(artifact_version_id, uri)
+        )
+        relative_path = os.path.relpath(path, uri)
+        local_path = os.path.join(entry_path, relative_path)
+
+        if os.path.isfile(local_path):
+            with self._lock:
+                self._hits += 1
+                self._record_access(entry_path)
+            self._touch(entry_path)
+            return local_path
+
+        with self._lock:
+            self._misses += 1
+            # Make sure the index doesn't include the file downloaded below
+            self._get_index()
+
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        temporary_path = f"{local_path}.{uuid4().hex}{TEMPORARY_FILE_SUFFIX}"
+        try:
+            download(temporary_path)
+            os.replace(temporary_path, local_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+        with self._lock:
+            self._record_access(
+                entry_path, added_size=os.path.getsize(local_path)
+            )
+        self._touch(entry_path)
+        self._evict(keep=entry_path)
+        return local_path
+
+    def clear(self) -> None:
+        """Removes all cached files."""
+        for entry_path, _, _ in self._get_entries():
+            self._remove_entry(entry_path)
+
+        with self._lock:
+            self._entries = None
+            self._size = 0
+
+    @staticmethod
+    def _touch(entry_path: str) -> None:
+        """Updates the last access time of a cache entry.
+
+        Args:
+            entry_path: Path of the cache entry.
+        """
+        try:
+            with open(os.path.join(entry_path, LAST_ACCESS_FILE_NAME), "a"):
+                pass
+            os.utime(os.path.join(entry_path, LAST_ACCESS_FILE_NAME))
+        except OSError:
+            # The entry was evicted by another process in the meantime
+            pass
+
+    def _get_index(self) -> OrderedDictType[str, int]:
+        """Gets the in-memory index of the cache entries.
+
+        Must be called while holding the lock.
+
+        Returns:
+            The sizes of the cache entries by path, least recently used first.
+        """
+        if self._entries is None:
+            self._entries = OrderedDict(
+                (entry_path, size)
+                for entry_path, _, size in sorted(
+                    self._get_entries(), key=lambda e: e[1]
+                )
+            )
+            self._size = sum(self._entries.values())
+
+        return self._entries
+
+    def _record_access(self, entry_path: str, added_size: int = 0) -> None:
+        """Marks a cache entry as most recently used in the index.
+
+        Must be called while holding the lock.
+
+        Args:
+            entry_path: Path of the cache entry.
+            added_size: Size of a file that was added to the entry.
+        """
+        entries = self._get_index()
+        if entry_path in entries:
+            entries[entry_path] += added_size
+            self._size += added_size
+            entries.move_to_end(entry_path)
+        else:
+            # The entry is new or was added by another process
+            size = self._get_entry_size(entry_path)
+            entries[entry_path] = size
+            self._size += size
+
+    def _get_entries(self) -> List[Tuple[str, float, int]]:
+        """Gets all cache entries by scanning the cache directory.
+
+        Returns:
+            List of path, last access time and size of all cache entries.
+        """
+        if not os.path.isdir(self.root):
+            return []
+
+        entries = []
+        for entry_name in os.listdir(self.root):
+            entry_path = os.path.join(self.root, entry_name)
+            if entry_name.endswith(EVICTED_ENTRY_SUFFIX) or not os.path.isdir(
+                entry_path
+            ):
+                continue
+
+            try:
+                last_access = os.path.getmtime(
+                    os.path.join(entry_path, LAST_ACCESS_FILE_NAME)
+                )
+            except OSError:
+                last_access = 0.0
+
+            entries.append(
+                (entry_path, last_access, self._get_entry_size(entry_path))
+            )
+
+        return entries
+
+    @staticmethod
+    def _get_entry_size(entry_path: str) -> int:
+        """Gets the size of all files of a cache entry.
+
+        Args:
+            entry_path: Path of the cache entry.
+
+        Returns:
+            The size of the cache entry in bytes.
+        """
+        size = 0
+        for directory, _, files in os.walk(entry_path):
+            for file in files:
+                try:
+                    size += os.path.getsize(os.path.join(directory, file))
+                except OSError:
+                    pass
+
+        return size
+
+    def _evict(self, keep: str) -> None:
+        """Evicts the least recently used entries until the cache fits.
+
+        Args:
+            keep: Path of an entry that should not be evicted.
+        """
+        with self._lock:
+            entries = self._get_index()
+            evicted_entries = []
+            for entry_path in list(entries):
+                if self._size <= self.max_size:
+                    break
+                if entry_path == keep:
+                    continue
+
+                self._size -= entries.pop(entry_path)
+                evicted_entries.append(entry_path)
+
+        for entry_path in evicted_entries:
+            if self._remove_entry(entry_path):
+                with self._lock:
+                    self._evictions += 1
+            else:
+                # Another process evicted the entry, so the index might be
+                # out of sync with the cache directory
+                with self._lock:
+                    self._entries = None
+
+    @staticmethod
+    def _remove_entry(entry_path: str) -> bool:
+        """Removes a cache entry.
+
+        Args:
+            entry_path: Path of the cache entry.
+
+        Returns:
+            Whether the entry was removed by this call.
+        """
+        evicted_path = f"{entry_path}.{uuid4().hex}{EVICTED_ENTRY_SUFFIX}"
+        try:
+            # Renaming is atomic, so other processes will either see the
+            # complete entry or none at all
+            os.rename(entry_path, evicted_path)
+        except OSError:
+            # Already removed by another process
+            return False
+
+        shutil.rmtree(evicted_path, ignore_errors=True)
+        return True
+
+
+_artifact_cache: Optional[LocalArtifactCache] = None
+_artifact_cache_lock = threading.Lock()
+
+
+def get_artifact_cache() -> Optional[LocalArtifactCache]:
+    """Gets the artifact cache of this process.
+
+    Returns:
+        The artifact cache or `None` if the cache is disabled.
+    """
+    global _artifact_cache
+
+    max_size = handle_int_env_var(ENV_ZENML_ARTIFACT_CACHE_MAX_SIZE, 0)
+    if max_size <= 0:
+        return None
+
+    root = os.getenv(ENV_ZENML_ARTIFACT_CACHE_PATH) or os.path.join(
+        io_utils.get_global_config_directory(), ARTIFACT_CACHE_DIRECTORY_NAME
+    )
+    max_size = max_size * 1024 * 1024
+
+    with _artifact_cache_lock:
+        if (
+            _artifact_cache is None
+            or _artifact_cache.root != root
+            or _artifact_cache.max_size != max_size
+        ):
+            _artifact_cache = LocalArtifactCache(root=root, max_size=max_size)
+
+        return _artifact_cache
+
+
+class cache_artifact_reads:
+    """Context manager to serve reads of an artifact version from the cache.
+
+    While active, reading files inside the artifact URI through the `open` or
+    `copyfile` methods of a remote artifact store will be served from the
+    local artifact cache, if it is enabled.
+    """
+
+    def __init__(self, artifact_version_id: UUID, uri: str) -> None:
+        """Initializes the context manager.
+
+        Args:
+            artifact_version_id: The ID of the artifact version to load.
+            uri: The URI of the artifact version to load.
+        """
+        self.artifact_version_id = artifact_version_id
+        self.uri = uri
+
+    def __enter__(self) -> None:
+        """Enters the context manager."""
+        self._token = _active_artifact.set(
+            (self.artifact_version_id, self.uri)
+        )
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Exits the context manager.
+
+        Args:
+            exc_type: The class of the exception.
+            exc_val: The instance of the exception.
+            exc_tb: The traceback of the exception.
+        """
+        _active_artifact.reset(self._token)
+
+
+def _get_cached_path(
+    path: Any, open_remote: Callable[..., Any]
+) -> Optional[str]:
+    """Gets the local cached path for a file of the active artifact.
+
+    Args:
+        path: The path of the file in the artifact store.
+        open_remote: Function to open the file in the artifact store.
+
+    Returns:
+        The local path of the cached file or `None` if the file should not be
+        served from the cache.
+    """
+    active_artifact = _active_artifact.get()
+    if active_artifact is None:
+        return None
+
+    cache = get_artifact_cache()
+    if cache is None:
+        return None
+
+    artifact_version_id, uri = active_artifact
+    path = fileio.convert_to_str(path)
+    if path != uri and not path.startswith(uri.rstrip("/") + "/"):
+        return None
+
+    def _download(local_path: str) -> None:
+        start = time.perf_counter()
+        with open_remote(path, "rb") as remote_file:
+            with open(local_path, "wb") as local_file:
+                shutil.copyfileobj(
+                    remote_file, local_file, length=DOWNLOAD_CHUNK_SIZE
+                )
+        logger.debug(
+            "Cached artifact file `%s` in %.2fs.",
+            path,
+            time.perf_counter() - start,
+        )
+
+    try:
+        return cache.get_file(
+            artifact_version_id=artifact_version_id,
+            uri=uri,
+            path=path,
+            download=_download,
+        )
+    except OSError as e:
+        logger.debug("Failed to cache artifact file `%s`: %s", path, e)
+        return None
+
+
+class cached_open:
+    """Wrapper for the `open` method of a remote artifact store."""
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        """Initializes the wrapper.
+
+        Args:
+            func: The `open` method of the artifact store.
+        """
+        self.func = func
+
+    def __call__(self, path: Any, mode: str = "r") -> Any:
+        """Opens a file, potentially from the local artifact cache.
+
+        Args:
+            path: The path of the file to open.
+            mode: The mode in which to open the file.
+
+        Returns:
+            A file-like object.
+        """
+        if mode in READ_MODES:
+            if local_path := _get_cached_path(path, open_remote=self.func):
+                try:
+                    return open(local_path, mode)
+                except FileNotFoundError:
+                    # Evicted by another process in the meantime
+                    pass
+
+        return self.func(path, mode)
+
+
+class cached_copyfile:
+    """Wrapper for the `copyfile` method of a remote artifact store."""
+
+    def __init__(
+        self, func: Callable[..., Any], open_remote: Callable[..., Any]
+    ) -> None:
+        """Initializes the wrapper.
+
+        Args:
+            func: The `copyfile` method of the artifact store.
+            open_remote: The `open` method of the artifact store.
+        """
+        self.func = func
+        self.open_remote = open_remote
+
+    def __call__(self, src: Any, dst: Any, overwrite: bool = False) -> None:
+        """Copies a file, potentially from the local artifact cache.
+
+        Args:
+            src: The path to copy from.
+            dst: The path to copy to.
+            overwrite: If a file already exists at the destination, this
+                method will overwrite it if overwrite=`True` and raise a
+                FileExistsError otherwise.
+
+        Raises:
+            FileExistsError: If a file already exists at the destination
+                and overwrite is not set to `True`.
+        """
+        destination = fileio.convert_to_str(dst)
+        if not io_utils.is_remote(destination):
+            if local_path := _get_cached_path(
+                src, open_remote=self.open_remote
+            ):
+                if not overwrite and os.path.exists(destination):
+                    raise FileExistsError(
+                        f"Unable to copy to destination '{destination}', "
+                        "file already exists. Set `overwrite=True` to copy "
+                        "anyway."
+                    )
+                try:
+                    shutil.copyfile(local_path, destination)
+                    return
+                except FileNotFoundError:
+                    # Evicted by another process in the meantime
+                    pass
+
+        self.func(src, dst, overwrite=overwrite)
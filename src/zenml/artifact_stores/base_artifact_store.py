@@ -443,6 +443,10 @@ class BaseArtifactStore(StackComponent):
 
     def _register(self) -> None:
         """Create and register a filesystem within the filesystem registry."""
+        from zenml.artifact_stores.artifact_cache import (
+            cached_copyfile,
+            cached_open,
+        )
         from zenml.io.filesystem import BaseFilesystem
         from zenml.io.filesystem_registry import default_filesystem_registry
         from zenml.io.local_filesystem import LocalFilesystem
@@ -452,9 +456,31 @@ class BaseArtifactStore(StackComponent):
         }
         for abc_method in inspect.getmembers(BaseArtifactStore):
             if getattr(abc_method[1], "__isabstractmethod__", False):
-                sanitized_method = _sanitize_paths(
-                    getattr(self, abc_method[0]), self.path
+                method = getattr(self, abc_method[0])
+                if isinstance(method, (cached_open, cached_copyfile)):
+                    # Already registered before, make sure we don't wrap the
+                    # method in multiple cache layers
+                    method = method.func
+
+                sanitized_method: Callable[..., Any] = _sanitize_paths(
+                    method, self.path
                 )
+
+                # Reads of remote artifact stores can be served from the
+                # local artifact cache
+                if not isinstance(self, LocalFilesystem):
+                    if abc_method[0] == "open":
+                        sanitized_method = cached_open(sanitized_method)
+                    elif abc_method[0] == "copyfile":
+                        open_method = self.open
+                        if isinstance(open_method, cached_open):
+                            open_method = open_method.func
+                        sanitized_method = cached_copyfile(
+                            sanitized_method,
+                            open_remote=_sanitize_paths(
+                                open_method, self.path
+                            ),
+                        )
                 # prepare overloads for filesystem methods
                 overloads[abc_method[0]] = staticmethod(sanitized_method)
 
@@ -0,0 +1,144 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Configuration of how step input artifacts are loaded."""
+
+import contextlib
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, Tuple
+
+SUPPORTED_FILTER_OPERATORS = {"==", "!=", "<", "<=", ">", ">=", "in", "not in"}
+
+_active_load_config: ContextVar[Optional["ArtifactLoadConfig"]] = ContextVar(
+    "active_load_config", default=None
+)
+
+
+class ArtifactLoadConfig:
+    """Artifact load configuration class.
+
+    Can be used in step definitions to only load parts of a tabular input
+    artifact. Materializers which support it (e.g. the `PandasMaterializer`)
+    push the projection and filters down into the storage format, so that
+    only the required columns and row groups are read.
+
+    This is deliberately not a pydantic model: pydantic would use the schema
+    of a model instance in `Annotated` metadata instead of the schema of the
+    annotated type when validating the step inputs.
+
+    Example:
+    ```python
+    @step
+    def my_step(
+        df: Annotated[
+            pd.DataFrame,
+            ArtifactLoadConfig(
+                columns=["user_id", "age"],
+                filters=[("age", ">=", 18)],
+            ),
+        ],
+    ) -> None:
+        ...
+    ```
+
+    Attributes:
+        columns: Names of the columns to load. If not given, all columns are
+            loaded.
+        filters: Row filters of the form `(column, operator, value)`. Only
+            rows matching all filters are loaded. Supported operators are
+            `==`, `!=`, `<`, `<=`, `>`, `>=`, `in` and `not in`.
+    """
+
+    def __init__(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple[str, str, Any]]] = None,
+    ) -> None:
+        """Initializes the load configuration.
+
+        Args:
+            columns: Names of the columns to load.
+            filters: Row filters of the form `(column, operator, value)`.
+
+        Raises:
+            ValueError: If a filter uses an unsupported operator.
+        """
+        if filters is not None:
+            filters = [
+                (column, operator, value)
+                for column, operator, value in filters
+            ]
+            for column, operator, _ in filters:
+                if operator not in SUPPORTED_FILTER_OPERATORS:
+                    raise ValueError(
+                        f"Unsupported operator `{operator}` in filter for "
+                        f"column `{column}`. Supported operators are: "
+                        f"{sorted(SUPPORTED_FILTER_OPERATORS)}."
+                    )
+
+        self.columns = list(columns) if columns is not None else None
+        self.filters = filters
+
+    def __eq__(self, other: Any) -> bool:
+        """Compares two load configurations.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            Whether the other object is an equal load configuration.
+        """
+        if not isinstance(other, ArtifactLoadConfig):
+            return NotImplemented
+        return (self.columns, self.filters) == (other.columns, other.filters)
+
+    def __repr__(self) -> str:
+        """String representation of the load configuration.
+
+        Returns:
+            The string representation.
+        """
+        return (
+            f"ArtifactLoadConfig(columns={self.columns!r}, "
+            f"filters={self.filters!r})"
+        )
+
+
+@contextlib.contextmanager
+def artifact_load_config(
+    load_config: Optional[ArtifactLoadConfig],
+) -> Iterator[None]:
+    """Context manager to activate a load configuration for materializers.
+
+    Args:
+        load_config: The load configuration of the artifact that is loaded
+            inside this context.
+
+    Yields:
+        None.
+    """
+    token = _active_load_config.set(load_config)
+    try:
+        yield
+    finally:
+        _active_load_config.reset(token)
+
+
+def get_artifact_load_config() -> Optional[ArtifactLoadConfig]:
+    """Gets the load configuration of the artifact that is currently loaded.
+
+    Returns:
+        The active load configuration or `None` if the whole artifact should
+        be loaded.
+    """
+    return _active_load_config.get()
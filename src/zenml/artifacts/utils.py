@@ -15,6 +15,10 @@
 
 import base64
 import contextlib
+import csv
+import hashlib
+import io
+import itertools
 import os
 import tempfile
 import zipfile
@@ -23,6 +27,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
     Type,
@@ -36,6 +41,8 @@ from zenml.artifacts.preexisting_data_materializer import (
 )
 from zenml.client import Client
 from zenml.constants import (
+    ARTIFACT_CONTENT_HASH_METADATA_KEY,
+    ENV_ZENML_SERVER,
     MODEL_METADATA_YAML_FILE_NAME,
 )
 from zenml.enums import (
@@ -56,6 +63,7 @@ from zenml.models import (
     ArtifactVersionRequest,
     ArtifactVersionResponse,
     ArtifactVisualizationRequest,
+    ComponentResponse,
     LoadedVisualization,
     PipelineRunResponse,
     StepRunResponse,
@@ -71,12 +79,17 @@ if TYPE_CHECKING:
     from zenml.config.source import Source
     from zenml.materializers.base_materializer import BaseMaterializer
     from zenml.metadata.metadata_types import MetadataType
+    from zenml.models import ArtifactVisualizationResponse
     from zenml.zen_stores.base_zen_store import BaseZenStore
 
     MaterializerClassOrSource = Union[str, Source, Type[BaseMaterializer]]
 
 logger = get_logger(__name__)
 
+# How many bytes of a visualization to read from the artifact store at once
+# when streaming
+VISUALIZATION_STREAM_BLOCK_SIZE = 64 * 1024
+
 # ----------
 # Public API
 # ----------
@@ -110,6 +123,54 @@ def _save_artifact_visualizations(
     ]
 
 
+def _compute_artifact_content_hash(
+    uri: str, artifact_store: "BaseArtifactStore"
+) -> str:
+    """Computes a hash of all files stored for an artifact.
+
+    Args:
+        uri: The artifact URI.
+        artifact_store: The artifact store in which the artifact is stored.
+
+    Returns:
+        The SHA-256 hex digest of the relative paths and contents of all files
+        inside the artifact URI. Each path and file content is prefixed with
+        its length, so that different files can't produce the same input to
+        the hash.
+    """
+    hash_ = hashlib.sha256()
+
+    file_paths = []
+    for directory, _, files in artifact_store.walk(uri):
+        for file in files:
+            file_paths.append(
+                os.path.join(
+                    fileio.convert_to_str(directory),
+                    fileio.convert_to_str(file),
+                )
+            )
+
+    for file_path in sorted(file_paths):
+        relative_path = os.path.relpath(file_path, uri).replace("\\", "/")
+        encoded_path = relative_path.encode()
+        hash_.update(len(encoded_path).to_bytes(8, "big"))
+        hash_.update(encoded_path)
+
+        # The content is hashed separately, as its length is only known once
+        # it was read completely
+        content_hash = hashlib.sha256()
+        content_length = 0
+        with artifact_store.open(file_path, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                content_hash.update(chunk)
+                content_length += len(chunk)
+
+        hash_.update(content_length.to_bytes(8, "big"))
+        hash_.update(content_hash.digest())
+
+    return hash_.hexdigest()
+
+
 def _store_artifact_data_and_prepare_request(
     data: Any,
     name: str,
@@ -123,6 +184,7 @@ def _store_artifact_data_and_prepare_request(
     store_visualizations: bool = True,
     has_custom_name: bool = True,
     metadata: Optional[Dict[str, "MetadataType"]] = None,
+    store_content_hash: bool = False,
 ) -> ArtifactVersionRequest:
     """Store artifact data and prepare a request to the server.
 
@@ -143,6 +205,9 @@ def _store_artifact_data_and_prepare_request(
         has_custom_name: Whether the artifact has a custom name.
         metadata: Metadata to store for the artifact version. This will be
             ignored if `store_metadata` is set to `False`.
+        store_content_hash: Whether to compute a hash of the stored artifact
+            files and store it in the artifact version metadata. This hash
+            is used for content-based caching.
 
     Returns:
         Artifact version request for the artifact data that was stored.
@@ -157,6 +222,17 @@ def _store_artifact_data_and_prepare_request(
     materializer.validate_save_type_compatibility(data_type)
     materializer.save(data)
 
+    # Compute the hash before storing visualizations, as those might be
+    # stored inside the artifact URI as well
+    content_hash = None
+    if store_content_hash:
+        try:
+            content_hash = _compute_artifact_content_hash(
+                uri=materializer.uri, artifact_store=artifact_store
+            )
+        except (OSError, NotImplementedError) as e:
+            logger.warning("Failed to compute artifact content hash: %s", e)
+
     visualizations = (
         _save_artifact_visualizations(data=data, materializer=materializer)
         if store_visualizations
@@ -174,6 +250,9 @@ def _store_artifact_data_and_prepare_request(
         # the materializer
         combined_metadata.update(metadata or {})
 
+    if content_hash:
+        combined_metadata[ARTIFACT_CONTENT_HASH_METADATA_KEY] = content_hash
+
     artifact_version_request = ArtifactVersionRequest(
         artifact_name=name,
         version=version,
@@ -501,7 +580,43 @@ def load_artifact_visualization(
             visualization or if the visualization was not found in the artifact
             store.
     """
-    # Get the visualization to load
+    visualization = _get_artifact_visualization(artifact, index)
+
+    # Load the visualization from the artifact's artifact store
+    assert artifact.artifact_store_id
+    with _use_artifact_store(
+        artifact_store_id=artifact.artifact_store_id, zen_store=zen_store
+    ) as artifact_store:
+        mode = "rb" if visualization.type == VisualizationType.IMAGE else "r"
+        value = _load_file_from_artifact_store(
+            uri=visualization.uri,
+            artifact_store=artifact_store,
+            mode=mode,
+        )
+
+    # Encode image visualizations if requested
+    if visualization.type == VisualizationType.IMAGE and encode_image:
+        value = base64.b64encode(bytes(value))
+
+    return LoadedVisualization(type=visualization.type, value=value)
+
+
+def _get_artifact_visualization(
+    artifact: "ArtifactVersionResponse", index: int = 0
+) -> "ArtifactVisualizationResponse":
+    """Get a visualization of the given artifact.
+
+    Args:
+        artifact: The artifact to visualize.
+        index: The index of the visualization to get.
+
+    Returns:
+        The visualization.
+
+    Raises:
+        DoesNotExistException: If the artifact does not have the requested
+            visualization or if its artifact store was deleted.
+    """
     if not artifact.visualizations:
         raise DoesNotExistException(
             f"Artifact '{artifact.id}' has no visualizations."
@@ -511,32 +626,212 @@ def load_artifact_visualization(
             f"Artifact '{artifact.id}' only has {len(artifact.visualizations)} "
             f"visualizations, but index {index} was requested."
         )
-    visualization = artifact.visualizations[index]
-
-    # Load the visualization from the artifact's artifact store
     if not artifact.artifact_store_id:
         raise DoesNotExistException(
             f"Artifact '{artifact.id}' cannot be visualized because the "
             "underlying artifact store was deleted."
         )
-    artifact_store = _load_artifact_store(
+    return artifact.visualizations[index]
+
+
+def get_artifact_visualization_size(
+    artifact: "ArtifactVersionResponse",
+    index: int = 0,
+    zen_store: Optional["BaseZenStore"] = None,
+) -> Optional[int]:
+    """Get the size of a visualization of the given artifact.
+
+    Args:
+        artifact: The artifact to visualize.
+        index: The index of the visualization.
+        zen_store: The ZenStore to use for finding the artifact store. If not
+            provided, the client's ZenStore will be used.
+
+    Returns:
+        The size of the visualization in bytes or `None` if the artifact store
+        can't determine it.
+
+    Raises:
+        DoesNotExistException: If the visualization was not found in the
+            artifact store.
+    """
+    visualization = _get_artifact_visualization(artifact, index)
+    assert artifact.artifact_store_id
+    with _use_artifact_store(
         artifact_store_id=artifact.artifact_store_id, zen_store=zen_store
-    )
+    ) as artifact_store:
+        try:
+            return artifact_store.size(visualization.uri)
+        except FileNotFoundError:
+            raise DoesNotExistException(
+                f"File '{visualization.uri}' does not exist in artifact store "
+                f"'{artifact_store.name}'."
+            )
+
+
+def stream_artifact_visualization(
+    artifact: "ArtifactVersionResponse",
+    index: int = 0,
+    zen_store: Optional["BaseZenStore"] = None,
+    offset: int = 0,
+    length: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Stream a visualization of the given artifact.
+
+    In contrast to `load_artifact_visualization`, the visualization is never
+    loaded into memory completely.
+
+    Args:
+        artifact: The artifact to visualize.
+        index: The index of the visualization to stream.
+        zen_store: The ZenStore to use for finding the artifact store. If not
+            provided, the client's ZenStore will be used.
+        offset: The offset from which to start reading.
+        length: The amount of bytes that should be read. If not given, the
+            visualization is read until its end.
+
+    Yields:
+        Blocks of the visualization.
+
+    Raises:
+        DoesNotExistException: If the visualization was not found in the
+            artifact store.
+    """
+    visualization = _get_artifact_visualization(artifact, index)
+    assert artifact.artifact_store_id
+    with _use_artifact_store(
+        artifact_store_id=artifact.artifact_store_id, zen_store=zen_store
+    ) as artifact_store:
+        try:
+            with artifact_store.open(visualization.uri, "rb") as file:
+                if offset:
+                    file.seek(offset)
+                while length is None or length > 0:
+                    block_size = VISUALIZATION_STREAM_BLOCK_SIZE
+                    if length is not None:
+                        block_size = min(block_size, length)
+                    data = file.read(block_size)
+                    if not data:
+                        break
+                    if length is not None:
+                        length -= len(data)
+                    yield data
+        except FileNotFoundError:
+            raise DoesNotExistException(
+                f"File '{visualization.uri}' does not exist in artifact store "
+                f"'{artifact_store.name}'."
+            )
+
+
+def preview_artifact_visualization(
+    artifact: "ArtifactVersionResponse",
+    index: int = 0,
+    zen_store: Optional["BaseZenStore"] = None,
+    max_rows: Optional[int] = None,
+    max_image_size: Optional[int] = None,
+) -> Optional[bytes]:
+    """Load a reduced preview of a visualization of the given artifact.
+
+    CSV visualizations are cut off after `max_rows` rows (not counting the
+    header row), and image visualizations are downsampled so that neither
+    side exceeds `max_image_size` pixels. Only the part of a CSV file that is
+    part of the preview gets read.
+
+    Args:
+        artifact: The artifact to visualize.
+        index: The index of the visualization to preview.
+        zen_store: The ZenStore to use for finding the artifact store. If not
+            provided, the client's ZenStore will be used.
+        max_rows: The maximum number of rows of CSV visualizations.
+        max_image_size: The maximum width and height of image
+            visualizations in pixels.
+
+    Returns:
+        The preview or `None` if no preview was requested for the type of the
+        visualization, the visualization is already smaller than requested
+        or images can't be downsampled because `Pillow` is not installed.
+
+    Raises:
+        DoesNotExistException: If the visualization was not found in the
+            artifact store.
+    """
+    visualization = _get_artifact_visualization(artifact, index)
+    if visualization.type == VisualizationType.CSV and max_rows is not None:
+        preview = _preview_csv
+        limit = max_rows
+    elif (
+        visualization.type == VisualizationType.IMAGE
+        and max_image_size is not None
+    ):
+        preview = _preview_image
+        limit = max_image_size
+    else:
+        return None
+
+    assert artifact.artifact_store_id
+    with _use_artifact_store(
+        artifact_store_id=artifact.artifact_store_id, zen_store=zen_store
+    ) as artifact_store:
+        try:
+            with artifact_store.open(visualization.uri, "rb") as file:
+                return preview(file, limit)
+        except FileNotFoundError:
+            raise DoesNotExistException(
+                f"File '{visualization.uri}' does not exist in artifact store "
+                f"'{artifact_store.name}'."
+            )
+
+
+def _preview_csv(file: Any, max_rows: int) -> Optional[bytes]:
+    """Read the first rows of a CSV file.
+
+    Args:
+        file: The binary CSV file.
+        max_rows: The maximum number of rows to read, not counting the header
+            row.
+
+    Returns:
+        The first rows of the CSV file or `None` if the file does not have
+        more rows.
+    """
+    reader = csv.reader(io.TextIOWrapper(file, encoding="utf-8", newline=""))
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    for row in itertools.islice(reader, max_rows + 1):
+        writer.writerow(row)
+
+    if next(reader, None) is None:
+        return None
+    return output.getvalue().encode("utf-8")
+
+
+def _preview_image(file: Any, max_image_size: int) -> Optional[bytes]:
+    """Downsample an image.
+
+    Args:
+        file: The binary image file.
+        max_image_size: The maximum width and height of the downsampled image
+            in pixels.
+
+    Returns:
+        The downsampled image in its original format or `None` if the image
+        is small enough already or `Pillow` is not installed.
+    """
     try:
-        mode = "rb" if visualization.type == VisualizationType.IMAGE else "r"
-        value = _load_file_from_artifact_store(
-            uri=visualization.uri,
-            artifact_store=artifact_store,
-            mode=mode,
-        )
+        from PIL import Image
+    except ImportError:
+        logger.debug("Pillow is not installed, images can't be downsampled.")
+        return None
 
-        # Encode image visualizations if requested
-        if visualization.type == VisualizationType.IMAGE and encode_image:
-            value = base64.b64encode(bytes(value))
+    with Image.open(file) as image:
+        if max(image.size) <= max_image_size:
+            return None
 
-        return LoadedVisualization(type=visualization.type, value=value)
-    finally:
-        artifact_store.cleanup()
+        image_format = image.format or "PNG"
+        image.thumbnail((max_image_size, max_image_size))
+        output = io.BytesIO()
+        image.save(output, format=image_format)
+        return output.getvalue()
 
 
 def load_artifact_from_response(artifact: "ArtifactVersionResponse") -> Any:
@@ -814,11 +1109,70 @@ def _load_artifact_store(
 
     Returns:
         The loaded artifact store.
+    """
+    return _instantiate_artifact_store(
+        _get_artifact_store_model(artifact_store_id, zen_store)
+    )
+
+
+@contextlib.contextmanager
+def _use_artifact_store(
+    artifact_store_id: Union[str, "UUID"],
+    zen_store: Optional["BaseZenStore"] = None,
+) -> Iterator["BaseArtifactStore"]:
+    """Context manager to use an artifact store (potentially inside the server).
+
+    Inside the server, the artifact store is taken from the pool of long-lived
+    artifact stores. Otherwise, the artifact store is loaded and cleaned up
+    once done.
+
+    Args:
+        artifact_store_id: The id of the artifact store to use.
+        zen_store: The ZenStore to use for finding the artifact store. If not
+            provided, the client's ZenStore will be used.
+
+    Yields:
+        The artifact store.
+    """
+    if isinstance(artifact_store_id, str):
+        artifact_store_id = UUID(artifact_store_id)
+
+    if zen_store is None:
+        zen_store = Client().zen_store
+
+    if ENV_ZENML_SERVER in os.environ:
+        from zenml.zen_server.utils import artifact_store_pool
+
+        with artifact_store_pool().artifact_store(
+            artifact_store_id, zen_store
+        ) as artifact_store:
+            yield artifact_store
+        return
+
+    artifact_store = _load_artifact_store(artifact_store_id, zen_store)
+    try:
+        yield artifact_store
+    finally:
+        artifact_store.cleanup()
+
+
+def _get_artifact_store_model(
+    artifact_store_id: Union[str, "UUID"],
+    zen_store: Optional["BaseZenStore"] = None,
+) -> ComponentResponse:
+    """Get the model of an artifact store (potentially inside the server).
+
+    Args:
+        artifact_store_id: The id of the artifact store to get.
+        zen_store: The ZenStore to use for finding the artifact store. If not
+            provided, the client's ZenStore will be used.
+
+    Returns:
+        The artifact store model.
 
     Raises:
         DoesNotExistException: If the artifact store does not exist or is not
             an artifact store.
-        NotImplementedError: If the artifact store could not be loaded.
     """
     if isinstance(artifact_store_id, str):
         artifact_store_id = UUID(artifact_store_id)
@@ -838,8 +1192,25 @@ def _load_artifact_store(
             f"Stack component '{artifact_store_id}' is not an artifact store."
         )
 
+    return artifact_store_model
+
+
+def _instantiate_artifact_store(
+    artifact_store_model: ComponentResponse,
+) -> "BaseArtifactStore":
+    """Instantiate an artifact store from its model.
+
+    Args:
+        artifact_store_model: The artifact store model.
+
+    Returns:
+        The instantiated artifact store.
+
+    Raises:
+        NotImplementedError: If the artifact store could not be loaded.
+    """
     try:
-        artifact_store = cast(
+        return cast(
             "BaseArtifactStore",
             StackComponent.from_model(artifact_store_model),
         )
@@ -851,8 +1222,6 @@ def _load_artifact_store(
             f"dependencies are not installed. For more information, see {link}."
         )
 
-    return artifact_store
-
 
 def _get_artifact_store_from_response_or_from_active_stack(
     artifact: ArtifactVersionResponse,
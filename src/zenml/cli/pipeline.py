@@ -570,6 +570,63 @@ def refresh_pipeline_run(run_name_or_id: str) -> None:
         )
 
 
+@runs.command("logs", help="Show the logs of a step of a pipeline run.")
+@click.argument("run_name_or_id", type=str, required=True)
+@click.option(
+    "--step",
+    "-s",
+    "step_name",
+    type=str,
+    required=True,
+    help="Name of the step for which to show the logs.",
+)
+@click.option(
+    "--follow",
+    "-f",
+    is_flag=True,
+    help="Continue to output new logs until the step finished.",
+)
+@click.option(
+    "--tail",
+    "-t",
+    type=int,
+    default=None,
+    help="Only show the last N bytes of the logs.",
+)
+def pipeline_run_logs(
+    run_name_or_id: str,
+    step_name: str,
+    follow: bool = False,
+    tail: Optional[int] = None,
+) -> None:
+    """Show the logs of a step of a pipeline run.
+
+    Args:
+        run_name_or_id: The name or ID of the pipeline run.
+        step_name: The name of the step for which to show the logs.
+        follow: If set, continue to output new logs until the step finished.
+        tail: If set, only show the last N bytes of the logs.
+    """
+    client = Client()
+    try:
+        run = client.get_pipeline_run(name_id_or_prefix=run_name_or_id)
+        if step_name not in run.steps:
+            cli_utils.error(
+                f"Pipeline run '{run.name}' has no step named '{step_name}'."
+            )
+
+        for text in client.stream_step_logs(
+            run.steps[step_name].id,
+            offset=-tail if tail else 0,
+            follow=follow,
+        ):
+            click.echo(text, nl=False)
+    except KeyError as e:
+        cli_utils.error(str(e))
+    except KeyboardInterrupt:
+        pass
+
+
 @pipeline.group()
 def builds() -> None:
     """Commands for pipeline builds."""
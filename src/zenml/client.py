@@ -25,6 +25,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -194,7 +195,7 @@ from zenml.services.service_type import ServiceType
 from zenml.utils import io_utils, source_utils
 from zenml.utils.dict_utils import dict_to_bytes
 from zenml.utils.filesync_model import FileSyncModel
-from zenml.utils.pagination_utils import depaginate
+from zenml.utils.pagination_utils import depaginate, iter_depaginated
 from zenml.utils.uuid_utils import is_valid_uuid
 
 if TYPE_CHECKING:
@@ -3951,6 +3952,25 @@ class Client(metaclass=ClientMetaClass):
             hydrate=hydrate,
         )
 
+    def stream_step_logs(
+        self, step_run_id: UUID, offset: int = 0, follow: bool = False
+    ) -> Iterator[str]:
+        """Stream the logs of a step run.
+
+        Args:
+            step_run_id: The ID of the step run.
+            offset: The offset from which to start reading. Negative offsets
+                are relative to the end of the logs.
+            follow: Whether to keep streaming new logs until the step run
+                finished.
+
+        Returns:
+            An iterator over the logs of the step run.
+        """
+        return self.zen_store.stream_step_logs(
+            step_run_id, offset=offset, follow=follow
+        )
+
     def list_run_steps(
         self,
         sort_by: str = "created",
@@ -4407,7 +4427,7 @@ class Client(metaclass=ClientMetaClass):
         Raises:
             ValueError: If the artifact version is still used in any runs.
         """
-        if artifact_version not in depaginate(
+        if artifact_version not in iter_depaginated(
             self.list_artifact_versions, only_unused=True
         ):
             raise ValueError(
@@ -4485,6 +4505,38 @@ class Client(metaclass=ClientMetaClass):
             publisher_step_id: The ID of the step execution that publishes
                 this metadata automatically.
         """
+        run_metadata = self._build_run_metadata_request(
+            metadata=metadata,
+            resources=resources,
+            stack_component_id=stack_component_id,
+            publisher_step_id=publisher_step_id,
+        )
+        self.zen_store.create_run_metadata(run_metadata)
+
+    def _build_run_metadata_request(
+        self,
+        metadata: Dict[str, "MetadataType"],
+        resources: List[RunMetadataResource],
+        stack_component_id: Optional[UUID] = None,
+        publisher_step_id: Optional[UUID] = None,
+    ) -> RunMetadataRequest:
+        """Build a run metadata request.
+
+        Metadata values that are too large or of an unsupported type are
+        skipped.
+
+        Args:
+            metadata: The metadata as a dictionary of key-value pairs.
+            resources: The list of IDs and types of the resources for that the
+                metadata was produced.
+            stack_component_id: The ID of the stack component that produced
+                the metadata.
+            publisher_step_id: The ID of the step execution that publishes
+                this metadata automatically.
+
+        Returns:
+            The run metadata request.
+        """
         from zenml.metadata.metadata_types import get_metadata_type
 
         values: Dict[str, "MetadataType"] = {}
@@ -4509,7 +4561,7 @@ class Client(metaclass=ClientMetaClass):
             values[key] = value
             types[key] = metadata_type
 
-        run_metadata = RunMetadataRequest(
+        return RunMetadataRequest(
             workspace=self.active_workspace.id,
             user=self.active_user.id,
             resources=resources,
@@ -4518,7 +4570,6 @@ class Client(metaclass=ClientMetaClass):
             values=values,
             types=types,
         )
-        self.zen_store.create_run_metadata(run_metadata)
 
     # -------------------------------- Secrets ---------------------------------
 
@@ -210,6 +210,7 @@ class Compiler:
                 enable_artifact_metadata=config.enable_artifact_metadata,
                 enable_artifact_visualization=config.enable_artifact_visualization,
                 enable_step_logs=config.enable_step_logs,
+                enable_content_hash_caching=config.enable_content_hash_caching,
                 settings=config.settings,
                 tags=config.tags,
                 extra=config.extra,
@@ -254,6 +255,13 @@ class Compiler:
                     enable_step_logs=config.enable_step_logs
                 )
 
+        # Override `enable_content_hash_caching` if set at run level
+        if config.enable_content_hash_caching is not None:
+            for invocation in pipeline.invocations.values():
+                invocation.step.configure(
+                    enable_content_hash_caching=config.enable_content_hash_caching
+                )
+
     def _apply_stack_default_settings(
         self, pipeline: "Pipeline", stack: "Stack"
     ) -> None:
@@ -239,12 +239,19 @@ class ServerConfiguration(BaseModel):
             deployment.
         max_request_body_size_in_bytes: The maximum size of the request body in
             bytes. If not specified, the default value of 256 Kb will be used.
-        memcache_max_capacity: The maximum number of entries that the memory
-            cache can hold. If not specified, the default value of 1000 will be
-            used.
+        memcache_max_capacity: The maximum number of entries that each
+            namespace of the memory cache can hold. If not specified, the
+            default value of 1000 will be used.
         memcache_default_expiry: The default expiry time in seconds for cache
             entries. If not specified, the default value of 30 seconds will be
             used.
+        artifact_store_pool_size: The maximum number of instantiated artifact
+            stores that the server keeps around to load artifact
+            visualizations and step logs. If not specified, the default value
+            of 32 will be used.
+        artifact_store_pool_ttl: The time in seconds after which a pooled
+            artifact store is instantiated again. If not specified, the default
+            value of 900 seconds will be used.
     """
 
     deployment_type: ServerDeploymentType = ServerDeploymentType.OTHER
@@ -346,6 +353,9 @@ class ServerConfiguration(BaseModel):
     memcache_max_capacity: int = 1000
     memcache_default_expiry: int = 30
 
+    artifact_store_pool_size: int = 32
+    artifact_store_pool_ttl: int = 900
+
     _deployment_id: Optional[UUID] = None
 
     @model_validator(mode="before")
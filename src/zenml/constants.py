@@ -196,6 +196,8 @@ ENV_ZENML_RUN_SINGLE_STEPS_WITHOUT_STACK = (
 )
 ENV_ZENML_PREVENT_CLIENT_SIDE_CACHING = "ZENML_PREVENT_CLIENT_SIDE_CACHING"
 ENV_ZENML_DISABLE_CREDENTIALS_DISK_CACHING = "DISABLE_CREDENTIALS_DISK_CACHING"
+ENV_ZENML_ARTIFACT_CACHE_PATH = "ZENML_ARTIFACT_CACHE_PATH"
+ENV_ZENML_ARTIFACT_CACHE_MAX_SIZE = "ZENML_ARTIFACT_CACHE_MAX_SIZE"
 
 # Logging variables
 IS_DEBUG_ENV: bool = handle_bool_env_var(ENV_ZENML_DEBUG, default=False)
@@ -262,6 +264,7 @@ DEFAULT_LOCAL_SERVICE_IP_ADDRESS = "127.0.0.1"
 ZEN_SERVER_ENTRYPOINT = "zenml.zen_server.zen_server_api:app"
 
 CODE_HASH_PARAMETER_NAME = "step_source"
+ARTIFACT_CONTENT_HASH_METADATA_KEY = "content_hash"
 
 # Server settings
 DEFAULT_ZENML_SERVER_NAME = "default"
@@ -274,6 +277,11 @@ DEFAULT_ZENML_SERVER_MAX_DEVICE_AUTH_ATTEMPTS = 3
 DEFAULT_ZENML_SERVER_DEVICE_AUTH_TIMEOUT = 60 * 5  # 5 minutes
 DEFAULT_ZENML_SERVER_DEVICE_AUTH_POLLING = 5  # seconds
 DEFAULT_HTTP_TIMEOUT = 30
+DEFAULT_HTTP_POOL_CONNECTIONS = 10
+DEFAULT_HTTP_POOL_MAXSIZE = 10
+DEFAULT_HTTP_RESPONSE_CACHE_SIZE = 256
+# Minimum size in bytes of request and response bodies that are compressed
+HTTP_COMPRESSION_MINIMUM_SIZE = 16 * 1024
 SERVICE_CONNECTOR_VERIFY_REQUEST_TIMEOUT = 120  # seconds
 ZENML_API_KEY_PREFIX = "ZENKEY_"
 DEFAULT_ZENML_SERVER_PIPELINE_RUN_AUTH_WINDOW = 60 * 48  # 48 hours
@@ -329,6 +337,9 @@ DEFAULT_ZENML_SERVER_SECURE_HEADERS_PERMISSIONS = (
 DEFAULT_ZENML_SERVER_SECURE_HEADERS_REPORT_TO = "default"
 DEFAULT_ZENML_SERVER_REPORT_USER_ACTIVITY_TO_DB_SECONDS = 30
 DEFAULT_ZENML_SERVER_MAX_REQUEST_BODY_SIZE_IN_BYTES = 256 * 1024 * 1024
+# Successful credential verifications are cached to avoid repeating bcrypt
+VERIFIED_CREDENTIALS_CACHE_SIZE = 1024
+VERIFIED_CREDENTIALS_CACHE_TTL = 60  # seconds
 
 DEFAULT_REPORTABLE_RESOURCES = ["pipeline", "pipeline_run", "model"]
 REQUIRES_CUSTOM_RESOURCE_REPORTING = ["pipeline", "pipeline_run"]
@@ -345,6 +356,7 @@ ARTIFACT_VERSIONS = "/artifact_versions"
 ARTIFACT_VISUALIZATIONS = "/artifact_visualizations"
 AUTH = "/auth"
 BATCH = "/batch"
+CACHED = "/cached"
 CODE_REFERENCES = "/code_references"
 CODE_REPOSITORIES = "/code_repositories"
 COMPONENT_TYPES = "/component-types"
@@ -357,6 +369,7 @@ DEVICE_VERIFY = "/verify"
 EMAIL_ANALYTICS = "/email-opt-in"
 EVENT_FLAVORS = "/event-flavors"
 EVENT_SOURCES = "/event-sources"
+FINALIZE = "/finalize"
 FLAVORS = "/flavors"
 GET_OR_CREATE = "/get-or-create"
 HEALTH = "/health"
@@ -401,6 +414,7 @@ STATISTICS = "/statistics"
 STATUS = "/status"
 STEP_CONFIGURATION = "/step-configuration"
 STEPS = "/steps"
+STREAM = "/stream"
 TAGS = "/tags"
 TRIGGERS = "/triggers"
 TRIGGER_EXECUTIONS = "/trigger_executions"
@@ -53,6 +53,7 @@ PILLOW = "pillow"
 PLOTLY = "plotly"
 POLARS = "polars"
 PRODIGY = "prodigy"
+PYARROW = "pyarrow"
 PYCARET = "pycaret"
 PYTORCH = "pytorch"
 PYTORCH_L = "pytorch_lightning"
@@ -34,6 +34,7 @@ from zenml.integrations.pandas.materializers.pandas_materializer import (
     PandasMaterializer,
 )
 from zenml.io import fileio
+from zenml.io.local_filesystem import LocalFilesystem
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.utils import io_utils
 
@@ -81,12 +82,19 @@ class HFDatasetMaterializer(BaseMaterializer):
     ) -> Union[Dataset, DatasetDict]:
         """Reads Dataset.
 
+        Datasets in a local artifact store are memory-mapped in place. For
+        remote artifact stores, the dataset is first copied to a local
+        temporary directory, as `datasets` can only memory-map local files.
+
         Args:
             data_type: The type of the dataset to read.
 
         Returns:
             The dataset read from the specified dir.
         """
+        if isinstance(self.artifact_store, LocalFilesystem):
+            return load_from_disk(os.path.join(self.uri, DEFAULT_DATASET_DIR))
+
         with self.get_temporary_directory(delete_at_exit=False) as temp_dir:
             io_utils.copy_dir(
                 os.path.join(self.uri, DEFAULT_DATASET_DIR),
@@ -100,6 +108,10 @@ class HFDatasetMaterializer(BaseMaterializer):
         Args:
             ds: The Dataset to write.
         """
+        if isinstance(self.artifact_store, LocalFilesystem):
+            ds.save_to_disk(os.path.join(self.uri, DEFAULT_DATASET_DIR))
+            return
+
         with self.get_temporary_directory(delete_at_exit=True) as temp_dir:
             path = os.path.join(temp_dir, DEFAULT_DATASET_DIR)
             ds.save_to_disk(path)
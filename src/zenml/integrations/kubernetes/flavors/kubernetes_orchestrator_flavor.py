@@ -15,6 +15,8 @@
 
 from typing import TYPE_CHECKING, Optional, Type
 
+from pydantic import PositiveInt
+
 from zenml.config.base_settings import BaseSettings
 from zenml.constants import KUBERNETES_CLUSTER_RESOURCE_TYPE
 from zenml.integrations.kubernetes import KUBERNETES_ORCHESTRATOR_FLAVOR
@@ -85,6 +87,10 @@ class KubernetesOrchestratorConfig(
         parallel_step_startup_waiting_period: How long to wait in between
             starting parallel steps. This can be used to distribute server
             load when running pipelines with a huge amount of parallel steps.
+        max_parallelism: Maximum number of steps to run at the same time. If
+            more steps are ready to run, the ones on the longest path through
+            the pipeline are started first. If not set, all steps that can run
+            will be started at once.
     """
 
     incluster: bool = False
@@ -93,6 +99,7 @@ class KubernetesOrchestratorConfig(
     local: bool = False
     skip_local_validations: bool = False
     parallel_step_startup_waiting_period: Optional[float] = None
+    max_parallelism: Optional[PositiveInt] = None
 
     @property
     def is_remote(self) -> bool:
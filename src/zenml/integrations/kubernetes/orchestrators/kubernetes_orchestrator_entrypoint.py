@@ -170,6 +170,7 @@ def main() -> None:
         dag=pipeline_dag,
         run_fn=run_step_on_kubernetes,
         parallel_node_startup_waiting_period=parallel_node_startup_waiting_period,
+        max_parallelism=orchestrator.config.max_parallelism,
     ).run()
 
     logger.info("Orchestration pod completed.")
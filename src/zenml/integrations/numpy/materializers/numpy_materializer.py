@@ -14,6 +14,7 @@
 """Implementation of the ZenML NumPy materializer."""
 
 import os
+import tempfile
 from collections import Counter
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type
 
@@ -23,6 +24,7 @@ from zenml.enums import ArtifactType, VisualizationType
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -46,6 +48,10 @@ class NumpyMaterializer(BaseMaterializer):
     def load(self, data_type: Type[Any]) -> "Any":
         """Reads a numpy array from a `.npy` file.
 
+        If the requested data type is `np.memmap`, the array is memory-mapped
+        read-only instead of being read into memory. For remote artifact
+        stores, the file is first downloaded to a local temporary file.
+
         Args:
             data_type: The type of the data to read.
 
@@ -59,6 +65,9 @@ class NumpyMaterializer(BaseMaterializer):
         numpy_file = os.path.join(self.uri, NUMPY_FILENAME)
 
         if self.artifact_store.exists(numpy_file):
+            if issubclass(data_type, np.memmap):
+                return self._load_memory_mapped(numpy_file)
+
             with self.artifact_store.open(numpy_file, "rb") as f:
                 return np.load(f, allow_pickle=True)
         elif self.artifact_store.exists(os.path.join(self.uri, DATA_FILENAME)):
@@ -95,9 +104,51 @@ class NumpyMaterializer(BaseMaterializer):
                     "You can install `pyarrow` by running `pip install pyarrow`.",
                 )
 
+    def _load_memory_mapped(self, numpy_file: str) -> "Any":
+        """Memory-maps a numpy array from a `.npy` file.
+
+        Args:
+            numpy_file: Path of the `.npy` file in the artifact store.
+
+        Returns:
+            The memory-mapped numpy array. Arrays which can not be
+            memory-mapped (e.g. arrays containing Python objects) are read
+            into memory instead.
+        """
+        local_file = numpy_file
+        if io_utils.is_remote(numpy_file):
+            fd, local_file = tempfile.mkstemp(suffix=f"-{NUMPY_FILENAME}")
+            os.close(fd)
+            # This is served from the local artifact cache if it's enabled
+            self.artifact_store.copyfile(
+                numpy_file, local_file, overwrite=True
+            )
+
+        try:
+            return np.load(local_file, mmap_mode="r")
+        except ValueError:
+            logger.debug(
+                "Unable to memory-map numpy array `%s`, reading it into "
+                "memory instead.",
+                numpy_file,
+            )
+            return np.load(local_file, allow_pickle=True)
+        finally:
+            if local_file != numpy_file:
+                try:
+                    # The memory map stays valid after the file was removed
+                    # on POSIX systems
+                    os.remove(local_file)
+                except OSError:
+                    pass
+
     def save(self, arr: "NDArray[Any]") -> None:
         """Writes a np.ndarray to the artifact store as a `.npy` file.
 
+        `np.save` writes the array in fixed-size chunks when the target is
+        not a local file, so saving a memory-mapped array does not read it
+        into memory as a whole.
+
         Args:
             arr: The numpy array to write.
         """
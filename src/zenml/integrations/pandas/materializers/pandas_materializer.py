@@ -19,6 +19,10 @@ from typing import Any, ClassVar, Dict, Optional, Tuple, Type, Union
 import pandas as pd
 
 from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
+from zenml.artifacts.load_config import (
+    ArtifactLoadConfig,
+    get_artifact_load_config,
+)
 from zenml.enums import ArtifactType, VisualizationType
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
@@ -71,6 +75,11 @@ class PandasMaterializer(BaseMaterializer):
     def load(self, data_type: Type[Any]) -> Union[pd.DataFrame, pd.Series]:
         """Reads `pd.DataFrame` or `pd.Series` from a `.parquet` or `.csv` file.
 
+        If the step declared an `ArtifactLoadConfig` for this input, the
+        column projection and row filters are pushed down into pyarrow so
+        that only the required columns and row groups of a `.parquet` file
+        are read.
+
         Args:
             data_type: The type of the data to read.
 
@@ -80,12 +89,21 @@ class PandasMaterializer(BaseMaterializer):
         Returns:
             The pandas dataframe or series.
         """
+        load_config = get_artifact_load_config()
+
         if self.artifact_store.exists(self.parquet_path):
             if self.pyarrow_exists:
                 with self.artifact_store.open(
                     self.parquet_path, mode="rb"
                 ) as f:
-                    df = pd.read_parquet(f)
+                    if load_config:
+                        df = pd.read_parquet(
+                            f,
+                            columns=load_config.columns,
+                            filters=load_config.filters,
+                        )
+                    else:
+                        df = pd.read_parquet(f)
             else:
                 raise ImportError(
                     "You have an old version of a `PandasMaterializer` "
@@ -98,6 +116,9 @@ class PandasMaterializer(BaseMaterializer):
             with self.artifact_store.open(self.csv_path, mode="rb") as f:
                 df = pd.read_csv(f, index_col=0, parse_dates=True)
 
+            if load_config:
+                df = self._apply_load_config(df, load_config)
+
         # validate the type of the data.
         def is_dataframe_or_series(
             df: Union[pd.DataFrame, pd.Series],
@@ -121,6 +142,44 @@ class PandasMaterializer(BaseMaterializer):
 
         return is_dataframe_or_series(df)
 
+    @staticmethod
+    def _apply_load_config(
+        df: pd.DataFrame, load_config: ArtifactLoadConfig
+    ) -> pd.DataFrame:
+        """Applies a load config to an already loaded dataframe.
+
+        Args:
+            df: The dataframe.
+            load_config: The load config to apply.
+
+        Returns:
+            The filtered and projected dataframe.
+        """
+        for column, operator, value in load_config.filters or []:
+            values = df[column]
+            if operator == "==":
+                mask = values == value
+            elif operator == "!=":
+                mask = values != value
+            elif operator == "<":
+                mask = values < value
+            elif operator == "<=":
+                mask = values <= value
+            elif operator == ">":
+                mask = values > value
+            elif operator == ">=":
+                mask = values >= value
+            elif operator == "in":
+                mask = values.isin(value)
+            else:
+                mask = ~values.isin(value)
+            df = df[mask]
+
+        if load_config.columns is not None:
+            df = df[load_config.columns]
+
+        return df
+
     def save(self, df: Union[pd.DataFrame, pd.Series]) -> None:
         """Writes a pandas dataframe or series to the specified filename.
 
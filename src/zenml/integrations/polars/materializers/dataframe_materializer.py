@@ -22,7 +22,8 @@ import pyarrow.parquet as pq  # type: ignore
 
 from zenml.enums import ArtifactType
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
+
+PARQUET_FILENAME = "dataframe.parquet"
 
 
 class PolarsMaterializer(BaseMaterializer):
@@ -34,8 +35,19 @@ class PolarsMaterializer(BaseMaterializer):
     )
     ASSOCIATED_ARTIFACT_TYPE = ArtifactType.DATA
 
+    @property
+    def parquet_path(self) -> str:
+        """Path of the parquet file in the artifact store.
+
+        Returns:
+            The path of the parquet file.
+        """
+        return os.path.join(self.uri, PARQUET_FILENAME).replace("\\", "/")
+
     def load(self, data_type: Type[Any]) -> Any:
-        """Reads and returns Polars data after copying it to temporary path.
+        """Reads and returns Polars data from the artifact store.
+
+        The parquet file is streamed directly from the artifact store.
 
         Args:
             data_type: The type of the data to read.
@@ -43,29 +55,24 @@ class PolarsMaterializer(BaseMaterializer):
         Returns:
             A Polars data frame or series.
         """
-        with self.get_temporary_directory(delete_at_exit=True) as temp_dir:
-            io_utils.copy_dir(self.uri, temp_dir)
-
-            # Load the data from the temporary directory
-            table = pq.read_table(
-                os.path.join(temp_dir, "dataframe.parquet").replace("\\", "/")
-            )
+        with self.artifact_store.open(self.parquet_path, mode="rb") as f:
+            table = pq.read_table(f)
 
-            # If the data is of type pl.Series, convert it back to a pyarrow array
-            # instead of a table.
-            if (
-                table.schema.metadata
-                and b"zenml_is_pl_series" in table.schema.metadata
-            ):
-                isinstance_bytes = table.schema.metadata[b"zenml_is_pl_series"]
-                isinstance_series = bool.from_bytes(isinstance_bytes, "big")
-                if isinstance_series:
-                    table = table.column(0)
+        # If the data is of type pl.Series, convert it back to a pyarrow array
+        # instead of a table.
+        if (
+            table.schema.metadata
+            and b"zenml_is_pl_series" in table.schema.metadata
+        ):
+            isinstance_bytes = table.schema.metadata[b"zenml_is_pl_series"]
+            isinstance_series = bool.from_bytes(isinstance_bytes, "big")
+            if isinstance_series:
+                table = table.column(0)
 
-            # Convert the table to a Polars data frame or series
-            data = pl.from_arrow(table)
+        # Convert the table to a Polars data frame or series
+        data = pl.from_arrow(table)
 
-            return data
+        return data
 
     def save(self, data: Union[pl.DataFrame, pl.Series]) -> None:
         """Writes Polars data to the artifact store.
@@ -99,10 +106,6 @@ class PolarsMaterializer(BaseMaterializer):
             {b"zenml_is_pl_series": isinstance_bytes}
         )
 
-        with self.get_temporary_directory(delete_at_exit=True) as temp_dir:
-            # Write the table to a Parquet file
-            path = os.path.join(temp_dir, "dataframe.parquet").replace(
-                "\\", "/"
-            )
-            pq.write_table(table, path)  # Uses lz4 compression by default
-            io_utils.copy_dir(temp_dir, self.uri)
+        # Write the table directly to a Parquet file in the artifact store
+        with self.artifact_store.open(self.parquet_path, mode="wb") as f:
+            pq.write_table(table, f)  # Uses lz4 compression by default
@@ -0,0 +1,265 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Materializer for partitioned datasets."""
+
+import base64
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+import pyarrow as pa  # type: ignore
+import pyarrow.dataset as ds  # type: ignore
+import pyarrow.parquet as pq  # type: ignore
+
+from zenml.artifacts.load_config import (
+    ArtifactLoadConfig,
+    get_artifact_load_config,
+)
+from zenml.enums import ArtifactType
+from zenml.integrations.pyarrow.partitioned_dataset import PartitionedDataset
+from zenml.logger import get_logger
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.utils import yaml_utils
+
+if TYPE_CHECKING:
+    from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
+    from zenml.metadata.metadata_types import MetadataType
+
+logger = get_logger(__name__)
+
+INDEX_FILENAME = "partitions.json"
+PARTITION_FILENAME_TEMPLATE = "part-{index:05d}.parquet"
+MAX_PARALLEL_PARTITION_WRITES = 4
+
+
+class _PartitionReader:
+    """Re-iterable reader for the partitions of a stored dataset."""
+
+    def __init__(
+        self,
+        artifact_store: "BaseArtifactStore",
+        paths: List[str],
+        load_config: Optional[ArtifactLoadConfig],
+    ) -> None:
+        """Initializes the reader.
+
+        Args:
+            artifact_store: The artifact store in which the partitions are
+                stored.
+            paths: The paths of the partition files.
+            load_config: Optional configuration of which columns and rows to
+                read.
+        """
+        self.artifact_store = artifact_store
+        self.paths = paths
+        self.load_config = load_config
+
+    def __iter__(self) -> Iterator["pa.RecordBatch"]:
+        """Reads the partitions one after the other.
+
+        The projection and filters are pushed down into the parquet reader,
+        so that only the required columns are read and row groups whose
+        statistics don't match the filters are skipped.
+
+        Yields:
+            The record batches of the partitions.
+        """
+        columns, filter_expression = None, None
+        if self.load_config:
+            columns = self.load_config.columns
+            if self.load_config.filters:
+                filter_expression = pq.filters_to_expression(
+                    self.load_config.filters
+                )
+
+        parquet_format = ds.ParquetFileFormat()
+        for path in self.paths:
+            with self.artifact_store.open(path, "rb") as f:
+                fragment = parquet_format.make_fragment(f)
+                yield from fragment.to_batches(
+                    columns=columns, filter=filter_expression
+                )
+
+
+class PartitionedDatasetMaterializer(BaseMaterializer):
+    """Materializer to read/write partitioned datasets.
+
+    The record batches of the dataset are grouped into parquet partitions of
+    at most `rows_per_partition` rows, which are written to the artifact store
+    in parallel. Only a bounded number of partitions is held in memory at any
+    time. An index file stores the names and row counts of all partitions.
+    """
+
+    ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (PartitionedDataset,)
+    ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.DATA
+
+    def load(self, data_type: Type[Any]) -> PartitionedDataset:
+        """Lazily reads a partitioned dataset from the artifact store.
+
+        Args:
+            data_type: The type of the data to read.
+
+        Returns:
+            The partitioned dataset. Partitions are only read while iterating
+            over it.
+        """
+        index = yaml_utils.read_json(os.path.join(self.uri, INDEX_FILENAME))
+        paths = [
+            os.path.join(self.uri, partition["file"])
+            for partition in index["partitions"]
+        ]
+        load_config = get_artifact_load_config()
+        reader = _PartitionReader(
+            artifact_store=self.artifact_store,
+            paths=paths,
+            load_config=load_config,
+        )
+
+        schema = None
+        if index.get("schema"):
+            schema = pa.ipc.read_schema(
+                pa.py_buffer(base64.b64decode(index["schema"]))
+            )
+            if load_config and load_config.columns is not None:
+                schema = pa.schema(
+                    [schema.field(column) for column in load_config.columns]
+                )
+
+        return PartitionedDataset(
+            reader,
+            rows_per_partition=index["rows_per_partition"],
+            schema=schema,
+        )
+
+    def save(self, data: PartitionedDataset) -> None:
+        """Writes a partitioned dataset to the artifact store.
+
+        Args:
+            data: The dataset to write.
+        """
+        partitions: List[Dict[str, Any]] = []
+        pending: Set["Future[None]"] = set()
+        schema: Optional["pa.Schema"] = data.schema
+
+        def _write_partition(batches: List["pa.RecordBatch"]) -> None:
+            filename = PARTITION_FILENAME_TEMPLATE.format(
+                index=len(partitions)
+            )
+            partitions.append(
+                {
+                    "file": filename,
+                    "num_rows": sum(batch.num_rows for batch in batches),
+                }
+            )
+            table = pa.Table.from_batches(batches)
+            path = os.path.join(self.uri, filename)
+
+            if len(pending) >= MAX_PARALLEL_PARTITION_WRITES:
+                # Wait for a running write to finish so that the number of
+                # partitions in memory stays bounded
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    future.result()
+
+            pending.add(executor.submit(self._write_table, table, path))
+
+        with ThreadPoolExecutor(
+            max_workers=MAX_PARALLEL_PARTITION_WRITES
+        ) as executor:
+            batches: List["pa.RecordBatch"] = []
+            num_rows = 0
+            for batch in data.iter_batches():
+                if schema is None:
+                    schema = batch.schema
+
+                while num_rows + batch.num_rows > data.rows_per_partition:
+                    split = data.rows_per_partition - num_rows
+                    batches.append(batch.slice(0, split))
+                    _write_partition(batches)
+                    batch = batch.slice(split)
+                    batches, num_rows = [], 0
+
+                if batch.num_rows:
+                    batches.append(batch)
+                    num_rows += batch.num_rows
+
+            if batches:
+                _write_partition(batches)
+
+            for future in pending:
+                future.result()
+
+        yaml_utils.write_json(
+            os.path.join(self.uri, INDEX_FILENAME),
+            {
+                "rows_per_partition": data.rows_per_partition,
+                "partitions": partitions,
+                # Stored so that empty datasets can still be loaded as a table
+                "schema": (
+                    base64.b64encode(schema.serialize().to_pybytes()).decode()
+                    if schema is not None
+                    else None
+                ),
+            },
+        )
+
+    def _write_table(self, table: "pa.Table", path: str) -> None:
+        """Writes a table as a parquet file to the artifact store.
+
+        Args:
+            table: The table to write.
+            path: The path of the parquet file.
+        """
+        with self.artifact_store.open(path, "wb") as f:
+            pq.write_table(table, f)
+        logger.debug("Wrote partition `%s`.", path)
+
+    def extract_metadata(
+        self, data: PartitionedDataset
+    ) -> Dict[str, "MetadataType"]:
+        """Extract metadata from the stored partition index.
+
+        The dataset itself is not iterated again, as its batches might have
+        been consumed already when saving it.
+
+        Args:
+            data: The dataset to extract metadata from.
+
+        Returns:
+            The extracted metadata as a dictionary.
+        """
+        index = yaml_utils.read_json(os.path.join(self.uri, INDEX_FILENAME))
+        return {
+            "num_partitions": len(index["partitions"]),
+            "num_rows": sum(
+                partition["num_rows"] for partition in index["partitions"]
+            ),
+        }
@@ -0,0 +1,110 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Partitioned dataset of Arrow record batches."""
+
+from typing import Iterable, Iterator, Optional, Union
+
+import pyarrow as pa  # type: ignore
+
+DEFAULT_ROWS_PER_PARTITION = 1_000_000
+
+
+class PartitionedDataset:
+    """Dataset that is stored as multiple parquet partitions.
+
+    The dataset never holds all of its data in memory. When returned from a
+    step, the record batches are consumed and written to the artifact store
+    partition by partition. When used as a step input, the partitions are
+    read lazily while iterating over the dataset.
+
+    Example:
+    ```python
+    @step
+    def produce() -> PartitionedDataset:
+        def batches():
+            for chunk in read_chunks():
+                yield pa.RecordBatch.from_pandas(chunk)
+
+        return PartitionedDataset(batches())
+
+
+    @step
+    def consume(dataset: PartitionedDataset) -> None:
+        for batch in dataset:
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        batches: Iterable[Union["pa.RecordBatch", "pa.Table"]],
+        rows_per_partition: int = DEFAULT_ROWS_PER_PARTITION,
+        schema: Optional["pa.Schema"] = None,
+    ) -> None:
+        """Initializes the dataset.
+
+        Args:
+            batches: The record batches or tables of the dataset. This can be
+                a generator, in which case the dataset can only be iterated
+                over once.
+            rows_per_partition: The maximum number of rows per partition when
+                writing the dataset to the artifact store.
+            schema: Optional schema of the dataset. Used when converting a
+                dataset without any batches to a table.
+
+        Raises:
+            ValueError: If the number of rows per partition is not positive.
+        """
+        if rows_per_partition <= 0:
+            raise ValueError("The number of rows per partition must be > 0.")
+
+        self._batches = batches
+        self.rows_per_partition = rows_per_partition
+        self.schema = schema
+
+    def __iter__(self) -> Iterator["pa.RecordBatch"]:
+        """Iterates over the record batches of the dataset.
+
+        Returns:
+            An iterator over the record batches.
+        """
+        return self.iter_batches()
+
+    def iter_batches(self) -> Iterator["pa.RecordBatch"]:
+        """Iterates over the record batches of the dataset.
+
+        Yields:
+            The record batches.
+        """
+        for batch in self._batches:
+            if isinstance(batch, pa.Table):
+                yield from batch.to_batches()
+            else:
+                yield batch
+
+    def to_table(self, schema: Optional["pa.Schema"] = None) -> "pa.Table":
+        """Reads the whole dataset into memory.
+
+        Args:
+            schema: Optional schema of the table. If not given, the schema is
+                inferred from the batches.
+
+        Returns:
+            The dataset as a single table. If the dataset contains no batches
+            and has no schema, the table has no columns.
+        """
+        batches = list(self.iter_batches())
+        if not batches and schema is None:
+            schema = self.schema or pa.schema([])
+        return pa.Table.from_batches(batches, schema=schema)
@@ -22,3 +22,18 @@ STEP_LOGS_STORAGE_MAX_MESSAGES: int = 100
 
 # How often to merge logs into a single file
 STEP_LOGS_STORAGE_MERGE_INTERVAL_SECONDS: int = 10 * 60
+
+# How many messages can wait to be uploaded before writers get blocked
+STEP_LOGS_STORAGE_QUEUE_SIZE: int = 10000
+
+# How many seconds to wait for logs to be uploaded when flushing explicitly
+STEP_LOGS_STORAGE_FLUSH_TIMEOUT_SECONDS: int = 60
+
+# How many bytes of logs to read from the artifact store at once when streaming
+STEP_LOGS_STREAM_BLOCK_SIZE: int = 64 * 1024
+
+# How many seconds to wait before checking for new logs when following them
+STEP_LOGS_FOLLOW_INTERVAL_SECONDS: int = 2
+
+# How many seconds to keep following logs without any new logs being written
+STEP_LOGS_FOLLOW_MAX_IDLE_SECONDS: int = 10 * 60
@@ -13,28 +13,49 @@
 #  permissions and limitations under the License.
 """ZenML logging handler."""
 
+import asyncio
+import json
 import os
+import queue
 import re
 import sys
+import threading
 import time
 from contextvars import ContextVar
+from datetime import datetime, timezone
 from types import TracebackType
-from typing import Any, Callable, List, Optional, Type, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID, uuid4
 
 from zenml.artifact_stores import BaseArtifactStore
 from zenml.artifacts.utils import (
-    _load_artifact_store,
     _load_file_from_artifact_store,
+    _use_artifact_store,
 )
 from zenml.exceptions import DoesNotExistException
 from zenml.logger import get_logger
 from zenml.logging import (
+    STEP_LOGS_FOLLOW_INTERVAL_SECONDS,
+    STEP_LOGS_FOLLOW_MAX_IDLE_SECONDS,
+    STEP_LOGS_STORAGE_FLUSH_TIMEOUT_SECONDS,
     STEP_LOGS_STORAGE_INTERVAL_SECONDS,
     STEP_LOGS_STORAGE_MAX_MESSAGES,
     STEP_LOGS_STORAGE_MERGE_INTERVAL_SECONDS,
+    STEP_LOGS_STORAGE_QUEUE_SIZE,
+    STEP_LOGS_STREAM_BLOCK_SIZE,
 )
-from zenml.utils.time_utils import utc_now
 from zenml.zen_stores.base_zen_store import BaseZenStore
 
 # Get the logger
@@ -42,7 +63,30 @@ logger = get_logger(__name__)
 
 redirected: ContextVar[bool] = ContextVar("redirected", default=False)
 
+# The logs context that is active in the current thread/context
+_active_logs_context: ContextVar[Optional["StepLogsStorageContext"]] = (
+    ContextVar("active_logs_context", default=None)
+)
+# All logs contexts that are currently active in this process and the threads
+# that entered them, in the order in which they were entered
+_active_logs_contexts: List[
+    Tuple[threading.Thread, "StepLogsStorageContext"]
+] = []
+_active_logs_contexts_lock = threading.Lock()
+# The original stdout/stderr methods while they are wrapped
+_original_std_stream_methods: Dict[str, Callable[..., Any]] = {}
+
 LOGS_EXTENSION = ".log"
+LOGS_INDEX_FILENAME_PREFIX = "index"
+LOGS_INDEX_FILENAME_EXTENSION = ".json"
+MERGED_LOGS_FILE_SUFFIX = "_merged"
+
+ANSI_ESCAPE_CODES_PATTERN = re.compile(
+    r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])"
+)
+
+# Sentinel which tells the shipper thread of a logs storage to stop
+_STOP_SHIPPING = object()
 
 
 def remove_ansi_escape_codes(text: str) -> str:
@@ -54,8 +98,7 @@ def remove_ansi_escape_codes(text: str) -> str:
     Returns:
         the version of the input string where the escape codes are removed.
     """
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return ANSI_ESCAPE_CODES_PATTERN.sub("", text)
 
 
 def prepare_logs_uri(
@@ -107,6 +150,115 @@ def prepare_logs_uri(
         return logs_uri
 
 
+def _read_logs_index(
+    logs_uri: str, artifact_store: "BaseArtifactStore"
+) -> Optional[List[Dict[str, Any]]]:
+    """Reads the index of a logs folder.
+
+    Each writer of a logs folder (e.g. the step launcher and the step
+    operator running the step) keeps its own index file, which lists the
+    chunks it wrote together with their size and the timestamps of their
+    first and last message. The chunks of all index files get ordered by the
+    time of their first message and their byte offsets in the complete logs
+    are computed from their sizes.
+
+    Args:
+        logs_uri: The URI of the logs folder.
+        artifact_store: The artifact store in which the logs are stored.
+
+    Returns:
+        The chunks listed in the index files or None if the folder has no
+        index.
+    """
+    index_files = [
+        str(file)
+        for file in artifact_store.listdir(logs_uri)
+        if str(file).startswith(LOGS_INDEX_FILENAME_PREFIX)
+        and str(file).endswith(LOGS_INDEX_FILENAME_EXTENSION)
+    ]
+    if not index_files:
+        return None
+
+    chunks: List[Dict[str, Any]] = []
+    for index_file in index_files:
+        try:
+            index = json.loads(
+                _load_file_from_artifact_store(
+                    os.path.join(logs_uri, index_file),
+                    artifact_store=artifact_store,
+                    mode="rb",
+                )
+            )
+        except DoesNotExistException:
+            continue
+        chunks.extend(index["chunks"])
+
+    chunks.sort(key=lambda chunk: (chunk["start_time"], chunk["file"]))
+    offset = 0
+    for chunk in chunks:
+        chunk["offset"] = offset
+        offset += chunk["size"]
+    return chunks
+
+
+def _write_logs_index(
+    logs_uri: str,
+    artifact_store: "BaseArtifactStore",
+    chunks: List[Dict[str, Any]],
+    writer_id: str,
+) -> None:
+    """Writes the index file of a writer of a logs folder.
+
+    Args:
+        logs_uri: The URI of the logs folder.
+        artifact_store: The artifact store in which the logs are stored.
+        chunks: The chunks written by the writer.
+        writer_id: The ID of the writer.
+    """
+    filename = (
+        f"{LOGS_INDEX_FILENAME_PREFIX}-{writer_id}"
+        f"{LOGS_INDEX_FILENAME_EXTENSION}"
+    )
+    with artifact_store.open(os.path.join(logs_uri, filename), "wb") as file:
+        file.write(json.dumps({"chunks": chunks}).encode())
+
+
+def _get_chunk_ranges(
+    chunks: List[Dict[str, Any]], offset: int, length: int
+) -> List[Tuple[str, int, int]]:
+    """Gets the chunk ranges that need to be read for a range of the logs.
+
+    Args:
+        chunks: The chunks listed in the logs index.
+        offset: The offset from which to start reading. Negative offsets are
+            relative to the end of the logs.
+        length: The amount of bytes that should be read.
+
+    Returns:
+        The file name, offset and length for each chunk that should be read.
+    """
+    if not chunks:
+        return []
+
+    total_size = chunks[-1]["offset"] + chunks[-1]["size"]
+    start = max(total_size + offset, 0) if offset < 0 else offset
+    end = min(start + length, total_size)
+
+    ranges = []
+    for chunk in chunks:
+        chunk_start = chunk["offset"]
+        chunk_end = chunk_start + chunk["size"]
+        if chunk_end <= start or chunk_start >= end:
+            continue
+
+        range_start = max(start, chunk_start)
+        range_end = min(end, chunk_end)
+        ranges.append(
+            (chunk["file"], range_start - chunk_start, range_end - range_start)
+        )
+    return ranges
+
+
 def fetch_logs(
     zen_store: "BaseZenStore",
     artifact_store_id: Union[str, UUID],
@@ -144,10 +296,21 @@ def fetch_logs(
             ).decode()
         )
 
-    artifact_store = _load_artifact_store(artifact_store_id, zen_store)
-    try:
+    with _use_artifact_store(artifact_store_id, zen_store) as artifact_store:
         if not artifact_store.isdir(logs_uri):
             return _read_file(logs_uri, offset, length)
+        chunks = _read_logs_index(logs_uri, artifact_store)
+        if chunks is not None:
+            # With an index, only the chunks covering the requested range
+            # need to be read
+            return "".join(
+                _read_file(
+                    os.path.join(logs_uri, file), chunk_offset, chunk_length
+                )
+                for file, chunk_offset, chunk_length in _get_chunk_ranges(
+                    chunks, offset, length
+                )
+            )
         else:
             files = artifact_store.listdir(logs_uri)
             if len(files) == 1:
@@ -201,12 +364,290 @@ def fetch_logs(
                         f"'{artifact_store.name}'."
                     )
                 return "".join(ret)
+
+
+def _list_logs_chunks(
+    logs_uri: str, artifact_store: "BaseArtifactStore"
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """Lists the chunks of the logs in the order in which they were written.
+
+    Args:
+        logs_uri: The URI of the logs file or folder.
+        artifact_store: The artifact store in which the logs are stored.
+
+    Returns:
+        The URI of the folder containing the chunks and the chunks.
+
+    Raises:
+        DoesNotExistException: If the logs do not exist in the artifact
+            store.
+    """
+    if not artifact_store.isdir(logs_uri):
+        if not artifact_store.exists(logs_uri):
+            raise DoesNotExistException(
+                f"File '{logs_uri}' does not exist in artifact store "
+                f"'{artifact_store.name}'."
+            )
+        size: int = artifact_store.size(logs_uri)  # type: ignore[assignment]
+        chunk = {"file": os.path.basename(logs_uri), "offset": 0, "size": size}
+        return os.path.dirname(logs_uri), [chunk]
+
+    chunks = _read_logs_index(logs_uri, artifact_store)
+    if chunks is None:
+        # Logs written without an index
+        chunks = []
+        for file in sorted(artifact_store.listdir(logs_uri)):
+            size = artifact_store.size(os.path.join(logs_uri, str(file)))  # type: ignore[assignment]
+            chunks.append(
+                {
+                    "file": str(file),
+                    "offset": (
+                        chunks[-1]["offset"] + chunks[-1]["size"]
+                        if chunks
+                        else 0
+                    ),
+                    "size": size,
+                }
+            )
+    return logs_uri, chunks
+
+
+def _stream_file(
+    uri: str, artifact_store: "BaseArtifactStore", offset: int, length: int
+) -> Generator[bytes, None, int]:
+    """Streams a range of a file from the artifact store.
+
+    Args:
+        uri: The URI of the file.
+        artifact_store: The artifact store in which the file is stored.
+        offset: The offset from which to start reading.
+        length: The amount of bytes that should be read.
+
+    Yields:
+        Blocks of the file content.
+
+    Returns:
+        The amount of bytes that were read.
+
+    Raises:
+        DoesNotExistException: If the file does not exist in the artifact
+            store.
+    """
+    read = 0
+    try:
+        with artifact_store.open(uri, "rb") as file:
+            file.seek(offset)
+            while read < length:
+                data = file.read(
+                    min(STEP_LOGS_STREAM_BLOCK_SIZE, length - read)
+                )
+                if not data:
+                    break
+                read += len(data)
+                yield data
+    except FileNotFoundError:
+        raise DoesNotExistException(
+            f"File '{uri}' does not exist in artifact store "
+            f"'{artifact_store.name}'."
+        )
+    return read
+
+
+def _get_logs_position(
+    logs_uri: str, artifact_store: "BaseArtifactStore", offset: int
+) -> int:
+    """Gets the absolute position in the logs for an offset.
+
+    Args:
+        logs_uri: The URI of the logs file or folder.
+        artifact_store: The artifact store in which the logs are stored.
+        offset: The offset in the logs. Negative offsets are relative to the
+            end of the logs.
+
+    Returns:
+        The position in the logs.
+    """
+    if offset >= 0:
+        return offset
+
+    _, chunks = _list_logs_chunks(logs_uri, artifact_store)
+    size = chunks[-1]["offset"] + chunks[-1]["size"] if chunks else 0
+    return max(size + offset, 0)
+
+
+def _stream_new_logs(
+    logs_uri: str, artifact_store: "BaseArtifactStore", position: int
+) -> Iterator[bytes]:
+    """Streams the logs written so far, starting at a position.
+
+    Args:
+        logs_uri: The URI of the logs file or folder.
+        artifact_store: The artifact store in which the logs are stored.
+        position: The position from which to start reading.
+
+    Yields:
+        Blocks of the logs.
+    """
+    chunks_uri, chunks = _list_logs_chunks(logs_uri, artifact_store)
+    size = chunks[-1]["offset"] + chunks[-1]["size"] if chunks else 0
+    for file, chunk_offset, chunk_length in _get_chunk_ranges(
+        chunks, position, size - position
+    ):
+        yield from _stream_file(
+            os.path.join(chunks_uri, file),
+            artifact_store=artifact_store,
+            offset=chunk_offset,
+            length=chunk_length,
+        )
+
+
+def stream_logs(
+    zen_store: "BaseZenStore",
+    artifact_store_id: Union[str, UUID],
+    logs_uri: str,
+    offset: int = 0,
+    is_running: Optional[Callable[[], bool]] = None,
+) -> Iterator[bytes]:
+    """Streams the logs from the artifact store.
+
+    In contrast to `fetch_logs`, the logs are never loaded into memory
+    completely. Inside the server, use `stream_logs_async` instead so that
+    following the logs does not block a worker thread.
+
+    Args:
+        zen_store: The store in which the artifact is stored.
+        artifact_store_id: The ID of the artifact store.
+        logs_uri: The URI of the artifact.
+        offset: The offset from which to start reading. Negative offsets are
+            relative to the end of the logs.
+        is_running: Optional function that returns whether new logs might
+            still be written. If given, new logs are streamed as they get
+            written until this function returns False or no new logs were
+            written for `STEP_LOGS_FOLLOW_MAX_IDLE_SECONDS`.
+
+    Yields:
+        Blocks of the logs.
+
+    Raises:
+        DoesNotExistException: If the logs do not exist in the artifact
+            store.
+    """
+    with _use_artifact_store(artifact_store_id, zen_store) as artifact_store:
+        position: Optional[int] = None
+        last_read_time = time.monotonic()
+        while True:
+            # Check this before reading, so that all logs written until the
+            # step finished get streamed
+            following = bool(is_running and is_running())
+            try:
+                if position is None:
+                    position = _get_logs_position(
+                        logs_uri, artifact_store, offset
+                    )
+                for data in _stream_new_logs(
+                    logs_uri, artifact_store, position
+                ):
+                    position += len(data)
+                    last_read_time = time.monotonic()
+                    yield data
+            except DoesNotExistException:
+                # The logs might not have been written yet or the chunks got
+                # merged while we were reading them
+                if not following:
+                    raise
+
+            if (
+                not following
+                or time.monotonic() - last_read_time
+                >= STEP_LOGS_FOLLOW_MAX_IDLE_SECONDS
+            ):
+                break
+            time.sleep(STEP_LOGS_FOLLOW_INTERVAL_SECONDS)
+
+
+async def stream_logs_async(
+    zen_store: "BaseZenStore",
+    artifact_store_id: Union[str, UUID],
+    logs_uri: str,
+    offset: int = 0,
+    is_running: Optional[Callable[[], bool]] = None,
+) -> AsyncIterator[bytes]:
+    """Streams the logs from the artifact store without blocking the loop.
+
+    Same as `stream_logs`, but all blocking calls run in the threadpool and
+    the event loop waits between checks for new logs, so that following the
+    logs of a running step does not occupy a worker thread.
+
+    Args:
+        zen_store: The store in which the artifact is stored.
+        artifact_store_id: The ID of the artifact store.
+        logs_uri: The URI of the artifact.
+        offset: The offset from which to start reading. Negative offsets are
+            relative to the end of the logs.
+        is_running: Optional function that returns whether new logs might
+            still be written. If given, new logs are streamed as they get
+            written until this function returns False or no new logs were
+            written for `STEP_LOGS_FOLLOW_MAX_IDLE_SECONDS`.
+
+    Yields:
+        Blocks of the logs.
+
+    Raises:
+        DoesNotExistException: If the logs do not exist in the artifact
+            store.
+    """
+    from starlette.concurrency import run_in_threadpool
+
+    context = _use_artifact_store(artifact_store_id, zen_store)
+    artifact_store = await run_in_threadpool(context.__enter__)
+    try:
+        position: Optional[int] = None
+        last_read_time = time.monotonic()
+        while True:
+            following = bool(
+                is_running and await run_in_threadpool(is_running)
+            )
+            try:
+                if position is None:
+                    position = await run_in_threadpool(
+                        _get_logs_position, logs_uri, artifact_store, offset
+                    )
+                blocks = _stream_new_logs(logs_uri, artifact_store, position)
+                while data := await run_in_threadpool(next, blocks, b""):
+                    position += len(data)
+                    last_read_time = time.monotonic()
+                    yield data
+            except DoesNotExistException:
+                if not following:
+                    raise
+
+            if (
+                not following
+                or time.monotonic() - last_read_time
+                >= STEP_LOGS_FOLLOW_MAX_IDLE_SECONDS
+            ):
+                break
+            await asyncio.sleep(STEP_LOGS_FOLLOW_INTERVAL_SECONDS)
     finally:
-        artifact_store.cleanup()
+        # This might run after the stream was cancelled, in which case
+        # awaiting would fail. Releasing the artifact store does not block.
+        context.__exit__(None, None, None)
 
 
 class StepLogsStorage:
-    """Helper class which buffers and stores logs to a given URI."""
+    """Helper class which buffers and stores logs to a given URI.
+
+    Messages are put on a bounded queue and written to the artifact store by
+    a background shipper thread, so that the (potentially slow) writes never
+    block the thread that emitted the messages. If the queue is full, writers
+    either block until the shipper caught up or, if `drop_when_full` is set,
+    their messages get dropped.
+
+    On immutable filesystems, each storage lists the chunks it wrote in its
+    own index file, which readers merge with the index files of other
+    storages writing to the same logs folder (e.g. the step launcher and a
+    step operator). Writers therefore never overwrite each other's chunks.
+    """
 
     def __init__(
         self,
@@ -215,6 +656,8 @@ class StepLogsStorage:
         max_messages: int = STEP_LOGS_STORAGE_MAX_MESSAGES,
         time_interval: int = STEP_LOGS_STORAGE_INTERVAL_SECONDS,
         merge_files_interval: int = STEP_LOGS_STORAGE_MERGE_INTERVAL_SECONDS,
+        queue_size: int = STEP_LOGS_STORAGE_QUEUE_SIZE,
+        drop_when_full: bool = False,
     ) -> None:
         """Initialization.
 
@@ -226,22 +669,31 @@ class StepLogsStorage:
                 automatically.
             merge_files_interval: the amount of seconds before the created files
                 get merged into a single file.
+            queue_size: the maximum number of messages waiting to be shipped.
+            drop_when_full: whether to drop messages instead of blocking the
+                writer when the queue is full.
         """
         # Parameters
         self.logs_uri = logs_uri
         self.max_messages = max_messages
         self.time_interval = time_interval
         self.merge_files_interval = merge_files_interval
+        self.drop_when_full = drop_when_full
 
         # State
-        self.buffer: List[str] = []
-        self.disabled_buffer: List[str] = []
         self.last_save_time = time.time()
-        self.disabled = False
         self.artifact_store = artifact_store
+        self.dropped_messages = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._shipper: Optional[threading.Thread] = None
+        self._shipper_lock = threading.Lock()
+        self._closed = False
+        self._last_timestamp: Tuple[int, str] = (-1, "")
 
         # Immutable filesystems state
         self.last_merge_time = time.time()
+        self._writer_id = uuid4().hex[:8]
+        self._chunks: List[Dict[str, Any]] = []
 
     def write(self, text: str) -> None:
         """Main write method.
@@ -249,23 +701,189 @@ class StepLogsStorage:
         Args:
             text: the incoming string.
         """
-        if text == "\n":
+        if text == "\n" or self._closed:
+            return
+
+        if threading.current_thread() is self._shipper:
+            # Messages logged while shipping logs would end up being shipped
+            # again, causing an infinite loop.
             return
 
-        if not self.disabled:
-            self.buffer.append(text)
-            self.save_to_file()
+        self._start_shipper()
+        item = (time.time(), text)
+        if self.drop_when_full:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self.dropped_messages += 1
+        else:
+            self._queue.put(item)
+
+    def _start_shipper(self) -> None:
+        """Starts the shipper thread if it is not running yet."""
+        if self._shipper:
+            return
+
+        with self._shipper_lock:
+            if not self._shipper and not self._closed:
+                self._shipper = threading.Thread(
+                    target=self._ship,
+                    name="StepLogsShipper",
+                    daemon=True,
+                )
+                self._shipper.start()
+
+    def _ship(self) -> None:
+        """Ships the queued messages to the artifact store.
+
+        Runs in the shipper thread until the storage gets closed.
+        """
+        messages: List[Tuple[float, str]] = []
+        stopped = False
+        while not stopped:
+            flush_events: List[threading.Event] = []
+            timeout = self.last_save_time + self.time_interval - time.time()
+            try:
+                items = [self._queue.get(timeout=max(timeout, 0.0))]
+            except queue.Empty:
+                items = []
+
+            # Collect everything that is already waiting in the queue
+            while items and len(messages) + len(items) < self.max_messages:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for item in items:
+                if item is _STOP_SHIPPING:
+                    stopped = True
+                elif isinstance(item, threading.Event):
+                    flush_events.append(item)
+                else:
+                    messages.append(item)
+
+            if (
+                len(messages) >= self.max_messages
+                or time.time() - self.last_save_time >= self.time_interval
+                or flush_events
+                or stopped
+            ):
+                if stopped and self.dropped_messages:
+                    messages.append(
+                        (
+                            time.time(),
+                            f"{self.dropped_messages} log messages were "
+                            "dropped because the logs queue was full.",
+                        )
+                    )
+                self._write_messages(messages)
+                messages = []
+                self.last_save_time = time.time()
 
-    @property
-    def _is_write_needed(self) -> bool:
-        """Checks whether the buffer needs to be written to disk.
+            for event in flush_events:
+                event.set()
+
+            # merge created files on a given interval (defaults to 10 minutes)
+            # only runs on Immutable Filesystems
+            if (
+                self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM
+                and time.time() - self.last_merge_time
+                > self.merge_files_interval
+            ):
+                try:
+                    self.merge_log_files()
+                except Exception as e:
+                    logger.error(f"Error while trying to roll up logs: {e}")
+                finally:
+                    self.last_merge_time = time.time()
+
+    def _format_message(self, timestamp: float, message: str) -> str:
+        """Formats a message as a log line.
+
+        Args:
+            timestamp: the time at which the message was written.
+            message: the message.
 
         Returns:
-            whether the buffer needs to be written to disk.
+            The log line.
+        """
+        second = int(timestamp)
+        if second != self._last_timestamp[0]:
+            formatted_timestamp = datetime.fromtimestamp(
+                second, tz=timezone.utc
+            ).strftime("%Y-%m-%d %H:%M:%S")
+            self._last_timestamp = (second, formatted_timestamp)
+
+        return f"[{self._last_timestamp[1]} UTC] {message}\n"
+
+    def _write_messages(self, messages: List[Tuple[float, str]]) -> None:
+        """Writes messages to the artifact store.
+
+        Args:
+            messages: the messages to write with the time they were written.
         """
-        return (
-            len(self.buffer) >= self.max_messages
-            or time.time() - self.last_save_time >= self.time_interval
+        if not messages:
+            return
+
+        content = remove_ansi_escape_codes(
+            "".join(
+                self._format_message(timestamp, message)
+                for timestamp, message in messages
+            )
+        )
+        try:
+            if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
+                self._write_chunk(
+                    content.encode(),
+                    start_time=messages[0][0],
+                    end_time=messages[-1][0],
+                )
+            else:
+                with self.artifact_store.open(self.logs_uri, "a") as file:
+                    file.write(content)
+                self.artifact_store._remove_previous_file_versions(
+                    self.logs_uri
+                )
+        except Exception as e:
+            # Besides I/O errors, such as reaching the maximum number of open
+            # files, permission issues or file corruption, we catch all
+            # exceptions here as they would otherwise stop the shipper thread.
+            logger.error(f"Error while trying to write logs: {e}")
+
+    def _write_chunk(
+        self, data: bytes, start_time: float, end_time: float
+    ) -> None:
+        """Writes a chunk of logs and adds it to the logs index.
+
+        Args:
+            data: The encoded logs.
+            start_time: The time at which the first message was written.
+            end_time: The time at which the last message was written.
+        """
+        filename = self._get_timestamped_filename()
+        with self.artifact_store.open(
+            os.path.join(self.logs_uri, filename), "wb"
+        ) as file:
+            file.write(data)
+
+        self._chunks.append(
+            {
+                "file": filename,
+                "size": len(data),
+                "start_time": start_time,
+                "end_time": end_time,
+            }
+        )
+        self._write_index()
+
+    def _write_index(self) -> None:
+        """Writes the index file listing the chunks of this storage."""
+        _write_logs_index(
+            self.logs_uri,
+            self.artifact_store,
+            self._chunks,
+            writer_id=self._writer_id,
         )
 
     def _get_timestamped_filename(self, suffix: str = "") -> str:
@@ -277,123 +895,127 @@ class StepLogsStorage:
         Returns:
             The timestamped filename.
         """
-        return f"{time.time()}{suffix}{LOGS_EXTENSION}"
+        return f"{time.time()}_{self._writer_id}{suffix}{LOGS_EXTENSION}"
 
     def save_to_file(self, force: bool = False) -> None:
         """Method to save the buffer to the given URI.
 
+        The shipper thread saves the buffer periodically on its own, so unless
+        `force` is set this method does not do anything.
+
         Args:
-            force: whether to force a save even if the write conditions not met.
+            force: whether to wait until all messages written so far are saved.
         """
-        if not self.disabled and (self._is_write_needed or force):
-            # IMPORTANT: keep this as the first code line in this method! The
-            # code that follows might still emit logging messages, which will
-            # end up triggering this method again, causing an infinite loop.
-            self.disabled = True
+        if (
+            not force
+            or self._closed
+            or not self._shipper
+            or threading.current_thread() is self._shipper
+        ):
+            return
 
-            try:
-                if self.buffer:
-                    if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
-                        _logs_uri = self._get_timestamped_filename()
-                        with self.artifact_store.open(
-                            os.path.join(
-                                self.logs_uri,
-                                _logs_uri,
-                            ),
-                            "w",
-                        ) as file:
-                            for message in self.buffer:
-                                timestamp = utc_now().strftime(
-                                    "%Y-%m-%d %H:%M:%S"
-                                )
-                                file.write(
-                                    f"[{timestamp} UTC] {remove_ansi_escape_codes(message)}\n"
-                                )
-                    else:
-                        with self.artifact_store.open(
-                            self.logs_uri, "a"
-                        ) as file:
-                            for message in self.buffer:
-                                timestamp = utc_now().strftime(
-                                    "%Y-%m-%d %H:%M:%S"
-                                )
-                                file.write(
-                                    f"[{timestamp} UTC] {remove_ansi_escape_codes(message)}\n"
-                                )
-                        self.artifact_store._remove_previous_file_versions(
-                            self.logs_uri
-                        )
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        if not flushed.wait(timeout=STEP_LOGS_STORAGE_FLUSH_TIMEOUT_SECONDS):
+            logger.debug("Timed out while waiting for step logs to be saved.")
 
-            except (OSError, IOError) as e:
-                # This exception can be raised if there are issues with the
-                # underlying system calls, such as reaching the maximum number
-                # of open files, permission issues, file corruption, or other
-                # I/O errors.
-                logger.error(f"Error while trying to write logs: {e}")
-            finally:
-                self.buffer = []
-                self.last_save_time = time.time()
+    def close(self) -> None:
+        """Saves all remaining messages and stops the shipper thread."""
+        with self._shipper_lock:
+            if self._closed:
+                return
+            self._closed = True
 
-                self.disabled = False
-        # merge created files on a given interval (defaults to 10 minutes)
-        # only runs on Immutable Filesystems
-        if (
-            self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM
-            and time.time() - self.last_merge_time > self.merge_files_interval
-        ):
-            try:
-                self.merge_log_files()
-            except (OSError, IOError) as e:
-                logger.error(f"Error while trying to roll up logs: {e}")
-            finally:
-                self.last_merge_time = time.time()
+        if self._shipper:
+            self._queue.put(_STOP_SHIPPING)
+            self._shipper.join()
 
     def merge_log_files(self, merge_all_files: bool = False) -> None:
-        """Merges all log files into one in the given URI.
+        """Merges the log files in the given URI.
 
-        Called on the logging context exit.
+        Only the chunks written by this storage are merged. Of those, only
+        the chunks at the end which were not merged yet get merged into a
+        single new chunk, so that previously merged logs do not need to be
+        downloaded and uploaded again. Chunks which other writers of the logs
+        folder wrote in between are never merged over, as this would change
+        the order of the logs.
 
         Args:
             merge_all_files: whether to merge all files or only raw files
         """
-        if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
-            merged_file_suffix = "_merged"
-            files_ = self.artifact_store.listdir(self.logs_uri)
-            if not merge_all_files:
-                # already merged files will not be merged again
-                files_ = [f for f in files_ if merged_file_suffix not in f]
-            file_name_ = self._get_timestamped_filename(
-                suffix=merged_file_suffix
+        if not self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
+            return
+
+        chunks = self._chunks
+        if not chunks:
+            return
+
+        # Positions of the chunks in the logs of all writers
+        positions = {
+            chunk["file"]: position
+            for position, chunk in enumerate(
+                _read_logs_index(self.logs_uri, self.artifact_store) or []
             )
-            if len(files_) > 1:
-                files_.sort()
-                logger.debug("Log files count: %s", len(files_))
-
-                missing_files = set()
-                # dump all logs to a local file first
-                with self.artifact_store.open(
-                    os.path.join(self.logs_uri, file_name_), "w"
-                ) as merged_file:
-                    for file in files_:
-                        try:
-                            merged_file.write(
-                                str(
-                                    _load_file_from_artifact_store(
-                                        os.path.join(self.logs_uri, str(file)),
-                                        artifact_store=self.artifact_store,
-                                        mode="r",
-                                    )
-                                )
-                            )
-                        except DoesNotExistException:
-                            missing_files.add(file)
-
-                # clean up left over files
-                for file in files_:
-                    if file not in missing_files:
-                        self.artifact_store.remove(
-                            os.path.join(self.logs_uri, str(file))
-                        )
+        }
+
+        first_chunk_id = len(chunks)
+        while first_chunk_id > 0 and (
+            merge_all_files
+            or MERGED_LOGS_FILE_SUFFIX
+            not in chunks[first_chunk_id - 1]["file"]
+        ):
+            if first_chunk_id < len(chunks):
+                position = positions.get(chunks[first_chunk_id - 1]["file"])
+                next_position = positions.get(chunks[first_chunk_id]["file"])
+                if (
+                    position is None
+                    or next_position is None
+                    or position + 1 != next_position
+                ):
+                    break
+            first_chunk_id -= 1
+
+        chunks_to_merge = chunks[first_chunk_id:]
+        if len(chunks_to_merge) < 2:
+            return
+        logger.debug("Log files count: %s", len(chunks_to_merge))
+
+        merged_file = self._get_timestamped_filename(
+            suffix=MERGED_LOGS_FILE_SUFFIX
+        )
+        merged_size = 0
+        missing_files = set()
+        with self.artifact_store.open(
+            os.path.join(self.logs_uri, merged_file), "wb"
+        ) as file:
+            for chunk in chunks_to_merge:
+                try:
+                    data = _load_file_from_artifact_store(
+                        os.path.join(self.logs_uri, chunk["file"]),
+                        artifact_store=self.artifact_store,
+                        mode="rb",
+                    )
+                except DoesNotExistException:
+                    missing_files.add(chunk["file"])
+                    continue
+                file.write(data)
+                merged_size += len(data)
+
+        merged_chunk = {
+            "file": merged_file,
+            "size": merged_size,
+            "start_time": chunks_to_merge[0]["start_time"],
+            "end_time": chunks_to_merge[-1]["end_time"],
+        }
+        chunks[first_chunk_id:] = [merged_chunk]
+        self._write_index()
+
+        # clean up left over files
+        for chunk in chunks_to_merge:
+            if chunk["file"] not in missing_files:
+                self.artifact_store.remove(
+                    os.path.join(self.logs_uri, chunk["file"])
+                )
 
 
 class StepLogsStorageContext:
@@ -416,23 +1038,20 @@ class StepLogsStorageContext:
         """Enter condition of the context manager.
 
         Wraps the `write` method of both stderr and stdout, so each incoming
-        message gets stored in the step logs storage.
+        message gets stored in the step logs storage. If multiple logs contexts
+        are active at the same time (e.g. for steps running in parallel
+        threads), the streams only get wrapped once and each message is stored
+        in the logs storage of the context active in the thread that wrote it.
 
         Returns:
             self
         """
-        self.stdout_write = getattr(sys.stdout, "write")
-        self.stdout_flush = getattr(sys.stdout, "flush")
-
-        self.stderr_write = getattr(sys.stderr, "write")
-        self.stderr_flush = getattr(sys.stderr, "flush")
-
-        setattr(sys.stdout, "write", self._wrap_write(self.stdout_write))
-        setattr(sys.stdout, "flush", self._wrap_flush(self.stdout_flush))
-
-        setattr(sys.stderr, "write", self._wrap_write(self.stdout_write))
-        setattr(sys.stderr, "flush", self._wrap_flush(self.stdout_flush))
+        with _active_logs_contexts_lock:
+            if not _active_logs_contexts:
+                _wrap_std_streams()
+            _active_logs_contexts.append((threading.current_thread(), self))
 
+        _active_logs_context.set(self)
         redirected.set(True)
         return self
 
@@ -449,54 +1068,115 @@ class StepLogsStorageContext:
             exc_val: The instance of the exception
             exc_tb: The traceback of the exception
 
-        Restores the `write` method of both stderr and stdout.
+        Restores the `write` method of both stderr and stdout once no other
+        logs context is active anymore.
         """
-        self.storage.save_to_file(force=True)
-
-        setattr(sys.stdout, "write", self.stdout_write)
-        setattr(sys.stdout, "flush", self.stdout_flush)
-
-        setattr(sys.stderr, "write", self.stderr_write)
-        setattr(sys.stderr, "flush", self.stderr_flush)
-
+        with _active_logs_contexts_lock:
+            _active_logs_contexts[:] = [
+                (thread, context)
+                for thread, context in _active_logs_contexts
+                if context is not self
+            ]
+            if not _active_logs_contexts:
+                _restore_std_streams()
+
+        _active_logs_context.set(None)
         redirected.set(False)
 
+        self.storage.close()
+
         try:
-            self.storage.merge_log_files(merge_all_files=True)
+            self.storage.merge_log_files()
         except (OSError, IOError) as e:
             logger.warning(f"Step logs roll-up failed: {e}")
 
-    def _wrap_write(self, method: Callable[..., Any]) -> Callable[..., Any]:
-        """Wrapper function that utilizes the storage object to store logs.
 
-        Args:
-            method: the original write method
+def _get_active_logs_context() -> Optional[StepLogsStorageContext]:
+    """Gets the logs context that should receive messages of this thread.
 
-        Returns:
-            the wrapped write method.
-        """
+    Threads that did not enter a logs context themselves (e.g. threads spawned
+    by the code of a step) write to the most recently entered logs context if
+    all active logs contexts were entered by the same thread. If logs contexts
+    of multiple threads are active (e.g. for steps running in parallel), it is
+    ambiguous which one the messages of such a thread belong to and they are
+    not stored.
+
+    Returns:
+        The active logs context or None if no logs context is active or the
+        active logs context is ambiguous.
+    """
+    if context := _active_logs_context.get():
+        return context
 
-        def wrapped_write(*args: Any, **kwargs: Any) -> Any:
-            output = method(*args, **kwargs)
-            if args:
-                self.storage.write(args[0])
-            return output
+    with _active_logs_contexts_lock:
+        if len({thread for thread, _ in _active_logs_contexts}) == 1:
+            return _active_logs_contexts[-1][1]
+        return None
 
-        return wrapped_write
 
-    def _wrap_flush(self, method: Callable[..., Any]) -> Callable[..., Any]:
-        """Wrapper function that flushes the buffer of the storage object.
+def _wrap_std_streams() -> None:
+    """Wraps the `write` and `flush` methods of stdout and stderr."""
+    stdout_write = getattr(sys.stdout, "write")
+    stdout_flush = getattr(sys.stdout, "flush")
 
-        Args:
-            method: the original flush method
+    _original_std_stream_methods.update(
+        stdout_write=stdout_write,
+        stdout_flush=stdout_flush,
+        stderr_write=getattr(sys.stderr, "write"),
+        stderr_flush=getattr(sys.stderr, "flush"),
+    )
 
-        Returns:
-            the wrapped flush method.
-        """
+    setattr(sys.stdout, "write", _wrap_write(stdout_write))
+    setattr(sys.stdout, "flush", _wrap_flush(stdout_flush))
+
+    setattr(sys.stderr, "write", _wrap_write(stdout_write))
+    setattr(sys.stderr, "flush", _wrap_flush(stdout_flush))
+
+
+def _restore_std_streams() -> None:
+    """Restores the `write` and `flush` methods of stdout and stderr."""
+    setattr(sys.stdout, "write", _original_std_stream_methods["stdout_write"])
+    setattr(sys.stdout, "flush", _original_std_stream_methods["stdout_flush"])
+
+    setattr(sys.stderr, "write", _original_std_stream_methods["stderr_write"])
+    setattr(sys.stderr, "flush", _original_std_stream_methods["stderr_flush"])
+
+    _original_std_stream_methods.clear()
+
+
+def _wrap_write(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrapper function that stores logs in the active logs storage.
+
+    Args:
+        method: the original write method
+
+    Returns:
+        the wrapped write method.
+    """
+
+    def wrapped_write(*args: Any, **kwargs: Any) -> Any:
+        output = method(*args, **kwargs)
+        if args and (context := _get_active_logs_context()):
+            context.storage.write(args[0])
+        return output
+
+    return wrapped_write
+
+
+def _wrap_flush(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrapper function that flushes the buffer of the active logs storage.
+
+    Args:
+        method: the original flush method
+
+    Returns:
+        the wrapped flush method.
+    """
 
-        def wrapped_flush(*args: Any, **kwargs: Any) -> Any:
-            output = method(*args, **kwargs)
-            self.storage.save_to_file()
-            return output
+    def wrapped_flush(*args: Any, **kwargs: Any) -> Any:
+        output = method(*args, **kwargs)
+        if context := _get_active_logs_context():
+            context.storage.save_to_file()
+        return output
 
-        return wrapped_flush
+    return wrapped_flush
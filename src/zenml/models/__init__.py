@@ -285,6 +285,7 @@ from zenml.models.v2.core.stack import (
 from zenml.models.v2.core.step_run import (
     StepRunRequest,
     StepRunUpdate,
+    StepRunFinalizeRequest,
     StepRunFilter,
     StepRunResponse,
     StepRunResponseBody,
@@ -684,6 +685,7 @@ __all__ = [
     "StackResponseMetadata",
     "StepRunRequest",
     "StepRunUpdate",
+    "StepRunFinalizeRequest",
     "StepRunFilter",
     "StepRunResponse",
     "StepRunResponseBody",
@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 """Base filter model definitions."""
 
+import base64
+import binascii
 import json
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -37,7 +39,7 @@ from pydantic import (
     field_validator,
     model_validator,
 )
-from sqlalchemy import Float, and_, asc, cast, desc
+from sqlalchemy import Float, and_, asc, cast, desc, or_
 from sqlmodel import SQLModel
 
 from zenml.constants import (
@@ -411,6 +413,54 @@ class DatetimeFilter(Filter):
         return column == self.value
 
 
+def encode_pagination_cursor(sort_value: Any, id: UUID) -> str:
+    """Encodes the position of an item in a sorted list as opaque cursor.
+
+    Args:
+        sort_value: The value of the sort column of the item.
+        id: The ID of the item.
+
+    Returns:
+        The cursor.
+    """
+    if isinstance(sort_value, datetime):
+        encoded_value: Any = {"datetime": sort_value.isoformat()}
+    elif isinstance(sort_value, UUID):
+        encoded_value = {"uuid": str(sort_value)}
+    else:
+        encoded_value = sort_value
+
+    cursor = json.dumps([encoded_value, str(id)])
+    return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+
+def decode_pagination_cursor(cursor: str) -> Tuple[Any, UUID]:
+    """Decodes a pagination cursor.
+
+    Args:
+        cursor: The cursor to decode.
+
+    Raises:
+        ValueError: If the cursor is invalid.
+
+    Returns:
+        The value of the sort column and the ID of the item.
+    """
+    try:
+        encoded_value, id = json.loads(base64.urlsafe_b64decode(cursor))
+        if isinstance(encoded_value, dict):
+            if "datetime" in encoded_value:
+                sort_value = datetime.fromisoformat(encoded_value["datetime"])
+            else:
+                sort_value = UUID(encoded_value["uuid"])
+        else:
+            sort_value = encoded_value
+
+        return sort_value, UUID(id)
+    except (binascii.Error, KeyError, TypeError, ValueError):
+        raise ValueError(f"Invalid pagination cursor `{cursor}`.")
+
+
 class BaseFilter(BaseModel):
     """Class to unify all filter, paginate and sort request parameters.
 
@@ -428,6 +478,10 @@ class BaseFilter(BaseModel):
         size=20
     )
     ```
+
+    Instead of a page number, the `after` cursor returned as `next_cursor`
+    of the previous page can be used to fetch the following page without
+    having to skip all items of the previous pages in the database.
     """
 
     # List of fields that cannot be used as filters.
@@ -436,6 +490,8 @@ class BaseFilter(BaseModel):
         "page",
         "size",
         "logical_operator",
+        "after",
+        "skip_count",
     ]
     CUSTOM_SORTING_OPTIONS: ClassVar[List[str]] = []
 
@@ -462,6 +518,18 @@ class BaseFilter(BaseModel):
         le=PAGE_SIZE_MAXIMUM,
         description="Page size",
     )
+    after: Optional[str] = Field(
+        default=None,
+        description="Cursor of the last item of the previous page. If given, "
+        "the items following this item are returned instead of skipping "
+        "the items of all previous pages.",
+    )
+    skip_count: bool = Field(
+        default=False,
+        description="Whether to skip counting the total number of items. If "
+        "set, the total number of items and pages only include the items up "
+        "to the next page.",
+    )
     id: Optional[Union[UUID, str]] = Field(
         default=None,
         description="Id for this resource",
@@ -882,6 +950,66 @@ class BaseFilter(BaseModel):
 
         return query
 
+    @property
+    def supports_cursor(self) -> bool:
+        """Whether the sorting of this filter supports cursor pagination.
+
+        Returns:
+            Whether cursor pagination is supported.
+        """
+        column, _ = self.sorting_params
+        return column not in self.CUSTOM_SORTING_OPTIONS
+
+    def apply_cursor(
+        self,
+        query: AnyQuery,
+        table: Type["AnySchema"],
+    ) -> AnyQuery:
+        """Only select the items following the `after` cursor.
+
+        This expects the query to be sorted by `apply_sorting(...)`, which
+        sorts by the sort column and the ID as tiebreaker.
+
+        Args:
+            query: The query to which to apply the cursor.
+            table: The query table.
+
+        Raises:
+            ValueError: If the sorting does not support cursor pagination.
+
+        Returns:
+            The query with the cursor applied.
+        """
+        if not self.after:
+            return query
+
+        if not self.supports_cursor:
+            raise ValueError(
+                f"Cursor pagination is not supported when sorting by "
+                f"`{self.sort_by}`."
+            )
+
+        sort_value, id = decode_pagination_cursor(self.after)
+        column_name, operand = self.sorting_params
+        column = getattr(table, column_name)
+        after_id = and_(column == sort_value, table.id > id)  # type: ignore[arg-type]
+
+        # NULL values are sorted before all other values in ascending order
+        if sort_value is None:
+            if operand == SorterOps.DESCENDING:
+                condition = and_(column.is_(None), table.id > id)  # type: ignore[arg-type]
+            else:
+                condition = or_(
+                    column.is_not(None),
+                    and_(column.is_(None), table.id > id),  # type: ignore[arg-type]
+                )
+        elif operand == SorterOps.DESCENDING:
+            condition = or_(column < sort_value, after_id, column.is_(None))
+        else:
+            condition = or_(column > sort_value, after_id)
+
+        return query.where(condition)
+
 
 class FilterGenerator:
     """Helper class to define filters for a class."""
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Page model definitions."""
 
-from typing import Generator, Generic, List, TypeVar
+from typing import Generator, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel
 from pydantic.types import NonNegativeInt, PositiveInt
@@ -32,6 +32,7 @@ class Page(BaseModel, Generic[B]):
     total_pages: NonNegativeInt
     total: NonNegativeInt
     items: List[B]
+    next_cursor: Optional[str] = None
 
     __params_type__ = BaseFilter
 
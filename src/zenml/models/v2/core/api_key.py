@@ -17,7 +17,6 @@ from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, ClassVar, List, Optional, Type, Union
 from uuid import UUID
 
-from passlib.context import CryptContext
 from pydantic import BaseModel, Field
 
 from zenml.constants import (
@@ -36,6 +35,7 @@ from zenml.models.v2.base.base import (
 from zenml.models.v2.base.filter import AnyQuery, BaseFilter
 from zenml.utils.string_utils import b64_decode, b64_encode
 from zenml.utils.time_utils import utc_now
+from zenml.utils.verification_cache import verified_credentials
 
 if TYPE_CHECKING:
     from zenml.models.v2.base.filter import AnySchema
@@ -302,33 +302,33 @@ class APIKeyInternalResponse(APIKeyResponse):
         Returns:
             True if the keys match.
         """
-        # even when the hashed key is not set, we still want to execute
-        # the hash verification to protect against response discrepancy
-        # attacks (https://cwe.mitre.org/data/definitions/204.html)
-        key_hash: Optional[str] = None
-        context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        if self.key is not None and self.active:
-            key_hash = self.key
-        result = context.verify(key, key_hash)
-
-        # same for the previous key, if set and if it's still valid
-        key_hash = None
+        # Successful verifications are cached for a short time. The cache is
+        # keyed by the hash of the key, so rotating the key or deactivating
+        # the API key invalidates it.
+        if (
+            self.key is not None
+            and self.active
+            and verified_credentials.verify(key, self.key)
+        ):
+            return True
+
+        # check the previous key, if set and if it's still valid
         if (
             self.previous_key is not None
             and self.last_rotated is not None
             and self.active
             and self.retain_period_minutes > 0
+            and utc_now(tz_aware=self.last_rotated) - self.last_rotated
+            < timedelta(minutes=self.retain_period_minutes)
         ):
-            # check if the previous key is still valid
-            if utc_now(
-                tz_aware=self.last_rotated
-            ) - self.last_rotated < timedelta(
-                minutes=self.retain_period_minutes
-            ):
-                key_hash = self.previous_key
-        previous_result = context.verify(key, key_hash)
-
-        return result or previous_result
+            return verified_credentials.verify(key, self.previous_key)
+
+        if self.key is None or not self.active:
+            # even when the hashed key is not set, we still want to execute
+            # the hash verification to protect against response discrepancy
+            # attacks (https://cwe.mitre.org/data/definitions/204.html)
+            verified_credentials.verify(key, None)
+        return False
 
 
 # ------------------ Filter Model ------------------
@@ -41,8 +41,12 @@ from zenml.models.v2.base.scoped import (
     WorkspaceScopedResponseMetadata,
     WorkspaceScopedResponseResources,
 )
-from zenml.models.v2.core.artifact_version import ArtifactVersionResponse
+from zenml.models.v2.core.artifact_version import (
+    ArtifactVersionRequest,
+    ArtifactVersionResponse,
+)
 from zenml.models.v2.core.model_version import ModelVersionResponse
+from zenml.models.v2.core.run_metadata import RunMetadataRequest
 
 if TYPE_CHECKING:
     from sqlalchemy.sql.elements import ColumnElement
@@ -179,6 +183,31 @@ class StepRunUpdate(BaseModel):
     model_config = ConfigDict(protected_namespaces=())
 
 
+class StepRunFinalizeRequest(BaseModel):
+    """Request model to publish the results of a step run in a single call."""
+
+    status: ExecutionStatus = Field(
+        title="The final status of the step run.",
+        default=ExecutionStatus.COMPLETED,
+    )
+    end_time: datetime = Field(title="The end time of the step run.")
+    output_artifacts: Dict[str, ArtifactVersionRequest] = Field(
+        title="The output artifact versions of the step run to create, by "
+        "output name.",
+        default={},
+    )
+    run_metadata: List[RunMetadataRequest] = Field(
+        title="The run metadata of the step run to create.",
+        default=[],
+    )
+    model_version_id: Optional[UUID] = Field(
+        title="The ID of the model version to which to link the output "
+        "artifact versions.",
+        default=None,
+    )
+    model_config = ConfigDict(protected_namespaces=())
+
+
 # ------------------ Response Model ------------------
 class StepRunResponseBody(WorkspaceScopedResponseBody):
     """Response body for step runs."""
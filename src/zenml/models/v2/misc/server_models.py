@@ -97,6 +97,11 @@ class ServerModel(BaseModel):
         title="Enable server-side analytics.",
     )
 
+    supports_request_compression: bool = Field(
+        False,
+        title="Whether the server accepts gzip compressed request bodies.",
+    )
+
     metadata: Dict[str, str] = Field(
         {},
         title="The metadata associated with the server.",
@@ -185,3 +190,9 @@ class ServerLoadInfo(BaseModel):
         title="Number of overflow database connections that the server is "
         "currently actively using to make queries or transactions."
     )
+
+    memcache: Dict[str, Dict[str, int]] = Field(
+        default={},
+        title="Size and hit, miss, eviction and expiration counters of each "
+        "namespace of the server memory cache.",
+    )
@@ -23,6 +23,10 @@ from pydantic import Field, SecretStr
 from zenml.constants import STR_FIELD_MAX_LENGTH
 from zenml.models.v2.base.base import BaseZenModel
 from zenml.utils.secret_utils import PlainSerializedSecretStr
+from zenml.utils.verification_cache import (
+    get_bcrypt_context,
+    verified_credentials,
+)
 
 if TYPE_CHECKING:
     from passlib.context import CryptContext
@@ -80,9 +84,7 @@ class UserAuthModel(BaseZenModel):
         Returns:
             The password encryption context.
         """
-        from passlib.context import CryptContext
-
-        return CryptContext(schemes=["bcrypt"], deprecated="auto")
+        return get_bcrypt_context()
 
     @classmethod
     def _is_hashed_secret(cls, secret: SecretStr) -> bool:
@@ -170,8 +172,9 @@ class UserAuthModel(BaseZenModel):
             and user.password is not None
         ):  # and user.active:
             password_hash = user.get_hashed_password()
-        pwd_context = cls._get_crypt_context()
-        return pwd_context.verify(plain_password, password_hash)
+        # Successful verifications are cached for a short time, keyed by the
+        # password hash so that changing the password invalidates them
+        return verified_credentials.verify(plain_password, password_hash)
 
     @classmethod
     def verify_activation_token(
@@ -14,7 +14,7 @@
 """Utilities for caching."""
 
 import hashlib
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from zenml.client import Client
 from zenml.enums import ExecutionStatus, SorterOps
@@ -35,6 +35,7 @@ def generate_cache_key(
     input_artifact_ids: Dict[str, "UUID"],
     artifact_store: "BaseArtifactStore",
     workspace_id: "UUID",
+    input_artifact_content_hashes: Optional[Dict[str, str]] = None,
 ) -> str:
     """Generates a cache key for a step run.
 
@@ -46,7 +47,8 @@ def generate_cache_key(
     - the artifact store ID and path,
     - the source code that defines the step,
     - the parameters of the step,
-    - the names and IDs of the input artifacts of the step,
+    - the names and IDs (or content hashes if available) of the input
+      artifacts of the step,
     - the names and source codes of the output artifacts of the step,
     - the source codes of the output materializers of the step.
     - additional custom caching parameters of the step.
@@ -56,6 +58,11 @@ def generate_cache_key(
         input_artifact_ids: The input artifact IDs for the step.
         artifact_store: The artifact store of the active stack.
         workspace_id: The ID of the active workspace.
+        input_artifact_content_hashes: Optional content hashes of the input
+            artifacts. If a content hash exists for an input, it will be used
+            instead of the artifact version ID, which means step runs with
+            inputs of identical content but from different runs share the
+            same cache key.
 
     Returns:
         A cache key.
@@ -84,9 +91,13 @@ def generate_cache_key(
         hash_.update(str(value).encode())
 
     # Input artifacts
+    input_artifact_content_hashes = input_artifact_content_hashes or {}
     for name, artifact_version_id in input_artifact_ids.items():
         hash_.update(name.encode())
-        hash_.update(artifact_version_id.bytes)
+        if content_hash := input_artifact_content_hashes.get(name):
+            hash_.update(content_hash.encode())
+        else:
+            hash_.update(artifact_version_id.bytes)
 
     # Output artifacts and materializers
     for name, output in step.config.outputs.items():
@@ -127,3 +138,27 @@ def get_cached_step_run(cache_key: str) -> Optional["StepRunResponse"]:
     if cache_candidates:
         return cache_candidates[0]
     return None
+
+
+def get_cached_step_runs(
+    cache_keys: List[str],
+) -> Dict[str, "StepRunResponse"]:
+    """Get the existing step runs for multiple cache keys at once.
+
+    This is equivalent to calling `get_cached_step_run(...)` for each of the
+    cache keys, but only requires a single request to the ZenML store.
+
+    Args:
+        cache_keys: The cache keys of the steps.
+
+    Returns:
+        The existing step runs, keyed by their cache key. Cache keys for which
+        no step run can be used as cache are not included.
+    """
+    if not cache_keys:
+        return {}
+
+    client = Client()
+    return client.zen_store.get_cached_step_runs(
+        cache_keys=cache_keys, workspace_id=client.active_workspace.id
+    )
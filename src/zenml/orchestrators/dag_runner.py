@@ -13,13 +13,18 @@
 #  permissions and limitations under the License.
 """DAG (Directed Acyclic Graph) Runners."""
 
+import asyncio
+import heapq
+import inspect
 import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from zenml.logger import get_logger
+from zenml.orchestrators import topsort
 
 logger = get_logger(__name__)
 
@@ -54,6 +59,8 @@ class NodeStatus(Enum):
     WAITING = "Waiting"
     RUNNING = "Running"
     COMPLETED = "Completed"
+    FAILED = "Failed"
+    SKIPPED = "Skipped"
 
 
 class ThreadedDagRunner:
@@ -63,7 +70,15 @@ class ThreadedDagRunner:
     well as a custom `run_fn` as input, then calls `run_fn(node)` for each
     string node in the DAG.
 
-    Steps that can be executed in parallel will be started in separate threads.
+    Steps that can be executed in parallel will be run by a pool of worker
+    threads, or as asyncio tasks when using `run_async()`. If more nodes are
+    ready to run than there are free workers, the nodes with the longest chain
+    of downstream nodes (the critical path) are started first. If a node
+    fails, none of its downstream nodes will be run.
+
+    Each node keeps a counter of its upstream nodes that have not completed
+    yet. Once that counter reaches zero, the node is added to a queue of ready
+    nodes, so scheduling the whole DAG takes O(V+E) time.
     """
 
     def __init__(
@@ -71,6 +86,9 @@ class ThreadedDagRunner:
         dag: Dict[str, List[str]],
         run_fn: Callable[[str], Any],
         parallel_node_startup_waiting_period: float = 0.0,
+        max_parallelism: Optional[int] = None,
+        node_priorities: Optional[Dict[str, int]] = None,
+        fail_fast: bool = False,
     ) -> None:
         """Define attributes and initialize all nodes in waiting state.
 
@@ -78,127 +96,310 @@ class ThreadedDagRunner:
             dag: Adjacency list representation of a DAG.
                 E.g.: [(1->2), (1->3), (2->4), (3->4)] should be represented as
                 `dag={2: [1], 3: [1], 4: [2, 3]}`
-            run_fn: A function `run_fn(node)` that runs a single node
+            run_fn: A function `run_fn(node)` that runs a single node. When
+                using `run_async()`, this may also be a coroutine function.
             parallel_node_startup_waiting_period: Delay in seconds to wait in
                 between starting parallel nodes.
+            max_parallelism: Maximum number of nodes to run at the same time.
+                If not set, all nodes that can run will be started at once.
+            node_priorities: Optional priorities of the nodes. If multiple
+                nodes are ready to run, the ones with a higher priority will
+                be started first. If not given, nodes are prioritized by the
+                length of their critical path.
+            fail_fast: If `True`, no new nodes will be started once any node
+                failed. Otherwise, only the downstream nodes of the failed node
+                will be skipped.
+
+        Raises:
+            ValueError: If `max_parallelism` is not a positive integer.
         """
+        if max_parallelism is not None and max_parallelism < 1:
+            raise ValueError(
+                f"Invalid value `{max_parallelism}` for `max_parallelism`, "
+                "the value needs to be a positive integer."
+            )
+
         self.parallel_node_startup_waiting_period = (
             parallel_node_startup_waiting_period
         )
+        self.max_parallelism = max_parallelism
+        self.fail_fast = fail_fast
         self.dag = dag
         self.reversed_dag = reverse_dag(dag)
         self.run_fn = run_fn
         self.nodes = dag.keys()
         self.node_states = {node: NodeStatus.WAITING for node in self.nodes}
-        self._lock = threading.Lock()
+        self.node_priorities = (
+            node_priorities
+            if node_priorities is not None
+            else self._get_critical_path_lengths()
+        )
+
+        self._condition = threading.Condition()
+        # Number of upstream nodes of each node that have not completed yet.
+        self._num_pending_upstream_nodes = {
+            node: len(upstream_nodes) for node, upstream_nodes in dag.items()
+        }
+        # Heap of nodes that are ready to run, ordered by descending priority
+        # and the order in which they became ready.
+        self._ready_nodes: List[Tuple[int, int, str]] = []
+        self._ready_node_counter = 0
+        self._num_running_nodes = 0
 
-    def _can_run(self, node: str) -> bool:
-        """Determine whether a node is ready to be run.
+    def _get_critical_path_lengths(self) -> Dict[str, int]:
+        """Computes the length of the longest downstream path of each node.
 
-        This is the case if the node has not run yet and all of its upstream
-        node have already completed.
+        Returns:
+            The number of nodes on the longest path starting at each node.
+            If the graph contains a cycle, all nodes have the same length.
+        """
+        try:
+            layers = topsort.topsorted_layers(
+                nodes=list(self.nodes),
+                get_node_id_fn=str,
+                get_parent_nodes=lambda node: self.dag[node],
+                get_child_nodes=lambda node: self.reversed_dag[node],
+            )
+        except RuntimeError:
+            return {node: 0 for node in self.nodes}
+
+        critical_path_lengths: Dict[str, int] = {}
+        for layer in reversed(layers):
+            for node in layer:
+                critical_path_lengths[node] = 1 + max(
+                    (
+                        critical_path_lengths.get(downstream_node, 0)
+                        for downstream_node in self.reversed_dag[node]
+                    ),
+                    default=0,
+                )
+        return critical_path_lengths
+
+    def _mark_ready(self, node: str) -> None:
+        """Adds a node to the queue of nodes that are ready to run.
+
+        Must be called while holding `self._condition`.
 
         Args:
             node: The node.
-
-        Returns:
-            True if the node can run else False.
         """
-        # Check that node has not run yet.
-        if not self.node_states[node] == NodeStatus.WAITING:
-            return False
+        priority = self.node_priorities.get(node, 0)
+        heapq.heappush(
+            self._ready_nodes, (-priority, self._ready_node_counter, node)
+        )
+        self._ready_node_counter += 1
 
-        # Check that all upstream nodes of this node have already completed.
-        for upstream_node in self.dag[node]:
-            if not self.node_states[upstream_node] == NodeStatus.COMPLETED:
-                return False
+    def _has_free_worker(self) -> bool:
+        """Whether another node can be started right now.
 
-        return True
+        Must be called while holding `self._condition`.
+
+        Returns:
+            Whether another node can be started.
+        """
+        return (
+            self.max_parallelism is None
+            or self._num_running_nodes < self.max_parallelism
+        )
 
     def _run_node(self, node: str) -> None:
         """Run a single node.
 
-        Calls the user-defined run_fn, then calls `self._finish_node`.
+        Calls the user-defined run_fn, then calls `self._finish_node` or
+        `self._fail_node` depending on the outcome.
 
         Args:
             node: The node.
         """
-        self.run_fn(node)
-        self._finish_node(node)
+        try:
+            self.run_fn(node)
+        except BaseException as e:
+            logger.exception(f"Failed to run node `{node}`: {e}")
+            self._fail_node(node)
+        else:
+            self._finish_node(node)
 
-    def _run_node_in_thread(self, node: str) -> threading.Thread:
-        """Run a single node in a separate thread.
+    def _finish_node(self, node: str) -> None:
+        """Finish a node run.
 
-        First updates the node status to running.
-        Then calls self._run_node() in a new thread and returns the thread.
+        First updates the node status to completed.
+        Then queues all downstream nodes that can now be run.
 
         Args:
             node: The node.
-
-        Returns:
-            The thread in which the node was run.
         """
-        # Update node status to running.
-        assert self.node_states[node] == NodeStatus.WAITING
-        with self._lock:
-            self.node_states[node] = NodeStatus.RUNNING
+        with self._condition:
+            assert self.node_states[node] == NodeStatus.RUNNING
+            self.node_states[node] = NodeStatus.COMPLETED
+            self._num_running_nodes -= 1
 
-        # Run node in new thread.
-        thread = threading.Thread(target=self._run_node, args=(node,))
-        thread.start()
-        return thread
+            for downstream_node in self.reversed_dag[node]:
+                self._num_pending_upstream_nodes[downstream_node] -= 1
+                if (
+                    self._num_pending_upstream_nodes[downstream_node] == 0
+                    and self.node_states[downstream_node] == NodeStatus.WAITING
+                ):
+                    self._mark_ready(downstream_node)
 
-    def _finish_node(self, node: str) -> None:
-        """Finish a node run.
+            self._condition.notify_all()
 
-        First updates the node status to completed.
-        Then starts all other nodes that can now be run and waits for them.
+    def _fail_node(self, node: str) -> None:
+        """Fail a node run.
+
+        First updates the node status to failed. Then skips all nodes that
+        depend on the failed node or, if `fail_fast` is enabled, all nodes
+        that have not been started yet.
 
         Args:
             node: The node.
         """
-        # Update node status to completed.
-        assert self.node_states[node] == NodeStatus.RUNNING
-        with self._lock:
-            self.node_states[node] = NodeStatus.COMPLETED
+        with self._condition:
+            assert self.node_states[node] == NodeStatus.RUNNING
+            self.node_states[node] = NodeStatus.FAILED
+            self._num_running_nodes -= 1
+
+            if self.fail_fast:
+                nodes_to_skip = [
+                    node_
+                    for node_, state in self.node_states.items()
+                    if state == NodeStatus.WAITING
+                ]
+                self._ready_nodes = []
+            else:
+                nodes_to_skip = list(self.reversed_dag[node])
+
+            while nodes_to_skip:
+                node_to_skip = nodes_to_skip.pop()
+                if self.node_states[node_to_skip] == NodeStatus.WAITING:
+                    self.node_states[node_to_skip] = NodeStatus.SKIPPED
+                    nodes_to_skip.extend(self.reversed_dag[node_to_skip])
+
+            self._condition.notify_all()
+
+    def _pop_ready_node(self) -> Optional[str]:
+        """Marks the next ready node as running if a worker is available.
+
+        Must be called while holding `self._condition`.
 
-        # Run downstream nodes.
-        threads: List[threading.Thread] = []
-        for downstram_node in self.reversed_dag[node]:
-            if self._can_run(downstram_node):
-                if threads and self.parallel_node_startup_waiting_period > 0:
-                    time.sleep(self.parallel_node_startup_waiting_period)
+        Returns:
+            The next node to run or None if no node can be started right now.
+        """
+        if not self._ready_nodes or not self._has_free_worker():
+            return None
 
-                thread = self._run_node_in_thread(downstram_node)
-                threads.append(thread)
+        _, _, node = heapq.heappop(self._ready_nodes)
+        self.node_states[node] = NodeStatus.RUNNING
+        self._num_running_nodes += 1
+        return node
 
-        # Wait for all downstream nodes to complete.
-        for thread in threads:
-            thread.join()
+    def _get_next_node(self) -> Optional[str]:
+        """Waits until the next node can be started and marks it as running.
+
+        Returns:
+            The next node to run or None if no more nodes will be run.
+        """
+        with self._condition:
+            while True:
+                if (node := self._pop_ready_node()) is not None:
+                    return node
+
+                if not self._ready_nodes and self._num_running_nodes == 0:
+                    return None
+
+                self._condition.wait()
 
     def run(self) -> None:
         """Call `self.run_fn` on all nodes in `self.dag`.
 
         The order of execution is determined using topological sort.
-        Each node is run in a separate thread to enable parallelism.
+        Nodes are run by a pool of worker threads to enable parallelism.
         """
-        # Run all nodes that can be started immediately.
-        # These will, in turn, start other nodes once all of their respective
-        # upstream nodes have completed.
-        threads: List[threading.Thread] = []
-        for node in self.nodes:
-            if self._can_run(node):
-                if threads and self.parallel_node_startup_waiting_period > 0:
+        self._mark_initial_nodes_ready()
+
+        max_workers = self.max_parallelism or max(len(self.nodes), 1)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="zenml-dag-runner"
+        ) as executor:
+            while (next_node := self._get_next_node()) is not None:
+                if (
+                    self.parallel_node_startup_waiting_period > 0
+                    and self._num_running_nodes > 1
+                ):
                     time.sleep(self.parallel_node_startup_waiting_period)
 
-                thread = self._run_node_in_thread(node)
-                threads.append(thread)
+                executor.submit(self._run_node, next_node)
+
+        self._log_unfinished_nodes()
 
-        # Wait till all nodes have completed.
-        for thread in threads:
-            thread.join()
+    async def run_async(self) -> None:
+        """Call `self.run_fn` on all nodes in `self.dag` using asyncio.
 
-        # Make sure all nodes were run, otherwise print a warning.
+        Each node is run as an asyncio task, so nodes which are waiting for
+        e.g. a remote job to finish don't each block an OS thread. If
+        `self.run_fn` is not a coroutine function, it will be called in the
+        default executor of the event loop.
+        """
+        self._mark_initial_nodes_ready()
+
+        running_tasks: Set["asyncio.Task[None]"] = set()
+        while True:
+            with self._condition:
+                next_node = self._pop_ready_node()
+
+            if next_node is not None:
+                if (
+                    self.parallel_node_startup_waiting_period > 0
+                    and running_tasks
+                ):
+                    await asyncio.sleep(
+                        self.parallel_node_startup_waiting_period
+                    )
+
+                running_tasks.add(
+                    asyncio.create_task(self._run_node_async(next_node))
+                )
+                continue
+
+            if not running_tasks:
+                break
+
+            _, running_tasks = await asyncio.wait(
+                running_tasks, return_when=asyncio.FIRST_COMPLETED
+            )
+
+        self._log_unfinished_nodes()
+
+    async def _run_node_async(self, node: str) -> None:
+        """Run a single node as part of an asyncio event loop.
+
+        Args:
+            node: The node.
+        """
+        try:
+            if inspect.iscoroutinefunction(self.run_fn):
+                await self.run_fn(node)
+            else:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.run_fn, node
+                )
+        except BaseException as e:
+            logger.exception(f"Failed to run node `{node}`: {e}")
+            self._fail_node(node)
+            if isinstance(e, asyncio.CancelledError):
+                # Still mark the task as cancelled after failing the node
+                raise
+        else:
+            self._finish_node(node)
+
+    def _mark_initial_nodes_ready(self) -> None:
+        """Queues all nodes that don't have any upstream nodes."""
+        with self._condition:
+            for node in self.nodes:
+                if self._num_pending_upstream_nodes[node] == 0:
+                    self._mark_ready(node)
+
+    def _log_unfinished_nodes(self) -> None:
+        """Logs warnings for all nodes that were not run."""
         for node in self.nodes:
             if self.node_states[node] == NodeStatus.WAITING:
                 upstream_nodes = self.dag[node]
@@ -206,3 +407,7 @@ class ThreadedDagRunner:
                     f"Node `{node}` was never run, because it was still"
                     f" waiting for the following nodes: `{upstream_nodes}`."
                 )
+            elif self.node_states[node] == NodeStatus.SKIPPED:
+                logger.warning(
+                    f"Node `{node}` was skipped because another node failed."
+                )
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Utilities for inputs."""
 
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from zenml.client import Client
@@ -23,19 +23,24 @@ from zenml.exceptions import InputResolutionError
 from zenml.utils import pagination_utils, string_utils
 
 if TYPE_CHECKING:
-    from zenml.models import PipelineRunResponse
+    from zenml.models import PipelineRunResponse, StepRunResponse
     from zenml.models.v2.core.step_run import StepRunInputResponse
 
 
 def resolve_step_inputs(
     step: "Step",
     pipeline_run: "PipelineRunResponse",
+    step_runs: Optional[Dict[str, "StepRunResponse"]] = None,
 ) -> Tuple[Dict[str, "StepRunInputResponse"], List[UUID]]:
     """Resolves inputs for the current step.
 
     Args:
         step: The step for which to resolve the inputs.
         pipeline_run: The current pipeline run.
+        step_runs: The step runs of the current pipeline run, keyed by their
+            name. If not given, they will be fetched from the server. Pass
+            these when resolving the inputs of multiple steps of the same run
+            to avoid fetching all step runs for each of them.
 
     Raises:
         InputResolutionError: If input resolving failed due to a missing
@@ -50,13 +55,16 @@ def resolve_step_inputs(
     from zenml.models import ArtifactVersionResponse
     from zenml.models.v2.core.step_run import StepRunInputResponse
 
-    current_run_steps = {
-        run_step.name: run_step
-        for run_step in pagination_utils.depaginate(
-            Client().list_run_steps,
-            pipeline_run_id=pipeline_run.id,
-        )
-    }
+    if step_runs is None:
+        current_run_steps = {
+            run_step.name: run_step
+            for run_step in pagination_utils.depaginate(
+                Client().list_run_steps,
+                pipeline_run_id=pipeline_run.id,
+            )
+        }
+    else:
+        current_run_steps = step_runs
 
     input_artifacts: Dict[str, StepRunInputResponse] = {}
     for name, input_ in step.spec.inputs.items():
@@ -13,20 +13,26 @@
 #  permissions and limitations under the License.
 """Implementation of the ZenML local orchestrator."""
 
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, cast
 from uuid import uuid4
 
+from pydantic import PositiveInt
+
+from zenml.config.base_settings import BaseSettings
 from zenml.logger import get_logger
 from zenml.orchestrators import BaseOrchestrator
 from zenml.orchestrators.base_orchestrator import (
     BaseOrchestratorConfig,
     BaseOrchestratorFlavor,
 )
+from zenml.orchestrators.dag_runner import ThreadedDagRunner
 from zenml.stack import Stack
 from zenml.utils import string_utils
 
 if TYPE_CHECKING:
+    from zenml.config.step_configurations import Step
     from zenml.models import PipelineDeploymentResponse
 
 logger = get_logger(__name__)
@@ -35,19 +41,39 @@ logger = get_logger(__name__)
 class LocalOrchestrator(BaseOrchestrator):
     """Orchestrator responsible for running pipelines locally.
 
-    This orchestrator does not allow for concurrent execution of steps and also
-    does not support running on a schedule.
+    By default, this orchestrator runs all steps sequentially. Steps that
+    don't depend on each other can optionally be run concurrently in separate
+    threads by configuring `max_parallel_steps`. This orchestrator does not
+    support running on a schedule.
     """
 
     _orchestrator_run_id: Optional[str] = None
 
+    @property
+    def config(self) -> "LocalOrchestratorConfig":
+        """Returns the `LocalOrchestratorConfig` config.
+
+        Returns:
+            The configuration.
+        """
+        return cast(LocalOrchestratorConfig, self._config)
+
+    @property
+    def settings_class(self) -> Optional[Type["BaseSettings"]]:
+        """Settings class for the local orchestrator.
+
+        Returns:
+            The settings class.
+        """
+        return LocalOrchestratorSettings
+
     def prepare_or_run_pipeline(
         self,
         deployment: "PipelineDeploymentResponse",
         stack: "Stack",
         environment: Dict[str, str],
     ) -> Any:
-        """Iterates through all steps and executes them sequentially.
+        """Iterates through all steps and executes them.
 
         Args:
             deployment: The pipeline deployment to prepare or run.
@@ -65,7 +91,6 @@ class LocalOrchestrator(BaseOrchestrator):
         self._orchestrator_run_id = str(uuid4())
         start_time = time.time()
 
-        # Run each step
         for step_name, step in deployment.step_configurations.items():
             if self.requires_resources_in_orchestration_environment(step):
                 logger.warning(
@@ -75,16 +100,72 @@ class LocalOrchestrator(BaseOrchestrator):
                     step_name,
                 )
 
-            self.run_step(
-                step=step,
-            )
+        settings = cast(
+            LocalOrchestratorSettings, self.get_settings(deployment)
+        )
+        try:
+            if settings.max_parallel_steps > 1:
+                self._run_steps_in_parallel(
+                    deployment=deployment,
+                    max_parallel_steps=settings.max_parallel_steps,
+                )
+            else:
+                # Run each step
+                for step in deployment.step_configurations.values():
+                    self.run_step(
+                        step=step,
+                    )
+        finally:
+            self._orchestrator_run_id = None
 
         run_duration = time.time() - start_time
         logger.info(
             "Pipeline run has finished in `%s`.",
             string_utils.get_human_readable_time(run_duration),
         )
-        self._orchestrator_run_id = None
+
+    def _run_steps_in_parallel(
+        self,
+        deployment: "PipelineDeploymentResponse",
+        max_parallel_steps: int,
+    ) -> None:
+        """Runs all steps in threads, respecting the step dependencies.
+
+        Args:
+            deployment: The pipeline deployment to run.
+            max_parallel_steps: Maximum number of steps to run at the same
+                time.
+
+        Raises:
+            BaseException: The exception raised by the first failed step.
+        """
+        failed_steps: List[BaseException] = []
+        failed_steps_lock = threading.Lock()
+
+        def _run_step(step_name: str) -> None:
+            step: "Step" = deployment.step_configurations[step_name]
+            try:
+                self.run_step(step=step)
+            except BaseException as e:
+                with failed_steps_lock:
+                    failed_steps.append(e)
+                # Re-raise so the DAG runner doesn't start any other steps
+                raise
+
+        logger.info("Running up to %d steps in parallel.", max_parallel_steps)
+        pipeline_dag = {
+            step_name: step.spec.upstream_steps
+            for step_name, step in deployment.step_configurations.items()
+        }
+        ThreadedDagRunner(
+            dag=pipeline_dag,
+            run_fn=_run_step,
+            max_parallelism=max_parallel_steps,
+            fail_fast=True,
+        ).run()
+
+        if failed_steps:
+            raise failed_steps[0]
 
     def get_orchestrator_run_id(self) -> str:
         """Returns the active orchestrator run id.
@@ -102,7 +183,22 @@ class LocalOrchestrator(BaseOrchestrator):
         return self._orchestrator_run_id
 
 
-class LocalOrchestratorConfig(BaseOrchestratorConfig):
+class LocalOrchestratorSettings(BaseSettings):
+    """Local orchestrator settings.
+
+    Attributes:
+        max_parallel_steps: Maximum number of steps to run at the same time.
+            Values greater than 1 run steps that don't depend on each other
+            concurrently in separate threads, each step still capturing its
+            own logs. By default, all steps run sequentially.
+    """
+
+    max_parallel_steps: PositiveInt = 1
+
+
+class LocalOrchestratorConfig(
+    BaseOrchestratorConfig, LocalOrchestratorSettings
+):
     """Local orchestrator config."""
 
     @property
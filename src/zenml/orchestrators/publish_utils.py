@@ -13,14 +13,16 @@
 #  permissions and limitations under the License.
 """Utilities to publish pipeline and step runs."""
 
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from zenml.client import Client
 from zenml.enums import ExecutionStatus, MetadataResourceTypes
 from zenml.models import (
+    ArtifactVersionRequest,
     PipelineRunResponse,
     PipelineRunUpdate,
     RunMetadataResource,
+    StepRunFinalizeRequest,
     StepRunResponse,
     StepRunUpdate,
 )
@@ -54,6 +56,51 @@ def publish_successful_step_run(
     )
 
 
+def finalize_successful_step_run(
+    step_run_id: "UUID",
+    output_artifacts: Dict[str, ArtifactVersionRequest],
+    step_run_metadata: Dict["UUID", Dict[str, "MetadataType"]],
+    model_version_id: Optional["UUID"] = None,
+) -> "StepRunResponse":
+    """Publishes all results of a successful step run in a single request.
+
+    Args:
+        step_run_id: The ID of the step run to finalize.
+        output_artifacts: The output artifact versions to create for the step
+            run.
+        step_run_metadata: A dictionary mapping stack component IDs to the
+            metadata they created.
+        model_version_id: ID of the model version to which the output
+            artifacts should be linked.
+
+    Returns:
+        The updated step run.
+    """
+    client = Client()
+    run_metadata = [
+        client._build_run_metadata_request(
+            metadata=metadata,
+            resources=[
+                RunMetadataResource(
+                    id=step_run_id, type=MetadataResourceTypes.STEP_RUN
+                )
+            ],
+            stack_component_id=stack_component_id,
+        )
+        for stack_component_id, metadata in step_run_metadata.items()
+    ]
+    return client.zen_store.finalize_step_run(
+        step_run_id=step_run_id,
+        finalize_request=StepRunFinalizeRequest(
+            status=ExecutionStatus.COMPLETED,
+            end_time=utc_now(),
+            output_artifacts=output_artifacts,
+            run_metadata=run_metadata,
+            model_version_id=model_version_id,
+        ),
+    )
+
+
 def publish_failed_step_run(step_run_id: "UUID") -> "StepRunResponse":
     """Publishes a failed step run.
 
@@ -17,7 +17,11 @@ from typing import Dict, List, Optional, Set, Tuple
 
 from zenml.client import Client
 from zenml.config.step_configurations import Step
-from zenml.constants import CODE_HASH_PARAMETER_NAME, TEXT_FIELD_MAX_LENGTH
+from zenml.constants import (
+    ARTIFACT_CONTENT_HASH_METADATA_KEY,
+    CODE_HASH_PARAMETER_NAME,
+    TEXT_FIELD_MAX_LENGTH,
+)
 from zenml.enums import ExecutionStatus
 from zenml.logger import get_logger
 from zenml.model.utils import link_artifact_version_to_model_version
@@ -27,9 +31,11 @@ from zenml.models import (
     PipelineDeploymentResponse,
     PipelineRunResponse,
     StepRunRequest,
+    StepRunResponse,
 )
 from zenml.orchestrators import cache_utils, input_utils, utils
 from zenml.stack import Stack
+from zenml.utils import pagination_utils
 from zenml.utils.time_utils import utc_now
 
 logger = get_logger(__name__)
@@ -80,17 +86,29 @@ class StepRunRequestFactory:
             workspace=Client().active_workspace.id,
         )
 
-    def populate_request(self, request: StepRunRequest) -> None:
+    def populate_request(
+        self,
+        request: StepRunRequest,
+        step_runs: Optional[Dict[str, StepRunResponse]] = None,
+        check_cache: bool = True,
+    ) -> None:
         """Populate a step run request with additional information.
 
         Args:
             request: The request to populate.
+            step_runs: The existing step runs of the pipeline run, keyed by
+                their name. If not given, they will be fetched when resolving
+                the step inputs.
+            check_cache: Whether to look for an existing step run that can be
+                used as cache. If disabled, the caller is responsible for
+                checking the cache, e.g. in bulk for multiple requests.
         """
         step = self.deployment.step_configurations[request.name]
 
         input_artifacts, parent_step_ids = input_utils.resolve_step_inputs(
             step=step,
             pipeline_run=self.pipeline_run,
+            step_runs=step_runs,
         )
         input_artifact_ids = {
             input_name: artifact.id
@@ -100,11 +118,25 @@ class StepRunRequestFactory:
         request.inputs = input_artifact_ids
         request.parent_step_ids = parent_step_ids
 
+        input_artifact_content_hashes = {}
+        if utils.is_setting_enabled(
+            is_enabled_on_step=step.config.enable_content_hash_caching,
+            is_enabled_on_pipeline=self.deployment.pipeline_configuration.enable_content_hash_caching,
+            default=False,
+        ):
+            for input_name, artifact in input_artifacts.items():
+                content_hash = artifact.run_metadata.get(
+                    ARTIFACT_CONTENT_HASH_METADATA_KEY
+                )
+                if isinstance(content_hash, str):
+                    input_artifact_content_hashes[input_name] = content_hash
+
         cache_key = cache_utils.generate_cache_key(
             step=step,
             input_artifact_ids=input_artifact_ids,
             artifact_store=self.stack.artifact_store,
             workspace_id=Client().active_workspace.id,
+            input_artifact_content_hashes=input_artifact_content_hashes,
         )
         request.cache_key = cache_key
 
@@ -124,23 +156,37 @@ class StepRunRequestFactory:
             is_enabled_on_pipeline=self.deployment.pipeline_configuration.enable_cache,
         )
 
-        if cache_enabled:
+        if check_cache and cache_enabled:
             if cached_step_run := cache_utils.get_cached_step_run(
                 cache_key=cache_key
             ):
-                request.inputs = {
-                    input_name: artifact.id
-                    for input_name, artifact in cached_step_run.inputs.items()
-                }
+                self.apply_cached_step_run(
+                    request=request, cached_step_run=cached_step_run
+                )
+
+    @staticmethod
+    def apply_cached_step_run(
+        request: StepRunRequest, cached_step_run: StepRunResponse
+    ) -> None:
+        """Use an existing step run as cache for a step run request.
+
+        Args:
+            request: The request to update.
+            cached_step_run: The existing step run to use as cache.
+        """
+        request.inputs = {
+            input_name: artifact.id
+            for input_name, artifact in cached_step_run.inputs.items()
+        }
 
-                request.original_step_run_id = cached_step_run.id
-                request.outputs = {
-                    output_name: [artifact.id for artifact in artifacts]
-                    for output_name, artifacts in cached_step_run.outputs.items()
-                }
+        request.original_step_run_id = cached_step_run.id
+        request.outputs = {
+            output_name: [artifact.id for artifact in artifacts]
+            for output_name, artifacts in cached_step_run.outputs.items()
+        }
 
-                request.status = ExecutionStatus.CACHED
-                request.end_time = request.start_time
+        request.status = ExecutionStatus.CACHED
+        request.end_time = request.start_time
 
     def _get_docstring_and_source_code(
         self, invocation_id: str
@@ -294,19 +340,30 @@ def create_cached_step_runs(
         # them -> no need to check them again
         - visited_invocations
     ):
-        for invocation_id in cache_candidates:
-            visited_invocations.add(invocation_id)
+        visited_invocations.update(cache_candidates)
 
-            # Make sure the request factory has the most up to date pipeline
-            # run to avoid hydration calls
-            request_factory.pipeline_run = Client().get_pipeline_run(
-                pipeline_run.id
+        # Make sure the request factory has the most up to date pipeline
+        # run to avoid hydration calls. The pipeline run and its step runs
+        # are fetched once for all candidates of this iteration.
+        request_factory.pipeline_run = Client().get_pipeline_run(
+            pipeline_run.id
+        )
+        step_runs = {
+            run_step.name: run_step
+            for run_step in pagination_utils.depaginate(
+                Client().list_run_steps, pipeline_run_id=pipeline_run.id
             )
+        }
+
+        step_run_requests = []
+        for invocation_id in sorted(cache_candidates):
             try:
                 step_run_request = request_factory.create_request(
                     invocation_id
                 )
-                request_factory.populate_request(step_run_request)
+                request_factory.populate_request(
+                    step_run_request, step_runs=step_runs, check_cache=False
+                )
             except Exception as e:
                 # We failed to create/populate the step run. This might be due
                 # to some input resolution error, or an error importing the step
@@ -318,14 +375,39 @@ def create_cached_step_runs(
                 )
                 continue
 
-            if step_run_request.status != ExecutionStatus.CACHED:
-                # If we're not able to cache the step run, the orchestrator
-                # will run the step later which will create the step run
-                # -> We don't need to do anything here
-                continue
+            step_run_requests.append(step_run_request)
+
+        # Look up the cached step runs for all candidates in a single call
+        cached_step_runs = cache_utils.get_cached_step_runs(
+            cache_keys=[
+                request.cache_key
+                for request in step_run_requests
+                if request.cache_key
+            ]
+        )
 
-            step_run = Client().zen_store.create_run_step(step_run_request)
+        cached_step_run_requests = []
+        for step_run_request in step_run_requests:
+            if step_run_request.cache_key and (
+                cached_step_run := cached_step_runs.get(
+                    step_run_request.cache_key
+                )
+            ):
+                request_factory.apply_cached_step_run(
+                    request=step_run_request, cached_step_run=cached_step_run
+                )
+                cached_step_run_requests.append(step_run_request)
+
+            # If we're not able to cache the step run, the orchestrator
+            # will run the step later which will create the step run
+            # -> We don't need to do anything here
+
+        if not cached_step_run_requests:
+            continue
 
+        for step_run in Client().zen_store.batch_create_run_steps(
+            cached_step_run_requests
+        ):
             if (
                 model_version := step_run.model_version
                 or pipeline_run.model_version
@@ -335,8 +417,8 @@ def create_cached_step_runs(
                     model_version=model_version,
                 )
 
-            logger.info("Using cached version of step `%s`.", invocation_id)
-            cached_invocations.add(invocation_id)
+            logger.info("Using cached version of step `%s`.", step_run.name)
+            cached_invocations.add(step_run.name)
 
     return cached_invocations
 
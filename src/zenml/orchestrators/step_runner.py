@@ -27,9 +27,16 @@ from typing import (
     Type,
 )
 
+from zenml.artifact_stores.artifact_cache import (
+    cache_artifact_reads,
+    get_artifact_cache,
+)
+from zenml.artifacts.load_config import (
+    ArtifactLoadConfig,
+    artifact_load_config,
+)
 from zenml.artifacts.unmaterialized_artifact import UnmaterializedArtifact
 from zenml.artifacts.utils import _store_artifact_data_and_prepare_request
-from zenml.client import Client
 from zenml.config.step_configurations import StepConfiguration
 from zenml.config.step_run_info import StepRunInfo
 from zenml.constants import (
@@ -44,8 +51,8 @@ from zenml.logging.step_logging import StepLogsStorageContext, redirected
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.models.v2.core.step_run import StepRunInputResponse
 from zenml.orchestrators.publish_utils import (
+    finalize_successful_step_run,
     publish_step_run_metadata,
-    publish_successful_step_run,
 )
 from zenml.orchestrators.utils import (
     is_setting_enabled,
@@ -53,6 +60,7 @@ from zenml.orchestrators.utils import (
 from zenml.steps.step_context import StepContext, get_step_context
 from zenml.steps.utils import (
     OutputSignature,
+    get_artifact_load_config_from_annotation_metadata,
     parse_return_type_annotations,
     resolve_type_annotation,
 )
@@ -64,6 +72,7 @@ if TYPE_CHECKING:
     from zenml.config.source import Source
     from zenml.config.step_configurations import Step
     from zenml.models import (
+        ArtifactVersionRequest,
         ArtifactVersionResponse,
         PipelineRunResponse,
         StepRunResponse,
@@ -207,73 +216,81 @@ class StepRunner:
                     step_run_metadata = self._stack.get_step_run_metadata(
                         info=step_run_info,
                     )
-                    publish_step_run_metadata(
-                        step_run_id=step_run_info.step_run_id,
-                        step_run_metadata=step_run_metadata,
-                    )
-                    self._stack.cleanup_step_run(
-                        info=step_run_info, step_failed=step_failed
-                    )
-                    if not step_failed:
-                        if (
-                            success_hook_source
-                            := self.configuration.success_hook_source
-                        ):
-                            logger.info("Detected success hook. Running...")
-                            self.load_and_run_hook(
-                                success_hook_source,
-                                step_exception=None,
-                            )
-
-                        # Store and publish the output artifacts of the step function.
-                        output_data = self._validate_outputs(
-                            return_values, output_annotations
-                        )
-                        artifact_metadata_enabled = is_setting_enabled(
-                            is_enabled_on_step=step_run_info.config.enable_artifact_metadata,
-                            is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_metadata,
+                    if step_failed:
+                        publish_step_run_metadata(
+                            step_run_id=step_run_info.step_run_id,
+                            step_run_metadata=step_run_metadata,
                         )
-                        artifact_visualization_enabled = is_setting_enabled(
-                            is_enabled_on_step=step_run_info.config.enable_artifact_visualization,
-                            is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_visualization,
+                        self._stack.cleanup_step_run(
+                            info=step_run_info, step_failed=True
                         )
-                        output_artifacts = self._store_output_artifacts(
-                            output_data=output_data,
-                            output_artifact_uris=output_artifact_uris,
-                            output_materializers=output_materializers,
-                            output_annotations=output_annotations,
-                            artifact_metadata_enabled=artifact_metadata_enabled,
-                            artifact_visualization_enabled=artifact_visualization_enabled,
-                        )
-
-                        if (
-                            model_version := step_run.model_version
-                            or pipeline_run.model_version
-                        ):
-                            from zenml.orchestrators import step_run_utils
-
-                            step_run_utils.link_output_artifacts_to_model_version(
-                                artifacts={
-                                    k: [v] for k, v in output_artifacts.items()
-                                },
-                                model_version=model_version,
+                    else:
+                        try:
+                            self._stack.cleanup_step_run(
+                                info=step_run_info, step_failed=False
+                            )
+                            if (
+                                success_hook_source
+                                := self.configuration.success_hook_source
+                            ):
+                                logger.info(
+                                    "Detected success hook. Running..."
+                                )
+                                self.load_and_run_hook(
+                                    success_hook_source,
+                                    step_exception=None,
+                                )
+
+                            # Store the output artifacts of the step function.
+                            output_data = self._validate_outputs(
+                                return_values, output_annotations
+                            )
+                            artifact_metadata_enabled = is_setting_enabled(
+                                is_enabled_on_step=step_run_info.config.enable_artifact_metadata,
+                                is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_metadata,
+                            )
+                            artifact_visualization_enabled = is_setting_enabled(
+                                is_enabled_on_step=step_run_info.config.enable_artifact_visualization,
+                                is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_visualization,
+                            )
+                            content_hash_caching_enabled = is_setting_enabled(
+                                is_enabled_on_step=step_run_info.config.enable_content_hash_caching,
+                                is_enabled_on_pipeline=step_run_info.pipeline.enable_content_hash_caching,
+                                default=False,
                             )
+                            output_artifacts = self._store_output_artifacts(
+                                output_data=output_data,
+                                output_artifact_uris=output_artifact_uris,
+                                output_materializers=output_materializers,
+                                output_annotations=output_annotations,
+                                artifact_metadata_enabled=artifact_metadata_enabled,
+                                artifact_visualization_enabled=artifact_visualization_enabled,
+                                content_hash_enabled=content_hash_caching_enabled,
+                            )
+                        except BaseException:
+                            # The step run will not be finalized, so we
+                            # publish its metadata right away
+                            publish_step_run_metadata(
+                                step_run_id=step_run_info.step_run_id,
+                                step_run_metadata=step_run_metadata,
+                            )
+                            raise
                 finally:
                     step_context._cleanup_registry.execute_callbacks(
                         raise_on_exception=False
                     )
                     StepContext._clear()  # Remove the step context singleton
 
-            # Update the status and output artifacts of the step run.
-            output_artifact_ids = {
-                output_name: [
-                    artifact.id,
-                ]
-                for output_name, artifact in output_artifacts.items()
-            }
-            publish_successful_step_run(
+            # Publish the output artifacts, metadata and status of the step
+            # run in a single request.
+            model_version = (
+                step_run.model_version or pipeline_run.model_version
+            )
+            finalize_successful_step_run(
                 step_run_id=step_run_info.step_run_id,
-                output_artifact_ids=output_artifact_ids,
+                output_artifacts=output_artifacts,
+                step_run_metadata=step_run_metadata,
+                model_version_id=model_version.id if model_version else None,
             )
 
     def _evaluate_artifact_names_in_collections(
@@ -364,12 +381,17 @@ class StepRunner:
             args.pop(0)
 
         for arg in args:
-            arg_type = annotations.get(arg, None)
-            arg_type = resolve_type_annotation(arg_type)
+            annotation = annotations.get(arg, None)
+            arg_type = resolve_type_annotation(annotation)
 
             if arg in input_artifacts:
+                load_config = (
+                    get_artifact_load_config_from_annotation_metadata(
+                        annotation
+                    )
+                )
                 function_params[arg] = self._load_input_artifact(
-                    input_artifacts[arg], arg_type
+                    input_artifacts[arg], arg_type, load_config=load_config
                 )
             elif arg in self.configuration.parameters:
                 function_params[arg] = self.configuration.parameters[arg]
@@ -420,13 +442,18 @@ class StepRunner:
         return function_params
 
     def _load_input_artifact(
-        self, artifact: "ArtifactVersionResponse", data_type: Type[Any]
+        self,
+        artifact: "ArtifactVersionResponse",
+        data_type: Type[Any],
+        load_config: Optional[ArtifactLoadConfig] = None,
     ) -> Any:
         """Loads an input artifact.
 
         Args:
             artifact: The artifact to load.
             data_type: The data type of the artifact value.
+            load_config: Optional configuration to only load parts of the
+                artifact.
 
         Returns:
             The artifact value.
@@ -457,7 +484,22 @@ class StepRunner:
                 uri=artifact.uri, artifact_store=artifact_store
             )
             materializer.validate_load_type_compatibility(data_type)
-            return materializer.load(data_type=data_type)
+
+            # Reads from remote artifact stores are served from the local
+            # artifact cache if enabled
+            with cache_artifact_reads(
+                artifact_version_id=artifact.id, uri=artifact.uri
+            ):
+                with artifact_load_config(load_config):
+                    data = materializer.load(data_type=data_type)
+
+            if artifact_cache := get_artifact_cache():
+                logger.debug(
+                    "Loaded artifact `%s`, artifact cache metrics: %s",
+                    artifact.uri,
+                    artifact_cache.metrics,
+                )
+            return data
 
         if artifact.artifact_store_id == self._stack.artifact_store.id:
             # Register the artifact store of the active stack here to avoid
@@ -557,7 +599,8 @@ class StepRunner:
         output_annotations: Dict[str, OutputSignature],
         artifact_metadata_enabled: bool,
         artifact_visualization_enabled: bool,
-    ) -> Dict[str, "ArtifactVersionResponse"]:
+        content_hash_enabled: bool = False,
+    ) -> Dict[str, "ArtifactVersionRequest"]:
         """Stores the output artifacts of the step.
 
         Args:
@@ -570,12 +613,15 @@ class StepRunner:
                 enabled.
             artifact_visualization_enabled: Whether artifact visualization is
                 enabled.
+            content_hash_enabled: Whether to compute and store content hashes
+                of the output artifacts.
 
         Returns:
-            The IDs of the published output artifacts.
+            The requests to create the output artifact versions, mapping
+            output names to requests.
         """
         step_context = get_step_context()
-        artifact_requests = []
+        artifact_requests = {}
 
         for output_name, return_value in output_data.items():
             data_type = type(return_value)
@@ -651,13 +697,11 @@ class StepRunner:
                 tags=tags,
                 save_type=ArtifactSaveType.STEP_OUTPUT,
                 metadata=user_metadata,
+                store_content_hash=content_hash_enabled,
             )
-            artifact_requests.append(artifact_request)
+            artifact_requests[output_name] = artifact_request
 
-        responses = Client().zen_store.batch_create_artifact_versions(
-            artifact_requests
-        )
-        return dict(zip(output_data.keys(), responses))
+        return artifact_requests
 
     def load_and_run_hook(
         self,
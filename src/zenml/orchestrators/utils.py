@@ -81,16 +81,21 @@ def get_orchestrator_run_name(
 def is_setting_enabled(
     is_enabled_on_step: Optional[bool],
     is_enabled_on_pipeline: Optional[bool],
+    default: bool = True,
 ) -> bool:
     """Checks if a certain setting is enabled within a step run.
 
     This is the case if:
     - the setting is explicitly enabled for the step, or
-    - the setting is neither explicitly disabled for the step nor the pipeline.
+    - the setting is explicitly enabled for the pipeline and not explicitly
+      disabled for the step, or
+    - the setting is configured on neither of them and enabled by default.
 
     Args:
         is_enabled_on_step: The setting of the step.
         is_enabled_on_pipeline: The setting of the pipeline.
+        default: Whether the setting is enabled if it is configured neither
+            on the step nor the pipeline.
 
     Returns:
         True if the setting is enabled within the step run, False otherwise.
@@ -99,7 +104,7 @@ def is_setting_enabled(
         return is_enabled_on_step
     if is_enabled_on_pipeline is not None:
         return is_enabled_on_pipeline
-    return True
+    return default
 
 
 def get_config_environment_vars(
@@ -49,6 +49,7 @@ def pipeline(
     enable_cache: Optional[bool] = None,
     enable_artifact_metadata: Optional[bool] = None,
     enable_step_logs: Optional[bool] = None,
+    enable_content_hash_caching: Optional[bool] = None,
     settings: Optional[Dict[str, "SettingsOrDict"]] = None,
     tags: Optional[List[str]] = None,
     extra: Optional[Dict[str, Any]] = None,
@@ -66,6 +67,7 @@ def pipeline(
     enable_cache: Optional[bool] = None,
     enable_artifact_metadata: Optional[bool] = None,
     enable_step_logs: Optional[bool] = None,
+    enable_content_hash_caching: Optional[bool] = None,
     settings: Optional[Dict[str, "SettingsOrDict"]] = None,
     tags: Optional[List[str]] = None,
     extra: Optional[Dict[str, Any]] = None,
@@ -83,6 +85,8 @@ def pipeline(
         enable_cache: Whether to use caching or not.
         enable_artifact_metadata: Whether to enable artifact metadata or not.
         enable_step_logs: If step logs should be enabled for this pipeline.
+        enable_content_hash_caching: Whether to hash artifacts and use
+            their content instead of their IDs when computing cache keys.
         settings: Settings for this pipeline.
         tags: Tags to apply to runs of the pipeline.
         extra: Extra configurations for this pipeline.
@@ -107,6 +111,7 @@ def pipeline(
             enable_cache=enable_cache,
             enable_artifact_metadata=enable_artifact_metadata,
             enable_step_logs=enable_step_logs,
+            enable_content_hash_caching=enable_content_hash_caching,
             settings=settings,
             tags=tags,
             extra=extra,
@@ -129,6 +129,7 @@ class Pipeline:
         enable_artifact_metadata: Optional[bool] = None,
         enable_artifact_visualization: Optional[bool] = None,
         enable_step_logs: Optional[bool] = None,
+        enable_content_hash_caching: Optional[bool] = None,
         settings: Optional[Mapping[str, "SettingsOrDict"]] = None,
         tags: Optional[List[str]] = None,
         extra: Optional[Dict[str, Any]] = None,
@@ -148,6 +149,8 @@ class Pipeline:
             enable_artifact_visualization: If artifact visualization should be
                 enabled for this pipeline.
             enable_step_logs: If step logs should be enabled for this pipeline.
+            enable_content_hash_caching: Whether to hash artifacts and use
+                their content instead of their IDs when computing cache keys.
             settings: Settings for this pipeline.
             tags: Tags to apply to runs of this pipeline.
             extra: Extra configurations for this pipeline.
@@ -173,6 +176,7 @@ class Pipeline:
                 enable_artifact_metadata=enable_artifact_metadata,
                 enable_artifact_visualization=enable_artifact_visualization,
                 enable_step_logs=enable_step_logs,
+                enable_content_hash_caching=enable_content_hash_caching,
                 settings=settings,
                 tags=tags,
                 extra=extra,
@@ -292,6 +296,7 @@ class Pipeline:
         enable_artifact_metadata: Optional[bool] = None,
         enable_artifact_visualization: Optional[bool] = None,
         enable_step_logs: Optional[bool] = None,
+        enable_content_hash_caching: Optional[bool] = None,
         settings: Optional[Mapping[str, "SettingsOrDict"]] = None,
         tags: Optional[List[str]] = None,
         extra: Optional[Dict[str, Any]] = None,
@@ -321,6 +326,8 @@ class Pipeline:
             enable_artifact_visualization: If artifact visualization should be
                 enabled for this pipeline.
             enable_step_logs: If step logs should be enabled for this pipeline.
+            enable_content_hash_caching: Whether to hash artifacts and use
+                their content instead of their IDs when computing cache keys.
             settings: settings for this pipeline.
             tags: Tags to apply to runs of this pipeline.
             extra: Extra configurations for this pipeline.
@@ -363,6 +370,7 @@ class Pipeline:
                 "enable_artifact_metadata": enable_artifact_metadata,
                 "enable_artifact_visualization": enable_artifact_visualization,
                 "enable_step_logs": enable_step_logs,
+                "enable_content_hash_caching": enable_content_hash_caching,
                 "settings": settings,
                 "tags": tags,
                 "extra": extra,
@@ -587,6 +595,7 @@ To avoid this consider setting pipeline parameters only in one place (config or
         enable_artifact_metadata: Optional[bool] = None,
         enable_artifact_visualization: Optional[bool] = None,
         enable_step_logs: Optional[bool] = None,
+        enable_content_hash_caching: Optional[bool] = None,
         schedule: Optional[Schedule] = None,
         build: Union[str, "UUID", "PipelineBuildBase", None] = None,
         settings: Optional[Mapping[str, "SettingsOrDict"]] = None,
@@ -609,6 +618,8 @@ To avoid this consider setting pipeline parameters only in one place (config or
             enable_artifact_visualization: If artifact visualization should be
                 enabled for this pipeline run.
             enable_step_logs: If step logs should be enabled for this pipeline.
+            enable_content_hash_caching: Whether to hash artifacts and use
+                their content instead of their IDs when computing cache keys.
             schedule: Optional schedule to use for the run.
             build: Optional build to use for the run.
             settings: Settings for this pipeline run.
@@ -640,6 +651,7 @@ To avoid this consider setting pipeline parameters only in one place (config or
             enable_artifact_metadata=enable_artifact_metadata,
             enable_artifact_visualization=enable_artifact_visualization,
             enable_step_logs=enable_step_logs,
+            enable_content_hash_caching=enable_content_hash_caching,
             steps=step_configurations,
             settings=settings,
             schedule=schedule,
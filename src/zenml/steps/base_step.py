@@ -104,6 +104,7 @@ class BaseStep:
         enable_artifact_metadata: Optional[bool] = None,
         enable_artifact_visualization: Optional[bool] = None,
         enable_step_logs: Optional[bool] = None,
+        enable_content_hash_caching: Optional[bool] = None,
         experiment_tracker: Optional[str] = None,
         step_operator: Optional[str] = None,
         parameters: Optional[Dict[str, Any]] = None,
@@ -128,6 +129,8 @@ class BaseStep:
             enable_artifact_visualization: If artifact visualization should be
                 enabled for this step.
             enable_step_logs: Enable step logs for this step.
+            enable_content_hash_caching: Whether to hash artifacts and use
+                their content instead of their IDs when computing cache keys.
             experiment_tracker: The experiment tracker to use for this step.
             step_operator: The step operator to use for this step.
             parameters: Function parameters for this step
@@ -194,6 +197,7 @@ class BaseStep:
             enable_artifact_metadata=enable_artifact_metadata,
             enable_artifact_visualization=enable_artifact_visualization,
             enable_step_logs=enable_step_logs,
+            enable_content_hash_caching=enable_content_hash_caching,
         )
         self.configure(
             experiment_tracker=experiment_tracker,
@@ -586,6 +590,7 @@ class BaseStep:
         enable_artifact_metadata: Optional[bool] = None,
         enable_artifact_visualization: Optional[bool] = None,
         enable_step_logs: Optional[bool] = None,
+        enable_content_hash_caching: Optional[bool] = None,
         experiment_tracker: Optional[str] = None,
         step_operator: Optional[str] = None,
         parameters: Optional[Dict[str, Any]] = None,
@@ -620,6 +625,8 @@ class BaseStep:
             enable_artifact_visualization: If artifact visualization should be
                 enabled for this step.
             enable_step_logs: If step logs should be enabled for this step.
+            enable_content_hash_caching: Whether to hash artifacts and use
+                their content instead of their IDs when computing cache keys.
             experiment_tracker: The experiment tracker to use for this step.
             step_operator: The step operator to use for this step.
             parameters: Function parameters for this step
@@ -697,6 +704,7 @@ class BaseStep:
                 "enable_artifact_metadata": enable_artifact_metadata,
                 "enable_artifact_visualization": enable_artifact_visualization,
                 "enable_step_logs": enable_step_logs,
+                "enable_content_hash_caching": enable_content_hash_caching,
                 "experiment_tracker": experiment_tracker,
                 "step_operator": step_operator,
                 "parameters": parameters,
@@ -720,6 +728,7 @@ class BaseStep:
         enable_artifact_metadata: Optional[bool] = None,
         enable_artifact_visualization: Optional[bool] = None,
         enable_step_logs: Optional[bool] = None,
+        enable_content_hash_caching: Optional[bool] = None,
         experiment_tracker: Optional[str] = None,
         step_operator: Optional[str] = None,
         parameters: Optional[Dict[str, Any]] = None,
@@ -743,6 +752,8 @@ class BaseStep:
             enable_artifact_visualization: If artifact visualization should be
                 enabled for this step.
             enable_step_logs: If step logs should be enabled for this step.
+            enable_content_hash_caching: Whether to hash artifacts and use
+                their content instead of their IDs when computing cache keys.
             experiment_tracker: The experiment tracker to use for this step.
             step_operator: The step operator to use for this step.
             parameters: Function parameters for this step
@@ -775,6 +786,7 @@ class BaseStep:
             enable_artifact_metadata=enable_artifact_metadata,
             enable_artifact_visualization=enable_artifact_visualization,
             enable_step_logs=enable_step_logs,
+            enable_content_hash_caching=enable_content_hash_caching,
             experiment_tracker=experiment_tracker,
             step_operator=step_operator,
             parameters=parameters,
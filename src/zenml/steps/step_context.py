@@ -27,7 +27,7 @@ from typing import (
 from zenml.exceptions import StepContextError
 from zenml.logger import get_logger
 from zenml.utils.callback_registry import CallbackRegistry
-from zenml.utils.singleton import SingletonMetaClass
+from zenml.utils.singleton import ThreadLocalSingletonMetaClass
 
 if TYPE_CHECKING:
     from zenml.artifacts.artifact_config import ArtifactConfig
@@ -61,7 +61,7 @@ def get_step_context() -> "StepContext":
     )
 
 
-class StepContext(metaclass=SingletonMetaClass):
+class StepContext(metaclass=ThreadLocalSingletonMetaClass):
     """Provides additional context inside a step function.
 
     This singleton class is used to access information about the current run,
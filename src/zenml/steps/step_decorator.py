@@ -64,6 +64,7 @@ def step(
     enable_artifact_metadata: Optional[bool] = None,
     enable_artifact_visualization: Optional[bool] = None,
     enable_step_logs: Optional[bool] = None,
+    enable_content_hash_caching: Optional[bool] = None,
     experiment_tracker: Optional[str] = None,
     step_operator: Optional[str] = None,
     output_materializers: Optional["OutputMaterializersSpecification"] = None,
@@ -85,6 +86,7 @@ def step(
     enable_artifact_metadata: Optional[bool] = None,
     enable_artifact_visualization: Optional[bool] = None,
     enable_step_logs: Optional[bool] = None,
+    enable_content_hash_caching: Optional[bool] = None,
     experiment_tracker: Optional[str] = None,
     step_operator: Optional[str] = None,
     output_materializers: Optional["OutputMaterializersSpecification"] = None,
@@ -110,6 +112,8 @@ def step(
             for this step. If no value is passed, visualization is enabled by
             default.
         enable_step_logs: Specify whether step logs are enabled for this step.
+        enable_content_hash_caching: Whether to hash artifacts and use
+            their content instead of their IDs when computing cache keys.
         experiment_tracker: The experiment tracker to use for this step.
         step_operator: The step operator to use for this step.
         output_materializers: Output materializers for this step. If
@@ -151,6 +155,7 @@ def step(
             enable_artifact_metadata=enable_artifact_metadata,
             enable_artifact_visualization=enable_artifact_visualization,
             enable_step_logs=enable_step_logs,
+            enable_content_hash_caching=enable_content_hash_caching,
             experiment_tracker=experiment_tracker,
             step_operator=step_operator,
             output_materializers=output_materializers,
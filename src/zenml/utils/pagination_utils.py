@@ -13,30 +13,166 @@
 #  permissions and limitations under the License.
 """Pagination utilities."""
 
-from typing import Any, Callable, List, TypeVar
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
-from zenml.models import BaseIdentifiedResponse, Page
+from zenml.models import BaseFilter, BaseIdentifiedResponse, Page
 
 AnyResponse = TypeVar("AnyResponse", bound=BaseIdentifiedResponse)  # type: ignore[type-arg]
 
+MAX_CONCURRENT_PAGE_REQUESTS = 4
+
 
 def depaginate(
-    list_method: Callable[..., Page[AnyResponse]], **kwargs: Any
+    list_method: Callable[..., Page[AnyResponse]],
+    max_concurrent_requests: int = MAX_CONCURRENT_PAGE_REQUESTS,
+    **kwargs: Any,
 ) -> List[AnyResponse]:
     """Depaginate the results from a client or store method that returns pages.
 
+    Once the first page is fetched, the remaining pages are fetched
+    concurrently. If concurrency is disabled and the list method is called
+    with a filter model and returns a cursor for the next page, the following
+    pages are fetched using this cursor instead of the page number.
+
     Args:
         list_method: The list method to depaginate.
+        max_concurrent_requests: The maximum number of pages to fetch
+            concurrently. If set to 1, pages are fetched one after the other.
         **kwargs: Arguments for the list method.
 
     Returns:
         A list of the corresponding Response Models.
     """
+    return list(
+        iter_depaginated(
+            list_method,
+            max_concurrent_requests=max_concurrent_requests,
+            **kwargs,
+        )
+    )
+
+
+def iter_depaginated(
+    list_method: Callable[..., Page[AnyResponse]],
+    max_concurrent_requests: int = MAX_CONCURRENT_PAGE_REQUESTS,
+    **kwargs: Any,
+) -> Iterator[AnyResponse]:
+    """Iterate over the results from a method that returns pages.
+
+    Items are yielded in order as soon as the page containing them arrives,
+    while the following pages are already being fetched in the background.
+    Stopping the iteration early cancels all pages that were not requested
+    yet.
+
+    Args:
+        list_method: The list method to depaginate.
+        max_concurrent_requests: The maximum number of pages to fetch
+            concurrently. If set to 1, pages are fetched one after the other.
+        **kwargs: Arguments for the list method.
+
+    Yields:
+        The items of all pages.
+    """
     page = list_method(**kwargs)
-    items = list(page.items)
-    while page.index < page.total_pages:
-        kwargs["page"] = page.index + 1
-        page = list_method(**kwargs)
-        items += list(page.items)
+    yield from page.items
+
+    filter_model = _get_filter_model(kwargs)
+    if (
+        max_concurrent_requests <= 1
+        or page.index >= page.total_pages
+        # Without counting all items, the total number of pages is not known
+        or (filter_model and filter_model[1].skip_count)
+    ):
+        while page.index < page.total_pages:
+            page = list_method(
+                **_get_page_kwargs(
+                    kwargs, index=page.index + 1, cursor=page.next_cursor
+                )
+            )
+            yield from page.items
+        return
+
+    remaining_pages = iter(range(page.index + 1, page.total_pages + 1))
+    pending: Deque["Future[Page[AnyResponse]]"] = deque()
+
+    with ThreadPoolExecutor(max_workers=max_concurrent_requests) as executor:
+
+        def _request_next_page() -> None:
+            index = next(remaining_pages, None)
+            if index is not None:
+                pending.append(
+                    executor.submit(
+                        copy_context().run,
+                        list_method,
+                        **_get_page_kwargs(kwargs, index=index),
+                    )
+                )
+
+        try:
+            for _ in range(max_concurrent_requests):
+                _request_next_page()
+
+            while pending:
+                page = pending.popleft().result()
+                _request_next_page()
+                yield from page.items
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _get_filter_model(
+    kwargs: Dict[str, Any],
+) -> Optional[Tuple[str, BaseFilter]]:
+    """Get the filter model passed to a list method.
+
+    Args:
+        kwargs: Arguments for the list method.
+
+    Returns:
+        The argument name and value of the filter model, if any.
+    """
+    for key, value in kwargs.items():
+        if isinstance(value, BaseFilter):
+            return key, value
+
+    return None
+
+
+def _get_page_kwargs(
+    kwargs: Dict[str, Any], index: int, cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """Get the list method arguments to fetch a specific page.
+
+    Args:
+        kwargs: Arguments for the list method.
+        index: The index of the page to fetch.
+        cursor: Optional cursor pointing to the last item before the page.
+
+    Returns:
+        The arguments for the list method.
+    """
+    page_kwargs = dict(kwargs)
+    filter_model = _get_filter_model(kwargs)
+    if filter_model:
+        key, value = filter_model
+        page_kwargs[key] = value.model_copy(
+            update={"page": index, "after": cursor}
+        )
+    else:
+        page_kwargs["page"] = index
 
-    return items
+    return page_kwargs
@@ -13,7 +13,8 @@
 #  permissions and limitations under the License.
 """Utility class to turn classes into singleton classes."""
 
-from typing import Any, Optional, cast
+import threading
+from typing import Any, Dict, Optional, cast
 
 
 class SingletonMetaClass(type):
@@ -87,3 +88,108 @@ class SingletonMetaClass(type):
             `True` if the singleton instance exists, `False` otherwise.
         """
         return cls.__singleton_instance is not None
+
+
+class ThreadLocalSingletonMetaClass(type):
+    """Thread-local singleton metaclass.
+
+    Each thread that creates or clears an instance of a class using this
+    metaclass gets its own singleton instance. This allows multiple
+    independent instances (e.g. one per concurrently running step) to exist
+    at the same time.
+
+    Threads that never created or cleared an instance themselves (e.g. worker
+    threads spawned by user code) fall back to the instance of another thread
+    if exactly one thread that is still alive owns an instance. If multiple
+    threads own an instance, it is ambiguous which one such a thread belongs
+    to and no instance is returned.
+    """
+
+    def __init__(cls, *args: Any, **kwargs: Any) -> None:
+        """Initialize a thread-local singleton class.
+
+        Args:
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments.
+        """
+        super().__init__(*args, **kwargs)
+        cls.__thread_local = threading.local()
+        cls.__instances: Dict[
+            threading.Thread, "ThreadLocalSingletonMetaClass"
+        ] = {}
+        cls.__lock = threading.Lock()
+
+    def __call__(
+        cls, *args: Any, **kwargs: Any
+    ) -> "ThreadLocalSingletonMetaClass":
+        """Create or return the singleton instance of the current thread.
+
+        Args:
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The singleton instance.
+        """
+        instance = cls._instance()
+        if not instance:
+            instance = cast(
+                "ThreadLocalSingletonMetaClass",
+                super().__call__(*args, **kwargs),
+            )
+            cls._clear(instance)
+
+        return instance
+
+    def _clear(
+        cls, instance: Optional["ThreadLocalSingletonMetaClass"] = None
+    ) -> None:
+        """Clear or replace the singleton instance of the current thread.
+
+        Args:
+            instance: The new singleton instance.
+        """
+        thread = threading.current_thread()
+        cls.__thread_local.instance = instance
+        with cls.__lock:
+            cls._remove_finished_threads()
+            cls.__instances.pop(thread, None)
+            if instance:
+                cls.__instances[thread] = instance
+
+    def _remove_finished_threads(cls) -> None:
+        """Remove the instances of threads that are not alive anymore.
+
+        Must be called while holding the lock.
+        """
+        for thread in [t for t in cls.__instances if not t.is_alive()]:
+            del cls.__instances[thread]
+
+    def _instance(cls) -> Optional["ThreadLocalSingletonMetaClass"]:
+        """Get the singleton instance.
+
+        Returns:
+            The singleton instance of the current thread. If the current
+            thread never set an instance, the instance of the only other
+            thread that owns an instance.
+        """
+        if hasattr(cls.__thread_local, "instance"):
+            return cast(
+                Optional["ThreadLocalSingletonMetaClass"],
+                cls.__thread_local.instance,
+            )
+
+        with cls.__lock:
+            cls._remove_finished_threads()
+            if len(cls.__instances) == 1:
+                return next(iter(cls.__instances.values()))
+
+        return None
+
+    def _exists(cls) -> bool:
+        """Check if the singleton instance exists.
+
+        Returns:
+            `True` if the singleton instance exists, `False` otherwise.
+        """
+        return cls._instance() is not None
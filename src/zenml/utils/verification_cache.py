@@ -0,0 +1,130 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Cache of successfully verified credentials."""
+
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+from zenml.constants import (
+    VERIFIED_CREDENTIALS_CACHE_SIZE,
+    VERIFIED_CREDENTIALS_CACHE_TTL,
+)
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+@lru_cache(maxsize=None)
+def get_bcrypt_context() -> "CryptContext":
+    """Returns the shared bcrypt encryption context.
+
+    Returns:
+        The bcrypt encryption context.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class VerifiedCredentialCache:
+    """Bounded, thread-safe cache of successful secret verifications.
+
+    Entries are keyed by a keyed hash of the presented secret and the stored
+    hash it was verified against. Rotating or changing a secret changes its
+    stored hash, which invalidates all cached verifications of the old
+    secret. Neither the secrets nor their hashes are kept in memory.
+    """
+
+    def __init__(
+        self,
+        max_size: int = VERIFIED_CREDENTIALS_CACHE_SIZE,
+        ttl: float = VERIFIED_CREDENTIALS_CACHE_TTL,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_size: The maximum number of cached verifications.
+            ttl: The number of seconds for which a verification is cached.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._hmac_key = os.urandom(32)
+        self._entries: "OrderedDict[bytes, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_cache_key(self, secret: str, secret_hash: str) -> bytes:
+        """Computes the cache key of a verification.
+
+        Args:
+            secret: The presented secret.
+            secret_hash: The stored hash of the secret.
+
+        Returns:
+            The cache key.
+        """
+        return hmac.new(
+            self._hmac_key,
+            secret.encode() + b"\0" + secret_hash.encode(),
+            hashlib.sha256,
+        ).digest()
+
+    def verify(self, secret: str, secret_hash: Optional[str]) -> bool:
+        """Verifies a secret against its stored hash.
+
+        Args:
+            secret: The presented secret.
+            secret_hash: The stored hash of the secret. If not set, the
+                verification always fails, but still takes as long as a
+                regular verification.
+
+        Returns:
+            True if the secret matches the hash.
+        """
+        context = get_bcrypt_context()
+        if not secret_hash:
+            return bool(context.verify(secret, None))
+
+        cache_key = self._get_cache_key(secret, secret_hash)
+        now = time.monotonic()
+        with self._lock:
+            expiration = self._entries.get(cache_key)
+            if expiration is not None:
+                if expiration > now:
+                    self._entries.move_to_end(cache_key)
+                    return True
+                del self._entries[cache_key]
+
+        if not context.verify(secret, secret_hash):
+            return False
+
+        with self._lock:
+            self._entries[cache_key] = now + self.ttl
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return True
+
+    def clear(self) -> None:
+        """Removes all cached verifications."""
+        with self._lock:
+            self._entries.clear()
+
+
+verified_credentials = VerifiedCredentialCache()
@@ -0,0 +1,268 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Pool of instantiated artifact stores for the ZenML server."""
+
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from threading import Lock
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+from typing import OrderedDict as OrderedDictType
+from uuid import UUID
+
+from zenml.logger import get_logger
+
+if TYPE_CHECKING:
+    from zenml.artifact_stores import BaseArtifactStore
+    from zenml.models import ComponentResponse
+    from zenml.zen_stores.base_zen_store import BaseZenStore
+
+logger = get_logger(__name__)
+
+ArtifactStoreVersion = Tuple[datetime, Optional[datetime]]
+
+
+class ArtifactStorePoolEntry:
+    """An instantiated artifact store held by the pool."""
+
+    def __init__(
+        self,
+        artifact_store: "BaseArtifactStore",
+        version: ArtifactStoreVersion,
+        ttl: int,
+    ) -> None:
+        """Initialize a pool entry.
+
+        Args:
+            artifact_store: The instantiated artifact store.
+            version: The version of the artifact store and its service
+                connector from which the artifact store was instantiated.
+            ttl: The time in seconds after which the entry expires.
+        """
+        self.artifact_store = artifact_store
+        self.version = version
+        self.expires_at = time.monotonic() + ttl
+        self.users = 0
+        self.evicted = False
+
+    @property
+    def expired(self) -> bool:
+        """Check if the entry can't be used for new requests anymore.
+
+        Returns:
+            True if the entry or the credentials of its service connector
+            have expired; otherwise, False.
+        """
+        if time.monotonic() >= self.expires_at:
+            return True
+
+        # Artifact stores only fetch their connector once they access their
+        # filesystem, so we only check the credentials that were already
+        # fetched
+        if self.artifact_store._connector_instance is None:
+            return False
+
+        return self.artifact_store.connector_has_expired()
+
+
+class ArtifactStorePool:
+    """Pool of long-lived artifact store instances.
+
+    Instantiating an artifact store resolves the credentials of its service
+    connector and creates the filesystem client, which is too expensive to
+    repeat for every visualization or log request. The pool instead keeps the
+    most recently used artifact stores around, keyed by their ID. An artifact
+    store is instantiated again if it or its service connector was updated,
+    if the credentials of its service connector have expired or once its TTL
+    has passed.
+
+    Artifact stores that are removed from the pool are only cleaned up once
+    all requests that are using them are done.
+
+    Usage Example:
+
+        pool = ArtifactStorePool(max_size=32, ttl=900)
+
+        with pool.artifact_store(artifact_store_id, zen_store) as store:
+            data = store.open(uri, "rb").read()
+    """
+
+    def __init__(self, max_size: int, ttl: int) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_size: The maximum number of artifact stores to keep.
+            ttl: The time in seconds after which an artifact store is
+                instantiated again.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDictType[UUID, ArtifactStorePoolEntry] = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    @contextmanager
+    def artifact_store(
+        self, artifact_store_id: UUID, zen_store: "BaseZenStore"
+    ) -> Iterator["BaseArtifactStore"]:
+        """Context manager to use a pooled artifact store.
+
+        Args:
+            artifact_store_id: The ID of the artifact store.
+            zen_store: The ZenStore to use for finding the artifact store.
+
+        Yields:
+            The artifact store.
+        """
+        entry = self._acquire(artifact_store_id, zen_store)
+        try:
+            yield entry.artifact_store
+        finally:
+            self._release(entry)
+
+    def clear(self) -> None:
+        """Remove all artifact stores from the pool."""
+        with self._lock:
+            evicted = [
+                entry for entry in self._entries.values() if self._evict(entry)
+            ]
+            self._entries.clear()
+
+        for entry in evicted:
+            self._cleanup(entry)
+
+    def _acquire(
+        self, artifact_store_id: UUID, zen_store: "BaseZenStore"
+    ) -> ArtifactStorePoolEntry:
+        """Get a pooled artifact store or instantiate a new one.
+
+        Args:
+            artifact_store_id: The ID of the artifact store.
+            zen_store: The ZenStore to use for finding the artifact store.
+
+        Returns:
+            The pool entry of the artifact store. The caller needs to release
+            it once done.
+        """
+        from zenml.artifacts.utils import (
+            _get_artifact_store_model,
+            _instantiate_artifact_store,
+        )
+
+        # Fetching the model is cheap compared to instantiating the artifact
+        # store and makes sure that updates are picked up immediately
+        model = _get_artifact_store_model(artifact_store_id, zen_store)
+        version = self._get_version(model)
+
+        with self._lock:
+            entry = self._entries.get(artifact_store_id)
+            if entry is not None:
+                if entry.version == version and not entry.expired:
+                    self._entries.move_to_end(artifact_store_id)
+                    entry.users += 1
+                    return entry
+
+                del self._entries[artifact_store_id]
+                if not self._evict(entry):
+                    entry = None
+
+        if entry is not None:
+            self._cleanup(entry)
+
+        logger.debug("Instantiating artifact store `%s`.", artifact_store_id)
+        new_entry = ArtifactStorePoolEntry(
+            artifact_store=_instantiate_artifact_store(model),
+            version=version,
+            ttl=self.ttl,
+        )
+        new_entry.users += 1
+
+        evicted: List[ArtifactStorePoolEntry] = []
+        with self._lock:
+            # Another request might have instantiated the same artifact store
+            # in the meantime, which gets replaced by the newer one
+            entry = self._entries.pop(artifact_store_id, None)
+            if entry is not None and self._evict(entry):
+                evicted.append(entry)
+
+            self._entries[artifact_store_id] = new_entry
+            while len(self._entries) > self.max_size:
+                _, entry = self._entries.popitem(last=False)
+                if self._evict(entry):
+                    evicted.append(entry)
+
+        for entry in evicted:
+            self._cleanup(entry)
+
+        return new_entry
+
+    def _release(self, entry: ArtifactStorePoolEntry) -> None:
+        """Release an artifact store after a request is done using it.
+
+        Args:
+            entry: The pool entry of the artifact store.
+        """
+        with self._lock:
+            entry.users -= 1
+            cleanup = entry.evicted and entry.users == 0
+
+        if cleanup:
+            self._cleanup(entry)
+
+    @staticmethod
+    def _evict(entry: ArtifactStorePoolEntry) -> bool:
+        """Mark an entry as removed from the pool.
+
+        The caller must hold the lock and have removed the entry from the pool
+        already.
+
+        Args:
+            entry: The pool entry to evict.
+
+        Returns:
+            Whether the entry is not in use and its artifact store needs to be
+            cleaned up by the caller.
+        """
+        entry.evicted = True
+        return entry.users == 0
+
+    @staticmethod
+    def _cleanup(entry: ArtifactStorePoolEntry) -> None:
+        """Clean up the artifact store of an entry.
+
+        Args:
+            entry: The pool entry to clean up.
+        """
+        try:
+            entry.artifact_store.cleanup()
+        except Exception:
+            logger.exception(
+                "Failed to clean up artifact store `%s`.",
+                entry.artifact_store.id,
+            )
+
+    @staticmethod
+    def _get_version(model: "ComponentResponse") -> ArtifactStoreVersion:
+        """Get the version of an artifact store and its service connector.
+
+        Args:
+            model: The artifact store model.
+
+        Returns:
+            The update times of the artifact store and its service connector.
+        """
+        connector = model.connector
+        return model.updated, connector.updated if connector else None
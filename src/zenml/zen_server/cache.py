@@ -13,32 +13,40 @@
 #  permissions and limitations under the License.
 """Memory cache module for the ZenML server."""
 
+import heapq
+import itertools
+import math
 import time
 from collections import OrderedDict
 from threading import Lock
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 from typing import OrderedDict as OrderedDictType
-from uuid import UUID
 
 from zenml.logger import get_logger
-from zenml.utils.singleton import SingletonMetaClass
 
 logger = get_logger(__name__)
 
+DEFAULT_NAMESPACE = "default"
+DEFAULT_NUM_SHARDS = 16
+
 
 class MemoryCacheEntry:
     """Simple class to hold cache entry data."""
 
-    def __init__(self, value: Any, expiry: int) -> None:
+    def __init__(self, value: Any, expiry: int, sequence: int = 0) -> None:
         """Initialize a cache entry with value and expiry time.
 
         Args:
             value: The value to store in the cache.
             expiry: The expiry time in seconds.
+            sequence: Sequence number which identifies the entry in the
+                expiry heap of its shard.
         """
         self.value: Any = value
         self.expiry: int = expiry
-        self.timestamp: float = time.time()
+        self.timestamp: float = time.monotonic()
+        self.expires_at: float = self.timestamp + expiry
+        self.sequence = sequence
 
     @property
     def expired(self) -> bool:
@@ -47,30 +55,126 @@ class MemoryCacheEntry:
         Returns:
             True if the cache entry has expired; otherwise, False.
         """
-        return time.time() - self.timestamp >= self.expiry
+        return time.monotonic() >= self.expires_at
 
 
-class MemoryCache(metaclass=SingletonMetaClass):
-    """Simple in-memory cache with expiry and capacity management.
+class _MemoryCacheShard:
+    """A shard of a cache namespace with its own lock.
 
-    This cache is thread-safe and can be used in both synchronous and
-    asynchronous contexts. It uses a simple LRU (Least Recently Used) eviction
-    strategy to manage the cache size.
+    Entries are kept in LRU order. Their expiry times are additionally
+    tracked in a min-heap, so that expired entries can be removed without
+    scanning all entries.
+    """
+
+    def __init__(self, max_capacity: int) -> None:
+        """Initialize the shard.
+
+        Args:
+            max_capacity: The maximum number of entries of the shard.
+        """
+        self.max_capacity = max_capacity
+        self.entries: OrderedDictType[Hashable, MemoryCacheEntry] = (
+            OrderedDict()
+        )
+        self.expiry_heap: List[Tuple[float, int, Hashable]] = []
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retrieve a value if it's still valid.
+
+        Args:
+            key: The key to retrieve the value for.
+
+        Returns:
+            The value if it's still valid; otherwise, None.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expired:
+                del self.entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: Hashable, entry: MemoryCacheEntry) -> None:
+        """Insert an entry and remove expired or excess entries.
+
+        Args:
+            key: The key to insert the entry with.
+            entry: The entry to insert.
+        """
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            heapq.heappush(
+                self.expiry_heap, (entry.expires_at, entry.sequence, key)
+            )
+            self._remove_expired()
+
+            while len(self.entries) > self.max_capacity:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+            # Drop heap items of replaced or evicted entries once they
+            # dominate the heap, which keeps the cost amortized constant
+            if len(self.expiry_heap) > 2 * len(self.entries) + 16:
+                self.expiry_heap = [
+                    (entry.expires_at, entry.sequence, key)
+                    for key, entry in self.entries.items()
+                ]
+                heapq.heapify(self.expiry_heap)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove an entry.
 
-    Each cache entry has a key, value, timestamp, and expiry. The cache
-    automatically removes expired entries and evicts the oldest entry when
-    the cache reaches its maximum capacity.
+        Args:
+            key: The key of the entry to remove.
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def _remove_expired(self) -> None:
+        """Remove the expired entries, in order of their expiry time."""
+        now = time.monotonic()
+        while self.expiry_heap and self.expiry_heap[0][0] <= now:
+            _, sequence, key = heapq.heappop(self.expiry_heap)
+            entry = self.entries.get(key)
+            # Skip heap items of entries that were replaced in the meantime
+            if entry is not None and entry.sequence == sequence:
+                del self.entries[key]
+                self.expirations += 1
 
 
+class MemoryCache:
+    """In-memory cache with expiry and capacity management.
+
+    This cache is thread-safe and can be used in both synchronous and
+    asynchronous contexts. Entries are grouped into namespaces, each with its
+    own capacity. Every namespace is split into shards by key hash, each
+    shard guarded by its own lock, so that concurrent requests rarely contend
+    on the same lock. Shards use an LRU (Least Recently Used) eviction
+    strategy and remove expired entries in amortized constant time.
+
     Usage Example:
 
-        cache = MemoryCache()
+        cache = MemoryCache(max_capacity=1000, default_expiry=30)
         uuid_key = UUID("12345678123456781234567812345678")
 
-        if not cache.get(uuid_key):
+        if not cache.get(uuid_key, namespace="schedules"):
             # Get the value from the database or other source
             value = get_value_from_database()
-            cache.set(uuid_key, value, expiry=60)
+            cache.set(uuid_key, value, expiry=60, namespace="schedules")
 
     Usage Example with decorator:
 
@@ -83,87 +187,162 @@ class MemoryCache(metaclass=SingletonMetaClass):
         value = get_cached_value(uuid_key)
     """
 
-    def __init__(self, max_capacity: int, default_expiry: int) -> None:
+    def __init__(
+        self,
+        max_capacity: int,
+        default_expiry: int,
+        num_shards: int = DEFAULT_NUM_SHARDS,
+    ) -> None:
         """Initialize the cache with a maximum capacity and default expiry time.
 
         Args:
-            max_capacity: The maximum number of entries the cache can hold.
+            max_capacity: The default maximum number of entries that each
+                namespace can hold.
             default_expiry: The default expiry time in seconds.
+            num_shards: The number of shards of each namespace.
         """
-        self.cache: OrderedDictType[UUID, MemoryCacheEntry] = OrderedDict()
         self.max_capacity = max_capacity
         self.default_expiry = default_expiry
-        self._lock = Lock()
+        self.num_shards = num_shards
+        self._namespaces: Dict[str, List[_MemoryCacheShard]] = {}
+        self._namespaces_lock = Lock()
+        self._sequence = itertools.count()
+
+    def register_namespace(self, namespace: str, max_capacity: int) -> None:
+        """Create a namespace with a custom capacity.
+
+        Namespaces that are not registered explicitly are created with the
+        default capacity when they are first used. Registering an existing
+        namespace again clears it.
+
+        Args:
+            namespace: The name of the namespace.
+            max_capacity: The maximum number of entries that the namespace
+                can hold.
+        """
+        shard_capacity = max(1, math.ceil(max_capacity / self.num_shards))
+        with self._namespaces_lock:
+            self._namespaces[namespace] = [
+                _MemoryCacheShard(shard_capacity)
+                for _ in range(self.num_shards)
+            ]
+
+    def _get_shard(self, key: Hashable, namespace: str) -> _MemoryCacheShard:
+        """Get the shard which stores a key.
 
-    def set(self, key: UUID, value: Any, expiry: Optional[int] = None) -> None:
+        Args:
+            key: The key.
+            namespace: The namespace of the key.
+
+        Returns:
+            The shard for the key.
+        """
+        shards = self._namespaces.get(namespace)
+        if shards is None:
+            with self._namespaces_lock:
+                if namespace not in self._namespaces:
+                    shard_capacity = max(
+                        1, math.ceil(self.max_capacity / self.num_shards)
+                    )
+                    self._namespaces[namespace] = [
+                        _MemoryCacheShard(shard_capacity)
+                        for _ in range(self.num_shards)
+                    ]
+                shards = self._namespaces[namespace]
+
+        return shards[hash(key) % self.num_shards]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        expiry: Optional[int] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+    ) -> None:
         """Insert value into cache with optional custom expiry time in seconds.
 
         Args:
             key: The key to insert the value with.
             value: The value to insert into the cache.
             expiry: The expiry time in seconds. If None, uses the default expiry.
+            namespace: The namespace of the key.
         """
-        with self._lock:
-            self.cache[key] = MemoryCacheEntry(
-                value=value, expiry=expiry or self.default_expiry
-            )
-            self._cleanup()
-
-    def get(self, key: UUID) -> Optional[Any]:
+        entry = MemoryCacheEntry(
+            value=value,
+            expiry=expiry or self.default_expiry,
+            sequence=next(self._sequence),
+        )
+        self._get_shard(key, namespace).set(key, entry)
+
+    def get(
+        self, key: Hashable, namespace: str = DEFAULT_NAMESPACE
+    ) -> Optional[Any]:
         """Retrieve value if it's still valid; otherwise, return None.
 
         Args:
             key: The key to retrieve the value for.
+            namespace: The namespace of the key.
 
         Returns:
             The value if it's still valid; otherwise, None.
         """
-        with self._lock:
-            return self._get_internal(key)
+        return self._get_shard(key, namespace).get(key)
 
-    def _get_internal(self, key: UUID) -> Optional[Any]:
-        """Helper to retrieve a value without lock (internal use only).
+    def delete(
+        self, key: Hashable, namespace: str = DEFAULT_NAMESPACE
+    ) -> None:
+        """Remove a value from the cache.
 
         Args:
-            key: The key to retrieve the value for.
+            key: The key of the value to remove.
+            namespace: The namespace of the key.
+        """
+        self._get_shard(key, namespace).delete(key)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get the size and hit/miss/eviction counters of all namespaces.
 
         Returns:
-            The value if it's still valid; otherwise, None.
+            The statistics of each namespace.
         """
-        entry = self.cache.get(key)
-        if entry and not entry.expired:
-            return entry.value
-        elif entry:
-            del self.cache[key]  # Invalidate expired entry
-        return None
+        with self._namespaces_lock:
+            namespaces = dict(self._namespaces)
 
-    def _cleanup(self) -> None:
-        """Remove expired or excess entries."""
-        # Remove expired entries
-        keys_to_remove = [k for k, v in self.cache.items() if v.expired]
-        for k in keys_to_remove:
-            del self.cache[k]
+        stats: Dict[str, Dict[str, int]] = {}
+        for namespace, shards in namespaces.items():
+            namespace_stats = dict.fromkeys(
+                ("size", "hits", "misses", "evictions", "expirations"), 0
+            )
+            for shard in shards:
+                with shard.lock:
+                    namespace_stats["size"] += len(shard.entries)
+                    namespace_stats["hits"] += shard.hits
+                    namespace_stats["misses"] += shard.misses
+                    namespace_stats["evictions"] += shard.evictions
+                    namespace_stats["expirations"] += shard.expirations
+            stats[namespace] = namespace_stats
 
-        # Ensure we don't exceed max capacity
-        while len(self.cache) > self.max_capacity:
-            self.cache.popitem(last=False)
+        return stats
 
 
-F = Callable[[UUID], Any]
+F = Callable[[Any], Any]
 
 
 def cache_result(
     expiry: Optional[int] = None,
+    namespace: Optional[str] = None,
 ) -> Callable[[F], F]:
-    """A decorator to cache the result of a function based on a UUID key argument.
+    """A decorator to cache the result of a function based on a key argument.
 
     Args:
         expiry: Custom time in seconds for the cache entry to expire. If None,
             uses the default expiry time.
+        namespace: The cache namespace in which to store the results. If
+            None, the qualified name of the function is used.
 
     Returns:
-        A decorator that wraps a function, caching its results based on a UUID
-        key.
+        A decorator that wraps a function, caching its results based on a
+        hashable key.
     """
 
     def decorator(func: F) -> F:
@@ -175,8 +354,9 @@ def cache_result(
         Returns:
             The wrapped function with caching logic.
         """
+        cache_namespace = namespace or func.__qualname__
 
-        def wrapper(key: UUID) -> Any:
+        def wrapper(key: Hashable) -> Any:
             """The wrapped function with caching logic.
 
             Args:
@@ -191,7 +371,7 @@ def cache_result(
             cache = memcache()
 
             # Attempt to retrieve the result from cache
-            cached_value = cache.get(key)
+            cached_value = cache.get(key, namespace=cache_namespace)
             if cached_value is not None:
                 logger.debug(
                     f"Memory cache hit for key: {key} and func: {func.__name__}"
@@ -200,7 +380,7 @@ def cache_result(
 
             # Call the original function and cache its result
             result = func(key)
-            cache.set(key, result, expiry)
+            cache.set(key, result, expiry, namespace=cache_namespace)
             return result
 
         return wrapper
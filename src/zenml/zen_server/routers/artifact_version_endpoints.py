@@ -13,13 +13,30 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for artifact versions."""
 
-from typing import List
+import mimetypes
+import re
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Header, Query, Security
+from fastapi.responses import Response, StreamingResponse
 
-from zenml.artifacts.utils import load_artifact_visualization
-from zenml.constants import API, ARTIFACT_VERSIONS, BATCH, VERSION_1, VISUALIZE
+from zenml.artifacts.utils import (
+    _get_artifact_visualization,
+    get_artifact_visualization_size,
+    load_artifact_visualization,
+    preview_artifact_visualization,
+    stream_artifact_visualization,
+)
+from zenml.constants import (
+    API,
+    ARTIFACT_VERSIONS,
+    BATCH,
+    STREAM,
+    VERSION_1,
+    VISUALIZE,
+)
+from zenml.enums import VisualizationType
 from zenml.models import (
     ArtifactVersionFilter,
     ArtifactVersionRequest,
@@ -49,6 +66,19 @@ from zenml.zen_server.utils import (
     zen_store,
 )
 
+# Visualizations of an artifact version never change, so they can be cached
+# by the client for a long time
+VISUALIZATION_CACHE_CONTROL = "private, max-age=604800, immutable"
+
+VISUALIZATION_MEDIA_TYPES = {
+    VisualizationType.CSV: "text/csv",
+    VisualizationType.HTML: "text/html",
+    VisualizationType.JSON: "application/json",
+    VisualizationType.MARKDOWN: "text/markdown",
+}
+
+BYTE_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
 artifact_version_router = APIRouter(
     prefix=API + VERSION_1 + ARTIFACT_VERSIONS,
     tags=["artifact_versions"],
@@ -269,3 +299,178 @@ def get_artifact_visualization(
     return load_artifact_visualization(
         artifact=artifact, index=index, zen_store=store, encode_image=True
     )
+
+
+@artifact_version_router.get(
+    "/{artifact_version_id}" + VISUALIZE + STREAM,
+    response_class=StreamingResponse,
+    responses={
+        401: error_response,
+        404: error_response,
+        416: error_response,
+        422: error_response,
+    },
+)
+@handle_exceptions
+def stream_artifact_visualization_content(
+    artifact_version_id: UUID,
+    index: int = 0,
+    max_rows: Optional[int] = Query(None, ge=0),
+    max_image_size: Optional[int] = Query(None, ge=1),
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_none_match: Optional[str] = Header(None),
+    _: AuthContext = Security(authorize),
+) -> Response:
+    """Download the raw content of an artifact visualization.
+
+    In contrast to the visualize endpoint, the visualization is streamed as
+    is instead of being loaded into memory and wrapped in a JSON response.
+    Single byte range requests are supported, so that clients can download
+    large visualizations in parts.
+
+    Args:
+        artifact_version_id: ID of the artifact version for which to get the
+            visualization.
+        index: Index of the visualization to get (if there are multiple).
+        max_rows: If given, only the header and the first `max_rows` rows of
+            CSV visualizations are returned.
+        max_image_size: If given, image visualizations are downsampled so that
+            their width and height don't exceed this number of pixels.
+        range_header: The `Range` header of the request.
+        if_none_match: The `If-None-Match` header of the request.
+
+    Returns:
+        The content of the visualization.
+    """
+    store = zen_store()
+    artifact = verify_permissions_and_get_entity(
+        id=artifact_version_id, get_method=store.get_artifact_version
+    )
+    visualization = _get_artifact_visualization(artifact=artifact, index=index)
+
+    media_type = VISUALIZATION_MEDIA_TYPES.get(visualization.type)
+    if visualization.type == VisualizationType.IMAGE:
+        media_type = mimetypes.guess_type(visualization.uri)[0]
+
+    etag = f'"{artifact_version_id}-{index}'
+    if max_rows is not None and visualization.type == VisualizationType.CSV:
+        etag += f"-rows-{max_rows}"
+    if (
+        max_image_size is not None
+        and visualization.type == VisualizationType.IMAGE
+    ):
+        etag += f"-size-{max_image_size}"
+    etag += '"'
+
+    headers = {"Cache-Control": VISUALIZATION_CACHE_CONTROL, "ETag": etag}
+    if if_none_match and _etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+
+    preview = preview_artifact_visualization(
+        artifact=artifact,
+        index=index,
+        zen_store=store,
+        max_rows=max_rows,
+        max_image_size=max_image_size,
+    )
+    if preview is not None:
+        return Response(
+            content=preview,
+            media_type=media_type or "application/octet-stream",
+            headers=headers,
+        )
+
+    size = get_artifact_visualization_size(
+        artifact=artifact, index=index, zen_store=store
+    )
+    status_code, offset, length = 200, 0, size
+    if size is not None:
+        headers["Accept-Ranges"] = "bytes"
+        try:
+            byte_range = _parse_byte_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=416, headers={"Content-Range": f"bytes */{size}"}
+            )
+        if byte_range:
+            offset, end = byte_range
+            length = end - offset + 1
+            status_code = 206
+            headers["Content-Range"] = f"bytes {offset}-{end}/{size}"
+            # Partial content must not be compressed by the GZip middleware
+            headers["Content-Encoding"] = "identity"
+        headers["Content-Length"] = str(length)
+
+    return StreamingResponse(
+        stream_artifact_visualization(
+            artifact=artifact,
+            index=index,
+            zen_store=store,
+            offset=offset,
+            length=length,
+        ),
+        status_code=status_code,
+        media_type=media_type or "application/octet-stream",
+        headers=headers,
+    )
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Check if an ETag matches an `If-None-Match` header.
+
+    Args:
+        etag: The ETag of the response.
+        if_none_match: The `If-None-Match` header of the request.
+
+    Returns:
+        Whether the ETag matches any of the ETags of the header. Weak ETags
+        are compared as if they were strong ones.
+    """
+    return any(
+        tag == "*" or tag.removeprefix("W/") == etag
+        for tag in (tag.strip() for tag in if_none_match.split(","))
+    )
+
+
+def _parse_byte_range(
+    range_header: Optional[str], size: int
+) -> Optional[Tuple[int, int]]:
+    """Parse the `Range` header of a request.
+
+    Only single byte ranges are supported. Other ranges are ignored, in which
+    case the whole content is returned.
+
+    Args:
+        range_header: The `Range` header of the request.
+        size: The size of the requested content in bytes.
+
+    Returns:
+        The first and last byte of the requested range or `None` if the whole
+        content should be returned.
+
+    Raises:
+        ValueError: If the requested range can't be satisfied.
+    """
+    if not range_header:
+        return None
+
+    match = BYTE_RANGE_PATTERN.match(range_header.strip())
+    if not match or not any(match.groups()):
+        return None
+
+    first, last = match.groups()
+    if not first:
+        # Suffix range which requests the last bytes of the content
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        if last and int(last) < start:
+            # Invalid ranges are ignored
+            return None
+        end = min(int(last), size - 1) if last else size - 1
+
+    if start >= size or end < start:
+        raise ValueError(
+            f"Range '{range_header}' can't be satisfied for {size} bytes."
+        )
+    return start, end
@@ -39,7 +39,12 @@ from zenml.models import (
 )
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
-from zenml.zen_server.utils import handle_exceptions, server_config, zen_store
+from zenml.zen_server.utils import (
+    handle_exceptions,
+    memcache,
+    server_config,
+    zen_store,
+)
 
 router = APIRouter(
     prefix=API + VERSION_1,
@@ -70,7 +75,10 @@ def server_info() -> ServerModel:
     Returns:
         Information about the server.
     """
-    return zen_store().get_store_info()
+    store_info = zen_store().get_store_info()
+    # Request bodies are decompressed by the server middleware
+    store_info.supports_request_compression = True
+    return store_info
 
 
 @router.get(
@@ -98,6 +106,7 @@ def server_load_info(_: AuthContext = Security(authorize)) -> ServerLoadInfo:
             db_connections_total=0,
             db_connections_active=0,
             db_connections_overflow=0,
+            memcache=memcache().stats(),
         )
 
     from sqlalchemy.pool import QueuePool
@@ -115,6 +124,7 @@ def server_load_info(_: AuthContext = Security(authorize)) -> ServerLoadInfo:
         db_connections_total=total_conn,
         db_connections_active=active_conn,
         db_connections_overflow=overflow_conn,
+        memcache=memcache().stats(),
     )
 
 
@@ -13,24 +13,32 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Security
+from fastapi.responses import StreamingResponse
 
 from zenml.constants import (
     API,
+    BATCH,
+    CACHED,
+    FINALIZE,
     LOGS,
     STATUS,
     STEP_CONFIGURATION,
     STEPS,
+    STREAM,
     VERSION_1,
 )
-from zenml.enums import ExecutionStatus
-from zenml.logging.step_logging import fetch_logs
+from zenml.enums import ExecutionStatus, MetadataResourceTypes
+from zenml.exceptions import IllegalOperationError
+from zenml.logging.step_logging import fetch_logs, stream_logs_async
 from zenml.models import (
+    LogsResponse,
     Page,
     StepRunFilter,
+    StepRunFinalizeRequest,
     StepRunRequest,
     StepRunResponse,
     StepRunUpdate,
@@ -42,6 +50,7 @@ from zenml.zen_server.rbac.utils import (
     dehydrate_page,
     dehydrate_response_model,
     get_allowed_resource_ids,
+    verify_permission,
     verify_permission_for_model,
 )
 from zenml.zen_server.utils import (
@@ -121,6 +130,69 @@ def create_run_step(
     return dehydrate_response_model(step_response)
 
 
+@router.post(
+    BATCH,
+    response_model=List[StepRunResponse],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def batch_create_run_steps(
+    steps: List[StepRunRequest],
+    _: AuthContext = Security(authorize),
+) -> List[StepRunResponse]:
+    """Create a batch of run steps.
+
+    Args:
+        steps: The run steps to create.
+
+    Returns:
+        The created run steps.
+    """
+    for pipeline_run_id in {step.pipeline_run_id for step in steps}:
+        pipeline_run = zen_store().get_run(pipeline_run_id)
+        verify_permission_for_model(pipeline_run, action=Action.UPDATE)
+
+    step_responses = zen_store().batch_create_run_steps(step_runs=steps)
+    return [
+        dehydrate_response_model(step_response)
+        for step_response in step_responses
+    ]
+
+
+@router.post(
+    CACHED,
+    response_model=Dict[str, StepRunResponse],
+    responses={401: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_cached_step_runs(
+    cache_keys: List[str],
+    workspace_id: UUID,
+    _: AuthContext = Security(authorize),
+) -> Dict[str, StepRunResponse]:
+    """Get the step runs that can be used as cache for the given keys.
+
+    Args:
+        cache_keys: The cache keys for which to get the step runs.
+        workspace_id: The ID of the workspace in which to look for step runs.
+
+    Returns:
+        The cached step runs which the user is allowed to read, keyed by
+        their cache key.
+    """
+    cached_step_runs = zen_store().get_cached_step_runs(
+        cache_keys=cache_keys,
+        workspace_id=workspace_id,
+        allowed_pipeline_run_ids=get_allowed_resource_ids(
+            resource_type=ResourceType.PIPELINE_RUN
+        ),
+    )
+    return {
+        cache_key: dehydrate_response_model(step_run)
+        for cache_key, step_run in cached_step_runs.items()
+    }
+
+
 @router.get(
     "/{step_id}",
     response_model=StepRunResponse,
@@ -185,6 +257,76 @@ def update_step(
     return dehydrate_response_model(updated_step)
 
 
+@router.post(
+    "/{step_id}" + FINALIZE,
+    response_model=StepRunResponse,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def finalize_step(
+    step_id: UUID,
+    finalize_request: StepRunFinalizeRequest,
+    auth_context: AuthContext = Security(authorize),
+) -> StepRunResponse:
+    """Publishes the results of a step in a single request.
+
+    Args:
+        step_id: ID of the step.
+        finalize_request: The results of the step.
+        auth_context: Authentication context.
+
+    Returns:
+        The updated step model.
+
+    Raises:
+        IllegalOperationError: If the artifact versions or run metadata are
+            created for a different user, or the run metadata is not created
+            for this step.
+    """
+    step = zen_store().get_run_step(step_id, hydrate=False)
+    pipeline_run = zen_store().get_run(step.pipeline_run_id, hydrate=False)
+    verify_permission_for_model(pipeline_run, action=Action.UPDATE)
+
+    requests: List[Any] = [
+        *finalize_request.output_artifacts.values(),
+        *finalize_request.run_metadata,
+    ]
+    if any(request.user != auth_context.user.id for request in requests):
+        raise IllegalOperationError(
+            "Creating artifact versions or run metadata for a user other "
+            "than yourself is not supported."
+        )
+
+    for run_metadata in finalize_request.run_metadata:
+        if any(
+            resource.type != MetadataResourceTypes.STEP_RUN
+            or resource.id != step_id
+            for resource in run_metadata.resources
+        ):
+            raise IllegalOperationError(
+                "Only run metadata of the finalized step can be created."
+            )
+
+    if finalize_request.output_artifacts:
+        verify_permission(
+            resource_type=ResourceType.ARTIFACT_VERSION, action=Action.CREATE
+        )
+    if finalize_request.run_metadata:
+        verify_permission(
+            resource_type=ResourceType.RUN_METADATA, action=Action.CREATE
+        )
+    if finalize_request.model_version_id:
+        model_version = zen_store().get_model_version(
+            finalize_request.model_version_id, hydrate=False
+        )
+        verify_permission_for_model(model_version, action=Action.UPDATE)
+
+    updated_step = zen_store().finalize_step_run(
+        step_run_id=step_id, finalize_request=finalize_request
+    )
+    return dehydrate_response_model(updated_step)
+
+
 @router.get(
     "/{step_id}" + STEP_CONFIGURATION,
     response_model=Dict[str, Any],
@@ -245,7 +387,7 @@ def get_step_logs(
     step_id: UUID,
     offset: int = 0,
     length: int = 1024 * 1024 * 16,  # Default to 16MiB of data
-    _: AuthContext = Security(authorize),
+    auth_context: AuthContext = Security(authorize),
 ) -> str:
     """Get the logs of a specific step.
 
@@ -253,6 +395,75 @@ def get_step_logs(
         step_id: ID of the step for which to get the logs.
         offset: The offset from which to start reading.
         length: The amount of bytes that should be read.
+        auth_context: Authentication context.
+
+    Returns:
+        The logs of the step.
+    """
+    logs = _get_readable_step_logs(step_id, auth_context=auth_context)
+    return fetch_logs(
+        zen_store=zen_store(),
+        artifact_store_id=logs.artifact_store_id,
+        logs_uri=logs.uri,
+        offset=offset,
+        length=length,
+    )
+
+
+@router.get(
+    "/{step_id}" + LOGS + STREAM,
+    response_class=StreamingResponse,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def stream_step_logs(
+    step_id: UUID,
+    offset: int = 0,
+    follow: bool = False,
+    auth_context: AuthContext = Security(authorize),
+) -> StreamingResponse:
+    """Stream the logs of a specific step.
+
+    Args:
+        step_id: ID of the step for which to stream the logs.
+        offset: The offset from which to start reading. Negative offsets are
+            relative to the end of the logs.
+        follow: Whether to keep streaming new logs until the step finished
+            or no new logs were written for a while.
+        auth_context: Authentication context.
+
+    Returns:
+        The streamed logs of the step.
+    """
+    logs = _get_readable_step_logs(step_id, auth_context=auth_context)
+    store = zen_store()
+
+    def _is_running() -> bool:
+        return not store.get_run_step_status(step_id).is_finished
+
+    return StreamingResponse(
+        stream_logs_async(
+            zen_store=store,
+            artifact_store_id=logs.artifact_store_id,
+            logs_uri=logs.uri,
+            offset=offset,
+            is_running=_is_running if follow else None,
+        ),
+        media_type="text/plain",
+    )
+
+
+def _get_readable_step_logs(
+    step_id: UUID, auth_context: AuthContext
+) -> LogsResponse:
+    """Get the logs of a step after verifying the user is allowed to read them.
+
+    Only the IDs required to verify the permissions are loaded instead of the
+    whole step and pipeline run.
+
+    Args:
+        step_id: ID of the step for which to get the logs.
+        auth_context: Authentication context.
 
     Returns:
         The logs of the step.
@@ -260,20 +471,19 @@ def get_step_logs(
     Raises:
         HTTPException: If no logs are available for this step.
     """
-    step = zen_store().get_run_step(step_id, hydrate=True)
-    pipeline_run = zen_store().get_run(step.pipeline_run_id)
-    verify_permission_for_model(pipeline_run, action=Action.READ)
+    pipeline_run_id, owner_id, logs = zen_store().get_run_step_logs(step_id)
+
+    # Runs without an owner are server-owned and the owner of a run always
+    # has permissions to read it
+    if owner_id is not None and owner_id != auth_context.user.id:
+        verify_permission(
+            resource_type=ResourceType.PIPELINE_RUN,
+            action=Action.READ,
+            resource_id=pipeline_run_id,
+        )
 
-    store = zen_store()
-    logs = step.logs
     if logs is None:
         raise HTTPException(
             status_code=404, detail="No logs available for this step"
         )
-    return fetch_logs(
-        zen_store=store,
-        artifact_store_id=logs.artifact_store_id,
-        logs_uri=logs.uri,
-        offset=offset,
-        length=length,
-    )
+    return logs
@@ -45,6 +45,7 @@ from zenml.enums import StoreType
 from zenml.exceptions import IllegalOperationError, OAuthError
 from zenml.logger import get_logger
 from zenml.plugins.plugin_flavor_registry import PluginFlavorRegistry
+from zenml.zen_server.artifact_store_pool import ArtifactStorePool
 from zenml.zen_server.cache import MemoryCache
 from zenml.zen_server.deploy.deployment import (
     LocalServerDeployment,
@@ -71,6 +72,7 @@ _feature_gate: Optional[FeatureGateInterface] = None
 _workload_manager: Optional[WorkloadManagerInterface] = None
 _plugin_flavor_registry: Optional[PluginFlavorRegistry] = None
 _memcache: Optional[MemoryCache] = None
+_artifact_store_pool: Optional[ArtifactStorePool] = None
 
 
 def zen_store() -> "SqlZenStore":
@@ -251,6 +253,32 @@ def memcache() -> MemoryCache:
     return _memcache
 
 
+def initialize_artifact_store_pool(max_size: int, ttl: int) -> None:
+    """Initialize the artifact store pool.
+
+    Args:
+        max_size: The maximum number of artifact stores to keep.
+        ttl: The time in seconds after which an artifact store is instantiated
+            again.
+    """
+    global _artifact_store_pool
+    _artifact_store_pool = ArtifactStorePool(max_size, ttl)
+
+
+def artifact_store_pool() -> ArtifactStorePool:
+    """Return the artifact store pool.
+
+    Returns:
+        The artifact store pool.
+
+    Raises:
+        RuntimeError: If the artifact store pool is not initialized.
+    """
+    if _artifact_store_pool is None:
+        raise RuntimeError("Artifact store pool not initialized")
+    return _artifact_store_pool
+
+
 _server_config: Optional[ServerConfiguration] = None
 
 
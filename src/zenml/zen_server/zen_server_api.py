@@ -20,7 +20,9 @@ To run this file locally, execute:
     ```
 """
 
+import hashlib
 import os
+import zlib
 from asyncio.log import logger
 from datetime import datetime, timedelta
 from genericpath import isfile
@@ -30,20 +32,24 @@ from anyio import to_thread
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.datastructures import Headers
 from starlette.middleware.base import (
     BaseHTTPMiddleware,
     RequestResponseEndpoint,
 )
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.responses import (
     FileResponse,
     JSONResponse,
     RedirectResponse,
     Response,
+    StreamingResponse,
 )
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 import zenml
 from zenml.analytics import source_context
@@ -51,9 +57,10 @@ from zenml.constants import (
     API,
     DEFAULT_ZENML_SERVER_REPORT_USER_ACTIVITY_TO_DB_SECONDS,
     HEALTH,
+    HTTP_COMPRESSION_MINIMUM_SIZE,
 )
 from zenml.enums import AuthScheme, SourceContextTypes
-from zenml.models import ServerDeploymentType
+from zenml.models import Page, ServerDeploymentType
 from zenml.utils.time_utils import utc_now
 from zenml.zen_server.cloud_utils import send_pro_tenant_status_update
 from zenml.zen_server.exceptions import error_detail
@@ -96,6 +103,7 @@ from zenml.zen_server.secure_headers import (
     secure_headers,
 )
 from zenml.zen_server.utils import (
+    initialize_artifact_store_pool,
     initialize_feature_gate,
     initialize_memcache,
     initialize_plugins,
@@ -241,6 +249,177 @@ class RestrictFileUploadsMiddleware(BaseHTTPMiddleware):
             )
 
 
+class ConditionalGetMiddleware(BaseHTTPMiddleware):
+    """Add ETags to JSON responses and answer conditional GET requests."""
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        """Add an ETag to the response and return 304 if it is unchanged.
+
+        The ETag is a hash of the response body, so it changes whenever the
+        returned resource (or its representation) changes. List and streaming
+        routes are skipped: the body of list responses rarely stays the same
+        and streamed responses must not be buffered in memory. Responses that
+        already have an ETag keep it.
+
+        Args:
+            request: The incoming request.
+            call_next: The next function to be called.
+
+        Returns:
+            The response to the request.
+        """
+        response = await call_next(request)
+        if (
+            request.method != "GET"
+            or response.status_code != 200
+            or "etag" in response.headers
+            or not response.headers.get("content-type", "").startswith(
+                "application/json"
+            )
+            or not self._is_entity_route(request.scope.get("route"))
+        ):
+            return response
+
+        chunks: List[bytes] = []
+        async for chunk in response.body_iterator:  # type: ignore[attr-defined]
+            chunks.append(
+                chunk if isinstance(chunk, bytes) else chunk.encode()
+            )
+        body = b"".join(chunks)
+
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        headers = dict(response.headers)
+        headers["ETag"] = etag
+
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ):
+            headers.pop("content-length", None)
+            headers.pop("content-type", None)
+            return Response(status_code=304, headers=headers)
+
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=headers,
+            background=response.background,
+        )
+
+    @staticmethod
+    def _is_entity_route(route: Any) -> bool:
+        """Check if a route returns a single entity as JSON.
+
+        Args:
+            route: The route that handled the request.
+
+        Returns:
+            False for list and streaming routes; otherwise, True.
+        """
+        if not isinstance(route, APIRoute):
+            return False
+
+        response_class = route.response_class
+        if isinstance(response_class, type) and issubclass(
+            response_class, StreamingResponse
+        ):
+            return False
+
+        response_model = route.response_model
+        return not (
+            isinstance(response_model, type)
+            and issubclass(response_model, Page)
+        )
+
+
+class GZipRequestMiddleware:
+    """Decompress gzip encoded request bodies."""
+
+    def __init__(self, app: ASGIApp, max_bytes: int) -> None:
+        """Decompress gzip encoded request bodies.
+
+        Args:
+            app: The ASGI app.
+            max_bytes: The maximum size of the compressed and the
+                decompressed request body.
+        """
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Decompress the request body if it is gzip encoded.
+
+        Args:
+            scope: The ASGI scope.
+            receive: The ASGI receive function.
+            send: The ASGI send function.
+        """
+        if (
+            scope["type"] != "http"
+            or Headers(scope=scope).get("content-encoding", "").lower()
+            != "gzip"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        chunks: List[bytes] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            chunks.append(chunk)
+            size += len(chunk)
+            more_body = message.get("more_body", False)
+            if size > self.max_bytes:
+                await Response(status_code=413)(scope, receive, send)
+                return
+
+        # Decompress at most one byte more than allowed to detect bodies that
+        # exceed the limit without decompressing them completely
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            data = decompressor.decompress(
+                b"".join(chunks), self.max_bytes + 1
+            )
+        except zlib.error:
+            data = None
+
+        if data is not None and len(data) > self.max_bytes:
+            await Response(status_code=413)(scope, receive, send)
+            return
+
+        if data is None or not decompressor.eof:
+            # Truncated bodies decompress without errors, but never reach the
+            # end of the gzip stream
+            await Response(
+                "Invalid gzip encoded request body.", status_code=400
+            )(scope, receive, send)
+            return
+
+        scope = dict(scope)
+        scope["headers"] = [
+            (key, value)
+            for key, value in scope["headers"]
+            if key not in (b"content-encoding", b"content-length")
+        ] + [(b"content-length", str(len(data)).encode())]
+
+        body_sent = False
+
+        async def _receive() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": data, "more_body": False}
+
+        await self.app(scope, _receive, send)
+
+
 ALLOWED_FOR_FILE_UPLOAD: Set[str] = set()
 
 app.add_middleware(
@@ -257,6 +436,12 @@ app.add_middleware(
 app.add_middleware(
     RestrictFileUploadsMiddleware, allowed_paths=ALLOWED_FOR_FILE_UPLOAD
 )
+app.add_middleware(ConditionalGetMiddleware)
+app.add_middleware(
+    GZipRequestMiddleware,
+    max_bytes=server_config().max_request_body_size_in_bytes,
+)
+app.add_middleware(GZipMiddleware, minimum_size=HTTP_COMPRESSION_MINIMUM_SIZE)
 
 
 @app.middleware("http")
@@ -285,7 +470,12 @@ async def set_secure_headers(request: Request, call_next: Any) -> Any:
     ):
         return response
 
+    # Responses that can be cached, like artifact visualization downloads,
+    # keep their own caching headers
+    cache_control = response.headers.get("Cache-Control")
     secure_headers().framework.fastapi(response)
+    if cache_control:
+        response.headers["Cache-Control"] = cache_control
     return response
 
 
@@ -391,6 +581,9 @@ def initialize() -> None:
     initialize_plugins()
     initialize_secure_headers()
     initialize_memcache(cfg.memcache_max_capacity, cfg.memcache_default_expiry)
+    initialize_artifact_store_pool(
+        cfg.artifact_store_pool_size, cfg.artifact_store_pool_ttl
+    )
     if cfg.deployment_type == ServerDeploymentType.CLOUD:
         # Send a tenant status update to the Cloud API to indicate that the
         # ZenML server is running or to update the version and server URL.
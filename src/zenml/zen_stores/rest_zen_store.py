@@ -13,14 +13,21 @@
 #  permissions and limitations under the License.
 """REST Zen Store implementation."""
 
+import codecs
+import gzip
+import json
 import os
 import re
+import socket
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import (
     Any,
     ClassVar,
     Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -37,11 +44,14 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    NonNegativeInt,
+    PositiveInt,
     ValidationError,
     field_validator,
     model_validator,
 )
 from requests.adapters import HTTPAdapter, Retry
+from urllib3.connection import HTTPConnection
 
 import zenml
 from zenml.analytics import source_context
@@ -58,18 +68,24 @@ from zenml.constants import (
     ARTIFACT_VISUALIZATIONS,
     ARTIFACTS,
     BATCH,
+    CACHED,
     CODE_REFERENCES,
     CODE_REPOSITORIES,
     CONFIG,
     CURRENT_USER,
     DEACTIVATE,
+    DEFAULT_HTTP_POOL_CONNECTIONS,
+    DEFAULT_HTTP_POOL_MAXSIZE,
+    DEFAULT_HTTP_RESPONSE_CACHE_SIZE,
     DEFAULT_HTTP_TIMEOUT,
     DEVICES,
     DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
     ENV_ZENML_DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
     EVENT_SOURCES,
+    FINALIZE,
     FLAVORS,
     GET_OR_CREATE,
+    HTTP_COMPRESSION_MINIMUM_SIZE,
     INFO,
     LOGIN,
     LOGS,
@@ -102,6 +118,7 @@ from zenml.constants import (
     STACK_DEPLOYMENT,
     STACKS,
     STEPS,
+    STREAM,
     TAGS,
     TRIGGER_EXECUTIONS,
     TRIGGERS,
@@ -239,6 +256,7 @@ from zenml.models import (
     StackResponse,
     StackUpdate,
     StepRunFilter,
+    StepRunFinalizeRequest,
     StepRunRequest,
     StepRunResponse,
     StepRunUpdate,
@@ -272,6 +290,11 @@ from zenml.utils.pydantic_utils import before_validator_handler
 from zenml.zen_server.exceptions import exception_from_response
 from zenml.zen_stores.base_zen_store import BaseZenStore
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
 # type alias for possible json payloads (the Anys are recursive Json instances)
@@ -286,6 +309,110 @@ AnyWorkspaceScopedRequest = TypeVar(
 )
 
 
+def _json_loads(content: bytes) -> Json:
+    """Parses a JSON document, using `orjson` if it is installed.
+
+    Args:
+        content: The JSON document.
+
+    Returns:
+        The parsed JSON document.
+    """
+    if orjson:
+        return orjson.loads(content)  # type: ignore[no-any-return]
+    return json.loads(content)  # type: ignore[no-any-return]
+
+
+def _json_dumps(data: Json) -> bytes:
+    """Serializes a JSON document, using `orjson` if it is installed.
+
+    Args:
+        data: The JSON document.
+
+    Returns:
+        The serialized JSON document.
+    """
+    if orjson:
+        return orjson.dumps(data)  # type: ignore[no-any-return]
+    return json.dumps(data).encode()
+
+
+class _ResponseCache:
+    """Thread-safe LRU cache of GET response bodies and their ETags."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_size: The maximum number of cached responses.
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[str, Json, bool]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[str, Json, bool]]:
+        """Gets a cached response.
+
+        Args:
+            key: The cache key of the request.
+
+        Returns:
+            The ETag, body and immutability of the cached response, if any.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, etag: str, body: Json, immutable: bool) -> None:
+        """Caches a response.
+
+        Args:
+            key: The cache key of the request.
+            etag: The ETag of the response.
+            body: The parsed response body.
+            immutable: Whether the resource never changes, in which case the
+                cached response is used without revalidating it.
+        """
+        with self._lock:
+            self._entries[key] = (etag, body, immutable)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter which optionally enables TCP keep-alive on connections."""
+
+    def __init__(self, tcp_keep_alive: bool = False, **kwargs: Any) -> None:
+        """Initializes the adapter.
+
+        Args:
+            tcp_keep_alive: Whether to enable TCP keep-alive on connections.
+            **kwargs: Keyword arguments for the `HTTPAdapter`.
+        """
+        self._tcp_keep_alive = tcp_keep_alive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Initializes the pool manager.
+
+        Args:
+            *args: Positional arguments for the pool manager.
+            **kwargs: Keyword arguments for the pool manager.
+        """
+        if self._tcp_keep_alive:
+            kwargs.setdefault(
+                "socket_options",
+                HTTPConnection.default_socket_options
+                + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+            )
+        super().init_poolmanager(*args, **kwargs)
+
+
 class RestZenStoreConfiguration(StoreConfiguration):
     """REST ZenML store configuration.
 
@@ -302,6 +429,19 @@ class RestZenStoreConfiguration(StoreConfiguration):
             verify the server's TLS certificate, or a string, in which case it
             must be a path to a CA bundle to use or the CA bundle value itself.
         http_timeout: The timeout to use for all requests.
+        http_pool_connections: The number of connection pools to cache, one
+            for each host the client connects to.
+        http_pool_maxsize: The maximum number of connections to keep alive
+            per host. This should be at least the number of threads that
+            concurrently use the store, e.g. in orchestrators that run steps
+            in parallel.
+        http_tcp_keep_alive: Whether to send TCP keep-alive probes on idle
+            connections, so that they are not silently dropped by proxies
+            or load balancers in between.
+        http_response_cache_size: The maximum number of GET responses to
+            cache. Cached responses are revalidated with the server using
+            their ETag and only downloaded again if they changed. Set to 0 to
+            disable the cache.
 
     """
 
@@ -311,6 +451,10 @@ class RestZenStoreConfiguration(StoreConfiguration):
         default=True, union_mode="left_to_right"
     )
     http_timeout: int = DEFAULT_HTTP_TIMEOUT
+    http_pool_connections: PositiveInt = DEFAULT_HTTP_POOL_CONNECTIONS
+    http_pool_maxsize: PositiveInt = DEFAULT_HTTP_POOL_MAXSIZE
+    http_tcp_keep_alive: bool = True
+    http_response_cache_size: NonNegativeInt = DEFAULT_HTTP_RESPONSE_CACHE_SIZE
 
     @field_validator("url")
     @classmethod
@@ -441,6 +585,7 @@ class RestZenStore(BaseZenStore):
     _api_token: Optional[APIToken] = None
     _session: Optional[requests.Session] = None
     _server_info: Optional[ServerModel] = None
+    _response_cache: Optional[_ResponseCache] = None
 
     # ====================================
     # ZenML Store interface implementation
@@ -1568,6 +1713,7 @@ class RestZenStore(BaseZenStore):
             route=PIPELINE_BUILDS,
             response_model=PipelineBuildResponse,
             params={"hydrate": hydrate},
+            immutable=True,
         )
 
     def list_builds(
@@ -1642,6 +1788,7 @@ class RestZenStore(BaseZenStore):
             route=PIPELINE_DEPLOYMENTS,
             response_model=PipelineDeploymentResponse,
             params={"hydrate": hydrate},
+            immutable=True,
         )
 
     def list_deployments(
@@ -3034,6 +3181,56 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
         )
 
+    def batch_create_run_steps(
+        self, step_runs: List[StepRunRequest]
+    ) -> List[StepRunResponse]:
+        """Creates a batch of step runs.
+
+        Args:
+            step_runs: The step runs to create.
+
+        Returns:
+            The created step runs.
+        """
+        return self._batch_create_resources(
+            resources=step_runs,
+            response_model=StepRunResponse,
+            route=STEPS,
+        )
+
+    def get_cached_step_runs(
+        self, cache_keys: List[str], workspace_id: UUID
+    ) -> Dict[str, StepRunResponse]:
+        """Gets the step runs that can be used as cache for the given keys.
+
+        For each cache key, this returns the latest successfully completed
+        step run in the workspace with this cache key.
+
+        Args:
+            cache_keys: The cache keys for which to get the step runs.
+            workspace_id: The ID of the workspace in which to look for step
+                runs.
+
+        Returns:
+            The hydrated cached step runs, keyed by their cache key. Cache
+            keys without any matching step run are not included.
+        """
+        if not cache_keys:
+            return {}
+
+        response = self._request(
+            "POST",
+            self.url + API + VERSION_1 + STEPS + CACHED,
+            json=cache_keys,
+            params={"workspace_id": str(workspace_id)},
+        )
+        assert isinstance(response, dict)
+
+        return {
+            cache_key: StepRunResponse.model_validate(model_data)
+            for cache_key, model_data in response.items()
+        }
+
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
     ) -> StepRunResponse:
@@ -3098,6 +3295,83 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
         )
 
+    def finalize_step_run(
+        self,
+        step_run_id: UUID,
+        finalize_request: StepRunFinalizeRequest,
+    ) -> StepRunResponse:
+        """Publishes the results of a step run in a single call.
+
+        Args:
+            step_run_id: The ID of the step run to finalize.
+            finalize_request: The results of the step run.
+
+        Returns:
+            The updated step run.
+        """
+        response_body = self.post(
+            f"{STEPS}/{str(step_run_id)}{FINALIZE}", body=finalize_request
+        )
+        return StepRunResponse.model_validate(response_body)
+
+    def stream_step_logs(
+        self, step_run_id: UUID, offset: int = 0, follow: bool = False
+    ) -> Iterator[str]:
+        """Streams the logs of a step run.
+
+        Args:
+            step_run_id: The ID of the step run.
+            offset: The offset from which to start reading. Negative offsets
+                are relative to the end of the logs.
+            follow: Whether to keep streaming new logs until the step run
+                finished.
+
+        Yields:
+            The logs of the step run as they are received.
+
+        Raises:
+            CredentialsNotValid: if the request fails due to invalid
+                client credentials.
+        """
+        url = (
+            self.url + API + VERSION_1 + f"{STEPS}/{str(step_run_id)}{LOGS}"
+            f"{STREAM}"
+        )
+        re_authenticated = False
+        while True:
+            response = self.session.get(
+                url,
+                params={"offset": offset, "follow": follow},
+                verify=self.config.verify_ssl,
+                # While following the logs, there might be no new logs for a
+                # long time, so only the connection attempt can time out
+                timeout=(
+                    self.config.http_timeout,
+                    None if follow else self.config.http_timeout,
+                ),
+                # Compressing the response would buffer new logs on the server
+                headers={"Accept-Encoding": "identity"},
+                stream=True,
+            )
+            if response.status_code < 400:
+                break
+
+            try:
+                self._handle_response(response)
+            except CredentialsNotValid:
+                if re_authenticated:
+                    raise
+                re_authenticated = True
+                self.authenticate(force=self._api_token is not None)
+
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        with response:
+            for data in response.iter_content(chunk_size=None):
+                if text := decoder.decode(data):
+                    yield text
+        if text := decoder.decode(b"", final=True):
+            yield text
+
     # -------------------- Triggers  --------------------
 
     def create_trigger(self, trigger: TriggerRequest) -> TriggerResponse:
@@ -4166,6 +4440,22 @@ class RestZenStore(BaseZenStore):
 
         return self._api_token.access_token
 
+    @property
+    def response_cache(self) -> Optional[_ResponseCache]:
+        """The cache of GET responses.
+
+        Returns:
+            The response cache or `None` if caching is disabled.
+        """
+        if (
+            self._response_cache is None
+            and self.config.http_response_cache_size > 0
+        ):
+            self._response_cache = _ResponseCache(
+                max_size=self.config.http_response_cache_size
+            )
+        return self._response_cache
+
     @property
     def session(self) -> requests.Session:
         """Initialize and return a requests session.
@@ -4220,8 +4510,16 @@ class RestZenStore(BaseZenStore):
                 other=3,
                 backoff_factor=0.5,
             )
-            self._session.mount("https://", HTTPAdapter(max_retries=retries))
-            self._session.mount("http://", HTTPAdapter(max_retries=retries))
+            for prefix in ("https://", "http://"):
+                self._session.mount(
+                    prefix,
+                    _PooledHTTPAdapter(
+                        pool_connections=self.config.http_pool_connections,
+                        pool_maxsize=self.config.http_pool_maxsize,
+                        max_retries=retries,
+                        tcp_keep_alive=self.config.http_tcp_keep_alive,
+                    ),
+                )
             self._session.verify = self.config.verify_ssl
             # Use a custom user agent to identify the ZenML client in the server
             # logs.
@@ -4305,11 +4603,13 @@ class RestZenStore(BaseZenStore):
             exc: the exception converted from an error response, if one
                 is returned from the server.
         """
-        if 200 <= response.status_code < 300:
+        if response.status_code == 304:
+            # Not modified, the caller uses its cached response body
+            return None
+        elif 200 <= response.status_code < 300:
             try:
-                payload: Json = response.json()
-                return payload
-            except requests.exceptions.JSONDecodeError:
+                return _json_loads(response.content)
+            except ValueError:
                 raise ValueError(
                     "Bad response from API. Expected json, got\n"
                     f"{response.text}"
@@ -4359,6 +4659,9 @@ class RestZenStore(BaseZenStore):
             {source_context.name: source_context.get().value}
         )
 
+        if "json" in kwargs and kwargs["json"] is not None:
+            kwargs.update(self._encode_json_body(kwargs.pop("json")))
+
         # If the server replies with a credentials validation (401 Unauthorized)
         # error, we (re-)authenticate and retry the request here in the
         # following cases:
@@ -4428,32 +4731,86 @@ class RestZenStore(BaseZenStore):
                         "log in again using 'zenml login'."
                     ) from e
 
+    def _encode_json_body(self, data: Json) -> Dict[str, Any]:
+        """Encodes a JSON request body.
+
+        Large bodies are gzip compressed if the server supports it.
+
+        Args:
+            data: The JSON request body.
+
+        Returns:
+            The `data` and `headers` arguments for the request.
+        """
+        body = _json_dumps(data)
+        headers = {"Content-Type": "application/json"}
+        if (
+            len(body) >= HTTP_COMPRESSION_MINIMUM_SIZE
+            and self.server_info.supports_request_compression
+        ):
+            body = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+
+        return {"data": body, "headers": headers}
+
     def get(
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
+        immutable: bool = False,
         **kwargs: Any,
     ) -> Json:
         """Make a GET request to the given endpoint path.
 
+        Responses are cached and revalidated using their ETag, so unchanged
+        responses are not downloaded again.
+
         Args:
             path: The path to the endpoint.
             params: The query parameters to pass to the endpoint.
             timeout: The request timeout in seconds.
+            immutable: Whether the requested resource never changes. Cached
+                responses of immutable resources are not revalidated.
             kwargs: Additional keyword arguments to pass to the request.
 
         Returns:
             The response body.
         """
         logger.debug(f"Sending GET request to {path}...")
-        return self._request(
+        url = self.url + API + VERSION_1 + path
+        cache = self.response_cache
+        if cache is None:
+            return self._request(
+                "GET", url, params=params, timeout=timeout, **kwargs
+            )
+
+        cache_key = json.dumps([url, params], sort_keys=True, default=str)
+        cached = cache.get(cache_key)
+        headers: Dict[str, str] = {}
+        if cached:
+            cached_etag, cached_body, cached_immutable = cached
+            if cached_immutable:
+                return cached_body
+            headers["If-None-Match"] = cached_etag
+
+        responses: List[requests.Response] = []
+        body = self._request(
             "GET",
-            self.url + API + VERSION_1 + path,
+            url,
             params=params,
             timeout=timeout,
+            headers=headers,
+            hooks={"response": lambda r, *args, **kw: responses.append(r)},
             **kwargs,
         )
+        response = responses[-1]
+        if response.status_code == 304 and cached:
+            return cached[1]
+
+        if etag := response.headers.get("ETag"):
+            cache.set(cache_key, etag=etag, body=body, immutable=immutable)
+        return body
 
     def delete(
         self,
@@ -4711,6 +5068,7 @@ class RestZenStore(BaseZenStore):
         route: str,
         response_model: Type[AnyResponse],
         params: Optional[Dict[str, Any]] = None,
+        immutable: bool = False,
     ) -> AnyResponse:
         """Retrieve a single resource.
 
@@ -4719,11 +5077,16 @@ class RestZenStore(BaseZenStore):
             route: The resource REST API route to use.
             response_model: Model to use to serialize the response body.
             params: Optional query parameters to pass to the endpoint.
+            immutable: Whether the resource never changes after it was
+                created, in which case it is served from the response cache
+                without revalidating it.
 
         Returns:
             The retrieved resource.
         """
-        body = self.get(f"{route}/{str(resource_id)}", params=params)
+        body = self.get(
+            f"{route}/{str(resource_id)}", params=params, immutable=immutable
+        )
         return response_model.model_validate(body)
 
     def _list_paginated_resources(
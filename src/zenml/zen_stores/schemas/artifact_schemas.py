@@ -17,8 +17,8 @@ from typing import TYPE_CHECKING, Any, List, Optional
 from uuid import UUID
 
 from pydantic import ValidationError
-from sqlalchemy import TEXT, Column, UniqueConstraint
-from sqlalchemy.orm import object_session
+from sqlalchemy import TEXT, Column, UniqueConstraint, event
+from sqlalchemy.orm import Session, object_session
 from sqlmodel import Field, Relationship, desc, select
 
 from zenml.config.source import Source
@@ -63,6 +63,21 @@ if TYPE_CHECKING:
     from zenml.zen_stores.schemas.run_metadata_schemas import RunMetadataSchema
     from zenml.zen_stores.schemas.tag_schemas import TagSchema
 
+# Key of the `Session.info` entry which caches the latest version of each
+# artifact that was already fetched in that session.
+LATEST_ARTIFACT_VERSIONS_SESSION_KEY = "latest_artifact_versions"
+
+
+@event.listens_for(Session, "after_flush")
+def _clear_latest_artifact_versions(session: Session, *args: Any) -> None:
+    """Clear the cached latest artifact versions after a session flush.
+
+    Args:
+        session: The session that was flushed.
+        *args: Additional event arguments.
+    """
+    session.info.pop(LATEST_ARTIFACT_VERSIONS_SESSION_KEY, None)
+
 
 class ArtifactSchema(NamedSchema, table=True):
     """SQL Model for artifacts."""
@@ -102,7 +117,17 @@ class ArtifactSchema(NamedSchema, table=True):
             The latest version for this artifact.
         """
         if session := object_session(self):
-            return (
+            # The same artifact is usually referenced by many artifact
+            # versions that get converted in one session (e.g. the outputs
+            # of all steps when listing runs), so we only query it once per
+            # session until something gets written.
+            cached_versions = session.info.get(
+                LATEST_ARTIFACT_VERSIONS_SESSION_KEY, {}
+            )
+            if self.id in cached_versions:
+                return cached_versions[self.id]
+
+            latest_version = (
                 session.execute(
                     select(ArtifactVersionSchema)
                     .where(ArtifactVersionSchema.artifact_id == self.id)
@@ -112,6 +137,10 @@ class ArtifactSchema(NamedSchema, table=True):
                 .scalars()
                 .one_or_none()
             )
+            session.info.setdefault(LATEST_ARTIFACT_VERSIONS_SESSION_KEY, {})[
+                self.id
+            ] = latest_version
+            return latest_version
         else:
             raise RuntimeError(
                 "Missing DB session to fetch latest version for artifact."
@@ -14,7 +14,7 @@
 """Base classes for SQLModel schemas."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Sequence, TypeVar
 from uuid import UUID, uuid4
 
 from sqlmodel import Field, SQLModel
@@ -22,6 +22,8 @@ from sqlmodel import Field, SQLModel
 from zenml.utils.time_utils import utc_now
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.models.v2.base.base import BaseResponse
 
     B = TypeVar("B", bound=BaseResponse)  # type: ignore[type-arg]
@@ -34,6 +36,29 @@ class BaseSchema(SQLModel):
     created: datetime = Field(default_factory=utc_now)
     updated: datetime = Field(default_factory=utc_now)
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the query options for loading this schema.
+
+        The options eagerly load the relationships which `to_model(...)`
+        accesses for the same hydration level, which avoids issuing one
+        query per relationship and item when converting a list of schemas.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        return []
+
     def to_model(
         self,
         include_metadata: bool = False,
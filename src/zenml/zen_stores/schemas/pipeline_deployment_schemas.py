@@ -14,7 +14,10 @@
 """SQLModel implementation of pipeline deployment tables."""
 
 import json
-from typing import TYPE_CHECKING, Any, List, Optional
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import OrderedDict as OrderedDictType
 from uuid import UUID
 
 from sqlalchemy import TEXT, Column, String
@@ -49,6 +52,161 @@ if TYPE_CHECKING:
     from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
 
 
+PARSED_CONFIGURATION_CACHE_SIZE = 64
+
+
+class ParsedDeploymentConfiguration:
+    """Parsed pipeline and step configurations of a deployment.
+
+    The step configurations of a deployment are stored as a single JSON
+    document. It is decoded lazily and only once, and each configuration is
+    validated at most once, which allows hydrating all step runs of a
+    pipeline run without decoding and validating the (potentially large)
+    configurations again for each step.
+
+    Callers receive deep copies of the validated configurations, so that
+    they are free to modify them.
+    """
+
+    def __init__(
+        self, pipeline_configuration: str, step_configurations: str
+    ) -> None:
+        """Initializes the parsed configuration.
+
+        Args:
+            pipeline_configuration: The JSON pipeline configuration.
+            step_configurations: The JSON step configurations.
+        """
+        self._pipeline_configuration_json = pipeline_configuration
+        self._step_configurations_json = step_configurations
+        self._pipeline_configuration: Optional[PipelineConfiguration] = None
+        self._step_configuration_dicts: Optional[Dict[str, Any]] = None
+        self._step_configurations: Dict[str, Step] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pipeline_configuration(self) -> PipelineConfiguration:
+        """The pipeline configuration of the deployment.
+
+        Returns:
+            The pipeline configuration.
+        """
+        with self._lock:
+            if self._pipeline_configuration is None:
+                self._pipeline_configuration = (
+                    PipelineConfiguration.model_validate_json(
+                        self._pipeline_configuration_json
+                    )
+                )
+            return self._pipeline_configuration.model_copy(deep=True)
+
+    def get_step_configuration(self, name: str) -> Optional[Step]:
+        """Gets the configuration of a single step of the deployment.
+
+        Args:
+            name: The name of the step.
+
+        Returns:
+            The step configuration or `None` if the deployment does not
+            contain a step with the given name.
+        """
+        with self._lock:
+            step_configuration = self._get_step_configuration(name)
+            if step_configuration is None:
+                return None
+            return step_configuration.model_copy(deep=True)
+
+    def get_step_configurations(self) -> Dict[str, Step]:
+        """Gets the configurations of all steps of the deployment.
+
+        Returns:
+            The step configurations.
+        """
+        with self._lock:
+            step_configurations = {}
+            for name in self._get_step_configuration_dicts():
+                step_configuration = self._get_step_configuration(name)
+                assert step_configuration is not None
+                step_configurations[name] = step_configuration.model_copy(
+                    deep=True
+                )
+            return step_configurations
+
+    def _get_step_configuration(self, name: str) -> Optional[Step]:
+        """Gets the validated configuration of a single step.
+
+        Must be called while holding the lock.
+
+        Args:
+            name: The name of the step.
+
+        Returns:
+            The cached step configuration or `None` if the deployment does
+            not contain a step with the given name.
+        """
+        if name not in self._step_configurations:
+            step_configuration_dict = self._get_step_configuration_dicts().get(
+                name
+            )
+            if step_configuration_dict is None:
+                return None
+            self._step_configurations[name] = Step.model_validate(
+                step_configuration_dict
+            )
+        return self._step_configurations[name]
+
+    def _get_step_configuration_dicts(self) -> Dict[str, Any]:
+        """Gets the decoded configurations of the individual steps.
+
+        Must be called while holding the lock.
+
+        Returns:
+            The decoded step configurations by step name.
+        """
+        if self._step_configuration_dicts is None:
+            self._step_configuration_dicts = json.loads(
+                self._step_configurations_json
+            )
+        return self._step_configuration_dicts
+
+
+_parsed_configurations: OrderedDictType[
+    UUID, ParsedDeploymentConfiguration
+] = OrderedDict()
+_parsed_configurations_lock = threading.Lock()
+
+
+def get_parsed_deployment_configuration(
+    deployment: "PipelineDeploymentSchema",
+) -> ParsedDeploymentConfiguration:
+    """Gets the parsed configuration of a deployment.
+
+    Deployments are immutable, so the parsed configurations are cached by
+    deployment ID in a process-wide LRU cache.
+
+    Args:
+        deployment: The deployment.
+
+    Returns:
+        The parsed deployment configuration.
+    """
+    with _parsed_configurations_lock:
+        parsed_configuration = _parsed_configurations.get(deployment.id)
+        if parsed_configuration is not None:
+            _parsed_configurations.move_to_end(deployment.id)
+            return parsed_configuration
+
+        parsed_configuration = ParsedDeploymentConfiguration(
+            pipeline_configuration=deployment.pipeline_configuration,
+            step_configurations=deployment.step_configurations,
+        )
+        _parsed_configurations[deployment.id] = parsed_configuration
+        if len(_parsed_configurations) > PARSED_CONFIGURATION_CACHE_SIZE:
+            _parsed_configurations.popitem(last=False)
+
+        return parsed_configuration
+
+
 class PipelineDeploymentSchema(BaseSchema, table=True):
     """SQL Model for pipeline deployments."""
 
@@ -235,12 +393,13 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         )
         metadata = None
         if include_metadata:
-            pipeline_configuration = PipelineConfiguration.model_validate_json(
-                self.pipeline_configuration
+            parsed_configuration = get_parsed_deployment_configuration(self)
+            pipeline_configuration = (
+                parsed_configuration.pipeline_configuration
+            )
+            step_configurations = (
+                parsed_configuration.get_step_configurations()
             )
-            step_configurations = json.loads(self.step_configurations)
-            for s, c in step_configurations.items():
-                step_configurations[s] = Step.model_validate(c)
 
             metadata = PipelineDeploymentResponseMetadata(
                 workspace=self.workspace.to_model(),
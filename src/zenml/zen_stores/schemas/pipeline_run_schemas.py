@@ -15,11 +15,12 @@
 
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
 from pydantic import ConfigDict
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import TEXT, Column, Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
@@ -46,7 +47,10 @@ from zenml.zen_stores.schemas.pipeline_deployment_schemas import (
 )
 from zenml.zen_stores.schemas.pipeline_schemas import PipelineSchema
 from zenml.zen_stores.schemas.schedule_schema import ScheduleSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    jl_arg,
+)
 from zenml.zen_stores.schemas.stack_schemas import StackSchema
 from zenml.zen_stores.schemas.trigger_schemas import TriggerExecutionSchema
 from zenml.zen_stores.schemas.user_schemas import UserSchema
@@ -54,6 +58,8 @@ from zenml.zen_stores.schemas.utils import RunMetadataInterface
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.zen_stores.schemas.logs_schemas import LogsSchema
     from zenml.zen_stores.schemas.model_schemas import (
         ModelVersionPipelineRunSchema,
@@ -279,6 +285,65 @@ class PipelineRunSchema(NamedSchema, RunMetadataInterface, table=True):
 
         return metadata_collection
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the query options for loading this schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
+
+        options = [
+            joinedload(jl_arg(PipelineRunSchema.user)),
+            joinedload(jl_arg(PipelineRunSchema.trigger_execution)),
+            joinedload(jl_arg(PipelineRunSchema.deployment)).options(
+                joinedload(jl_arg(PipelineDeploymentSchema.workspace)),
+                joinedload(jl_arg(PipelineDeploymentSchema.user)),
+                joinedload(jl_arg(PipelineDeploymentSchema.pipeline)),
+                joinedload(jl_arg(PipelineDeploymentSchema.stack)),
+                joinedload(jl_arg(PipelineDeploymentSchema.build)),
+                joinedload(jl_arg(PipelineDeploymentSchema.schedule)),
+                joinedload(jl_arg(PipelineDeploymentSchema.code_reference)),
+            ),
+            # Only used for legacy runs without a deployment
+            joinedload(jl_arg(PipelineRunSchema.stack)),
+            joinedload(jl_arg(PipelineRunSchema.pipeline)),
+            joinedload(jl_arg(PipelineRunSchema.build)),
+            joinedload(jl_arg(PipelineRunSchema.schedule)),
+        ]
+
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(jl_arg(PipelineRunSchema.workspace)),
+                    selectinload(jl_arg(PipelineRunSchema.run_metadata)),
+                    selectinload(jl_arg(PipelineRunSchema.step_runs)).options(
+                        *StepRunSchema.get_query_options(include_metadata=True)
+                    ),
+                ]
+            )
+
+        if include_resources:
+            options.extend(
+                [
+                    joinedload(jl_arg(PipelineRunSchema.model_version)),
+                    selectinload(jl_arg(PipelineRunSchema.tags)),
+                ]
+            )
+
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
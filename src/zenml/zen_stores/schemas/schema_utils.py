@@ -19,6 +19,21 @@ from sqlalchemy import Column, ForeignKey, Index
 from sqlmodel import Field
 
 
+def jl_arg(column: Any) -> Any:
+    """Cast a SQLModel relationship for use in loader options.
+
+    SQLModel declares relationships with the type of the related schema, which
+    type checkers reject as argument of loader options like `joinedload`.
+
+    Args:
+        column: The relationship attribute.
+
+    Returns:
+        The relationship attribute.
+    """
+    return column
+
+
 def foreign_key_constraint_name(
     source: str, target: str, source_column: str
 ) -> str:
@@ -13,17 +13,16 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of step run tables."""
 
-import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
 from pydantic import ConfigDict
 from sqlalchemy import TEXT, Column, String, UniqueConstraint
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import Field, Relationship, SQLModel
 
-from zenml.config.pipeline_configurations import PipelineConfiguration
 from zenml.config.step_configurations import Step
 from zenml.constants import MEDIUMTEXT_MAX_LENGTH
 from zenml.enums import (
@@ -48,14 +47,20 @@ from zenml.zen_stores.schemas.base_schemas import NamedSchema
 from zenml.zen_stores.schemas.constants import MODEL_VERSION_TABLENAME
 from zenml.zen_stores.schemas.pipeline_deployment_schemas import (
     PipelineDeploymentSchema,
+    get_parsed_deployment_configuration,
 )
 from zenml.zen_stores.schemas.pipeline_run_schemas import PipelineRunSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    jl_arg,
+)
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.utils import RunMetadataInterface
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from zenml.zen_stores.schemas.artifact_schemas import ArtifactVersionSchema
     from zenml.zen_stores.schemas.logs_schemas import LogsSchema
     from zenml.zen_stores.schemas.model_schemas import ModelVersionSchema
@@ -212,6 +217,66 @@ class StepRunSchema(NamedSchema, RunMetadataInterface, table=True):
             model_version_id=request.model_version_id,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence["ExecutableOption"]:
+        """Get the query options for loading this schema.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            A list of query options.
+        """
+        from zenml.zen_stores.schemas.artifact_schemas import (
+            ArtifactSchema,
+            ArtifactVersionSchema,
+        )
+
+        artifact_version_options = [
+            joinedload(jl_arg(ArtifactVersionSchema.artifact)).selectinload(
+                jl_arg(ArtifactSchema.tags)
+            ),
+            joinedload(jl_arg(ArtifactVersionSchema.user)),
+            selectinload(jl_arg(ArtifactVersionSchema.tags)),
+            selectinload(
+                jl_arg(ArtifactVersionSchema.output_of_step_runs)
+            ).joinedload(jl_arg(StepRunOutputArtifactSchema.step_run)),
+        ]
+
+        options = [
+            joinedload(jl_arg(StepRunSchema.user)),
+            joinedload(jl_arg(StepRunSchema.deployment)),
+            joinedload(jl_arg(StepRunSchema.pipeline_run)),
+            selectinload(jl_arg(StepRunSchema.input_artifacts))
+            .joinedload(jl_arg(StepRunInputArtifactSchema.artifact_version))
+            .options(*artifact_version_options),
+            selectinload(jl_arg(StepRunSchema.output_artifacts))
+            .joinedload(jl_arg(StepRunOutputArtifactSchema.artifact_version))
+            .options(*artifact_version_options),
+        ]
+
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(jl_arg(StepRunSchema.workspace)),
+                    joinedload(jl_arg(StepRunSchema.logs)),
+                    selectinload(jl_arg(StepRunSchema.parents)),
+                    selectinload(jl_arg(StepRunSchema.run_metadata)),
+                ]
+            )
+
+        if include_resources:
+            options.append(joinedload(jl_arg(StepRunSchema.model_version)))
+
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -252,18 +317,16 @@ class StepRunSchema(NamedSchema, RunMetadataInterface, table=True):
 
         full_step_config = None
         if self.deployment is not None:
-            step_configuration = json.loads(
-                self.deployment.step_configurations
+            parsed_configuration = get_parsed_deployment_configuration(
+                self.deployment
             )
-            if self.name in step_configuration:
-                full_step_config = Step.model_validate(
-                    step_configuration[self.name]
-                )
+            full_step_config = parsed_configuration.get_step_configuration(
+                self.name
+            )
+            if full_step_config is not None:
                 new_substitutions = (
                     full_step_config.config._get_full_substitutions(
-                        PipelineConfiguration.model_validate_json(
-                            self.deployment.pipeline_configuration
-                        ),
+                        parsed_configuration.pipeline_configuration,
                         self.pipeline_run.start_time,
                     )
                 )
@@ -14,6 +14,7 @@
 """SQL Zen Store implementation."""
 
 import base64
+import codecs
 import json
 import logging
 import math
@@ -32,6 +33,7 @@ from typing import (
     ClassVar,
     Dict,
     ForwardRef,
+    Iterator,
     List,
     NoReturn,
     Optional,
@@ -266,6 +268,7 @@ from zenml.models import (
     StackResponse,
     StackUpdate,
     StepRunFilter,
+    StepRunFinalizeRequest,
     StepRunRequest,
     StepRunResponse,
     StepRunUpdate,
@@ -292,6 +295,7 @@ from zenml.models import (
     WorkspaceResponse,
     WorkspaceUpdate,
 )
+from zenml.models.v2.base.filter import encode_pagination_cursor
 from zenml.models.v2.core.component import InternalComponentRequest
 from zenml.service_connectors.service_connector_registry import (
     service_connector_registry,
@@ -982,18 +986,25 @@ class SqlZenStore(BaseZenStore):
             The Domain Model representation of the DB resource
 
         Raises:
-            ValueError: if the filtered page number is out of bounds.
+            ValueError: if the filtered page number is out of bounds or
+                cursor pagination is not supported for the query.
             RuntimeError: if the schema does not have a `to_model` method.
         """
         query = filter_model.apply_filter(query=query, table=table)
         query = query.distinct()
 
+        if filter_model.after and custom_fetch:
+            raise ValueError(
+                "Cursor pagination is not supported for this resource."
+            )
+
         # Get the total amount of items in the database for a given query
         custom_fetch_result: Optional[Sequence[Any]] = None
+        total: Optional[int] = None
         if custom_fetch:
             custom_fetch_result = custom_fetch(session, query, filter_model)
             total = len(custom_fetch_result)
-        else:
+        elif not filter_model.skip_count:
             result = session.scalar(
                 select(func.count()).select_from(
                     query.options(noload("*")).subquery()
@@ -1008,22 +1019,24 @@ class SqlZenStore(BaseZenStore):
         # Sorting
         query = filter_model.apply_sorting(query=query, table=table)
 
-        # Get the total amount of pages in the database for a given query
-        if total == 0:
-            total_pages = 1
-        else:
-            total_pages = math.ceil(total / filter_model.size)
+        if total is not None and not filter_model.after:
+            # Get the total amount of pages in the database for a given query
+            if total == 0:
+                total_pages = 1
+            else:
+                total_pages = math.ceil(total / filter_model.size)
 
-        if filter_model.page > total_pages:
-            raise ValueError(
-                f"Invalid page {filter_model.page}. The requested page size is "
-                f"{filter_model.size} and there are a total of {total} items "
-                f"for this query. The maximum page value therefore is "
-                f"{total_pages}."
-            )
+            if filter_model.page > total_pages:
+                raise ValueError(
+                    f"Invalid page {filter_model.page}. The requested page "
+                    f"size is {filter_model.size} and there are a total of "
+                    f"{total} items for this query. The maximum page value "
+                    f"therefore is {total_pages}."
+                )
 
         # Get a page of the actual data
         item_schemas: Sequence[AnySchema]
+        has_more = False
         if custom_fetch:
             assert custom_fetch_result is not None
             item_schemas = custom_fetch_result
@@ -1032,9 +1045,40 @@ class SqlZenStore(BaseZenStore):
                 filter_model.offset : filter_model.offset + filter_model.size
             ]
         else:
+            # Continue after the cursor instead of skipping the items of all
+            # previous pages
+            offset = filter_model.offset
+            if filter_model.after:
+                query = filter_model.apply_cursor(query=query, table=table)
+                offset = 0
+
+            # Eagerly load the relationships required to convert the items
+            # of this page to models, instead of lazy-loading them one by one
+            query = query.options(
+                *table.get_query_options(
+                    include_metadata=hydrate, include_resources=True
+                )
+            )
+            # Fetch one additional item to know whether there is a next page
             item_schemas = session.exec(
-                query.limit(filter_model.size).offset(filter_model.offset)
+                query.limit(filter_model.size + 1).offset(offset)
             ).all()
+            has_more = len(item_schemas) > filter_model.size
+            item_schemas = item_schemas[: filter_model.size]
+
+        next_cursor = None
+        if has_more and filter_model.supports_cursor:
+            last_schema = item_schemas[-1]
+            column, _ = filter_model.sorting_params
+            next_cursor = encode_pagination_cursor(
+                getattr(last_schema, column), last_schema.id
+            )
+
+        if total is None:
+            # Without counting all items, the total only includes the items
+            # up to and including the next page
+            total = filter_model.offset + len(item_schemas) + int(has_more)
+        total_pages = max(math.ceil(total / filter_model.size), 1)
 
         # Convert this page of items from schemas to models.
         items: List[AnyResponse] = []
@@ -1062,6 +1106,7 @@ class SqlZenStore(BaseZenStore):
             items=items,
             index=filter_model.page,
             max_size=filter_model.size,
+            next_cursor=next_cursor,
         )
 
     # ====================================
@@ -8091,148 +8136,272 @@ class SqlZenStore(BaseZenStore):
 
         Returns:
             The created step run.
+        """
+        return self.batch_create_run_steps([step_run])[0]
 
-        Raises:
-            EntityExistsError: if the step run already exists.
-            KeyError: if the pipeline run doesn't exist.
+    def batch_create_run_steps(
+        self, step_runs: List[StepRunRequest]
+    ) -> List[StepRunResponse]:
+        """Creates a batch of step runs.
+
+        All step runs are created in a single transaction, so either all or
+        none of them are created.
+
+        Args:
+            step_runs: The step runs to create.
+
+        Returns:
+            The created step runs.
         """
         with Session(self.engine) as session:
-            # Check if the pipeline run exists
-            run = session.exec(
-                select(PipelineRunSchema).where(
-                    PipelineRunSchema.id == step_run.pipeline_run_id
-                )
-            ).first()
-            if run is None:
-                raise KeyError(
-                    f"Unable to create step `{step_run.name}`: No pipeline run "
-                    f"with ID '{step_run.pipeline_run_id}' found."
-                )
+            step_schemas = [
+                self._create_run_step(step_run=step_run, session=session)
+                for step_run in step_runs
+            ]
 
-            step_schema = StepRunSchema.from_request(step_run)
-            session.add(step_schema)
-            try:
-                session.commit()
-            except IntegrityError:
-                raise EntityExistsError(
-                    f"Unable to create step `{step_run.name}`: A step with "
-                    f"this name already exists in the pipeline run with ID "
-                    f"'{step_run.pipeline_run_id}'."
+            finished_pipeline_run_ids = {
+                step_run.pipeline_run_id
+                for step_run in step_runs
+                if step_run.status != ExecutionStatus.RUNNING
+            }
+            for pipeline_run_id in finished_pipeline_run_ids:
+                self._update_pipeline_run_status(
+                    pipeline_run_id=pipeline_run_id, session=session
                 )
 
-            # Add logs entry for the step if exists
-            if step_run.logs is not None:
-                log_entry = LogsSchema(
-                    uri=step_run.logs.uri,
-                    step_run_id=step_schema.id,
-                    artifact_store_id=step_run.logs.artifact_store_id,
-                )
-                session.add(log_entry)
+            session.commit()
 
-            # If cached, attach metadata of the original step
-            if (
-                step_run.status == ExecutionStatus.CACHED
-                and step_run.original_step_run_id is not None
-            ):
-                original_metadata_links = session.exec(
-                    select(RunMetadataResourceSchema)
-                    .where(
-                        RunMetadataResourceSchema.run_metadata_id
-                        == RunMetadataSchema.id
-                    )
-                    .where(
-                        RunMetadataResourceSchema.resource_id
-                        == step_run.original_step_run_id
-                    )
-                    .where(
-                        RunMetadataResourceSchema.resource_type
-                        == MetadataResourceTypes.STEP_RUN
-                    )
-                    .where(
-                        RunMetadataSchema.publisher_step_id
-                        == step_run.original_step_run_id
-                    )
-                ).all()
+            for step_schema in step_schemas:
+                session.refresh(step_schema)
+
+                if model_version_id := (
+                    self._get_or_create_model_version_for_run(step_schema)
+                ):
+                    step_schema.model_version_id = model_version_id
+                    session.add(step_schema)
+                    session.commit()
 
-                # Create new links in a batch
-                new_links = [
-                    RunMetadataResourceSchema(
-                        resource_id=step_schema.id,
-                        resource_type=link.resource_type,
-                        run_metadata_id=link.run_metadata_id,
+                    self.create_model_version_pipeline_run_link(
+                        ModelVersionPipelineRunRequest(
+                            model_version=model_version_id,
+                            pipeline_run=step_schema.pipeline_run_id,
+                        )
                     )
-                    for link in original_metadata_links
-                ]
-                # Add all new links in a single operation
-                session.add_all(new_links)
-                # Commit the changes
-                session.commit()
-                session.refresh(step_schema)
+                    session.refresh(step_schema)
 
-            # Save parent step IDs into the database.
-            for parent_step_id in step_run.parent_step_ids:
-                self._set_run_step_parent_step(
-                    child_id=step_schema.id,
-                    parent_id=parent_step_id,
-                    session=session,
+            return [
+                step_schema.to_model(
+                    include_metadata=True, include_resources=True
                 )
+                for step_schema in step_schemas
+            ]
 
-            session.commit()
-            session.refresh(step_schema)
+    def _create_run_step(
+        self, step_run: StepRunRequest, session: Session
+    ) -> StepRunSchema:
+        """Creates a step run without committing it.
+
+        Args:
+            step_run: The step run to create.
+            session: The database session to use.
+
+        Returns:
+            The created step run schema.
 
-            step_model = step_schema.to_model(include_metadata=True)
+        Raises:
+            EntityExistsError: if the step run already exists.
+            KeyError: if the pipeline run doesn't exist.
+        """
+        # Check if the pipeline run exists
+        run = session.exec(
+            select(PipelineRunSchema).where(
+                PipelineRunSchema.id == step_run.pipeline_run_id
+            )
+        ).first()
+        if run is None:
+            raise KeyError(
+                f"Unable to create step `{step_run.name}`: No pipeline run "
+                f"with ID '{step_run.pipeline_run_id}' found."
+            )
 
-            # Save input artifact IDs into the database.
-            for input_name, artifact_version_id in step_run.inputs.items():
-                input_type = self._get_step_run_input_type(
-                    input_name=input_name,
-                    step_config=step_model.config,
-                    step_spec=step_model.spec,
+        step_schema = StepRunSchema.from_request(step_run)
+        session.add(step_schema)
+        try:
+            session.flush()
+        except IntegrityError:
+            raise EntityExistsError(
+                f"Unable to create step `{step_run.name}`: A step with "
+                f"this name already exists in the pipeline run with ID "
+                f"'{step_run.pipeline_run_id}'."
+            )
+
+        # Add logs entry for the step if exists
+        if step_run.logs is not None:
+            log_entry = LogsSchema(
+                uri=step_run.logs.uri,
+                step_run_id=step_schema.id,
+                artifact_store_id=step_run.logs.artifact_store_id,
+            )
+            session.add(log_entry)
+
+        # If cached, attach metadata of the original step
+        if (
+            step_run.status == ExecutionStatus.CACHED
+            and step_run.original_step_run_id is not None
+        ):
+            original_metadata_links = session.exec(
+                select(RunMetadataResourceSchema)
+                .where(
+                    RunMetadataResourceSchema.run_metadata_id
+                    == RunMetadataSchema.id
                 )
-                self._set_run_step_input_artifact(
-                    run_step_id=step_schema.id,
+                .where(
+                    RunMetadataResourceSchema.resource_id
+                    == step_run.original_step_run_id
+                )
+                .where(
+                    RunMetadataResourceSchema.resource_type
+                    == MetadataResourceTypes.STEP_RUN
+                )
+                .where(
+                    RunMetadataSchema.publisher_step_id
+                    == step_run.original_step_run_id
+                )
+            ).all()
+
+            # Create new links in a batch
+            new_links = [
+                RunMetadataResourceSchema(
+                    resource_id=step_schema.id,
+                    resource_type=link.resource_type,
+                    run_metadata_id=link.run_metadata_id,
+                )
+                for link in original_metadata_links
+            ]
+            # Add all new links in a single operation
+            session.add_all(new_links)
+
+        # Save parent step IDs into the database.
+        for parent_step_id in step_run.parent_step_ids:
+            self._set_run_step_parent_step(
+                child_id=step_schema.id,
+                parent_id=parent_step_id,
+                session=session,
+            )
+
+        session.flush()
+        session.refresh(step_schema)
+
+        step_model = step_schema.to_model(include_metadata=True)
+
+        # Save input artifact IDs into the database.
+        for input_name, artifact_version_id in step_run.inputs.items():
+            input_type = self._get_step_run_input_type(
+                input_name=input_name,
+                step_config=step_model.config,
+                step_spec=step_model.spec,
+            )
+            self._set_run_step_input_artifact(
+                run_step_id=step_schema.id,
+                artifact_version_id=artifact_version_id,
+                name=input_name,
+                input_type=input_type,
+                session=session,
+            )
+
+        # Save output artifact IDs into the database.
+        for name, artifact_version_ids in step_run.outputs.items():
+            for artifact_version_id in artifact_version_ids:
+                self._set_run_step_output_artifact(
+                    step_run_id=step_schema.id,
                     artifact_version_id=artifact_version_id,
-                    name=input_name,
-                    input_type=input_type,
+                    name=name,
                     session=session,
                 )
 
-            # Save output artifact IDs into the database.
-            for name, artifact_version_ids in step_run.outputs.items():
-                for artifact_version_id in artifact_version_ids:
-                    self._set_run_step_output_artifact(
-                        step_run_id=step_schema.id,
-                        artifact_version_id=artifact_version_id,
-                        name=name,
-                        session=session,
-                    )
+        return step_schema
 
-            if step_run.status != ExecutionStatus.RUNNING:
-                self._update_pipeline_run_status(
-                    pipeline_run_id=step_run.pipeline_run_id, session=session
-                )
+    def get_cached_step_runs(
+        self,
+        cache_keys: List[str],
+        workspace_id: UUID,
+        allowed_pipeline_run_ids: Optional[Set[UUID]] = None,
+    ) -> Dict[str, StepRunResponse]:
+        """Gets the step runs that can be used as cache for the given keys.
 
-            session.commit()
-            session.refresh(step_schema)
+        For each cache key, this returns the latest successfully completed
+        step run in the workspace with this cache key.
 
-            if model_version_id := self._get_or_create_model_version_for_run(
-                step_schema
-            ):
-                step_schema.model_version_id = model_version_id
-                session.add(step_schema)
-                session.commit()
+        Args:
+            cache_keys: The cache keys for which to get the step runs.
+            workspace_id: The ID of the workspace in which to look for step
+                runs.
+            allowed_pipeline_run_ids: If given, only step runs of these
+                pipeline runs are considered.
 
-                self.create_model_version_pipeline_run_link(
-                    ModelVersionPipelineRunRequest(
-                        model_version=model_version_id,
-                        pipeline_run=step_schema.pipeline_run_id,
+        Returns:
+            The hydrated cached step runs, keyed by their cache key. Cache
+            keys without any matching step run are not included.
+        """
+        if not cache_keys:
+            return {}
+
+        with Session(self.engine) as session:
+            latest_step_runs_query = (
+                select(
+                    StepRunSchema.cache_key,
+                    func.max(StepRunSchema.created).label("created"),
+                )
+                .where(StepRunSchema.workspace_id == workspace_id)
+                .where(StepRunSchema.status == ExecutionStatus.COMPLETED.value)
+                .where(col(StepRunSchema.cache_key).in_(set(cache_keys)))
+            )
+            step_runs_query = (
+                select(StepRunSchema)
+                .where(StepRunSchema.workspace_id == workspace_id)
+                .where(StepRunSchema.status == ExecutionStatus.COMPLETED.value)
+            )
+            if allowed_pipeline_run_ids is not None:
+                # Filter before picking the latest step run, so that a newer
+                # step run the user can't read doesn't hide an older one
+                latest_step_runs_query = latest_step_runs_query.where(
+                    col(StepRunSchema.pipeline_run_id).in_(
+                        allowed_pipeline_run_ids
+                    )
+                )
+                step_runs_query = step_runs_query.where(
+                    col(StepRunSchema.pipeline_run_id).in_(
+                        allowed_pipeline_run_ids
                     )
                 )
-                session.refresh(step_schema)
 
-            return step_schema.to_model(
-                include_metadata=True, include_resources=True
-            )
+            latest_step_runs = latest_step_runs_query.group_by(
+                col(StepRunSchema.cache_key)
+            ).subquery()
+            step_runs = session.exec(
+                step_runs_query.join(
+                    latest_step_runs,
+                    and_(
+                        col(StepRunSchema.cache_key)
+                        == latest_step_runs.c.cache_key,
+                        col(StepRunSchema.created)
+                        == latest_step_runs.c.created,
+                    ),
+                )
+            ).all()
+
+            cached_step_runs: Dict[str, StepRunResponse] = {}
+            for step_run in step_runs:
+                # Multiple step runs might have been created at the exact same
+                # time, in which case we just use any of them
+                if step_run.cache_key and (
+                    step_run.cache_key not in cached_step_runs
+                ):
+                    cached_step_runs[step_run.cache_key] = step_run.to_model(
+                        include_metadata=True, include_resources=True
+                    )
+
+            return cached_step_runs
 
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
@@ -8263,6 +8432,72 @@ class SqlZenStore(BaseZenStore):
                 include_metadata=hydrate, include_resources=True
             )
 
+    def get_run_step_status(self, step_run_id: UUID) -> ExecutionStatus:
+        """Get the status of a step run without loading the whole step run.
+
+        Args:
+            step_run_id: The ID of the step run.
+
+        Returns:
+            The status of the step run.
+
+        Raises:
+            KeyError: if the step run doesn't exist.
+        """
+        with Session(self.engine) as session:
+            status = session.exec(
+                select(StepRunSchema.status).where(
+                    StepRunSchema.id == step_run_id
+                )
+            ).first()
+            if status is None:
+                raise KeyError(
+                    f"Unable to get step run with ID {step_run_id}: No step "
+                    "run with this ID found."
+                )
+            return ExecutionStatus(status)
+
+    def get_run_step_logs(
+        self, step_run_id: UUID
+    ) -> Tuple[UUID, Optional[UUID], Optional[LogsResponse]]:
+        """Get the logs of a step run without loading the whole step run.
+
+        Args:
+            step_run_id: The ID of the step run.
+
+        Returns:
+            The ID of the pipeline run that the step run belongs to, the ID of
+            the user that owns this pipeline run and the logs of the step run.
+
+        Raises:
+            KeyError: if the step run doesn't exist.
+        """
+        with Session(self.engine) as session:
+            pipeline_run = session.exec(
+                select(PipelineRunSchema.id, PipelineRunSchema.user_id)
+                .join(
+                    StepRunSchema,
+                    col(StepRunSchema.pipeline_run_id)
+                    == col(PipelineRunSchema.id),
+                )
+                .where(StepRunSchema.id == step_run_id)
+            ).first()
+            if pipeline_run is None:
+                raise KeyError(
+                    f"Unable to get step run with ID {step_run_id}: No step "
+                    "run with this ID found."
+                )
+
+            logs = session.exec(
+                select(LogsSchema).where(LogsSchema.step_run_id == step_run_id)
+            ).first()
+            pipeline_run_id, user_id = pipeline_run
+            return (
+                pipeline_run_id,
+                user_id,
+                logs.to_model(include_metadata=True) if logs else None,
+            )
+
     def list_run_steps(
         self,
         step_run_filter_model: StepRunFilter,
@@ -8356,6 +8591,158 @@ class SqlZenStore(BaseZenStore):
                 include_metadata=True, include_resources=True
             )
 
+    def finalize_step_run(
+        self,
+        step_run_id: UUID,
+        finalize_request: StepRunFinalizeRequest,
+    ) -> StepRunResponse:
+        """Publishes the results of a step run in a single call.
+
+        The status of the step run is only updated after all its results were
+        stored successfully. Finalizing a step run again, e.g. when retrying a
+        request that failed after some of the results were already stored,
+        does not create the existing output artifact versions again.
+
+        Args:
+            step_run_id: The ID of the step run to finalize.
+            finalize_request: The results of the step run.
+
+        Returns:
+            The updated step run.
+
+        Raises:
+            KeyError: if the step run doesn't exist.
+        """
+        output_uris = [
+            artifact_version.uri
+            for artifact_version in finalize_request.output_artifacts.values()
+        ]
+        with Session(self.engine) as session:
+            existing_step_run = session.exec(
+                select(StepRunSchema).where(StepRunSchema.id == step_run_id)
+            ).first()
+            if existing_step_run is None:
+                raise KeyError(
+                    f"Unable to finalize step with ID {step_run_id}: "
+                    f"No step with this ID found."
+                )
+
+            if existing_step_run.status == finalize_request.status.value:
+                # The step run was already finalized by a previous request
+                return existing_step_run.to_model(
+                    include_metadata=True, include_resources=True
+                )
+
+            existing_artifact_version_ids = {
+                (
+                    artifact_version.artifact_store_id,
+                    artifact_version.uri,
+                ): artifact_version.id
+                for artifact_version in session.exec(
+                    select(ArtifactVersionSchema).where(
+                        col(ArtifactVersionSchema.uri).in_(output_uris)
+                    )
+                ).all()
+            }
+
+        for run_metadata in finalize_request.run_metadata:
+            self.create_run_metadata(run_metadata)
+
+        output_artifact_version_ids: Dict[str, UUID] = {}
+        missing_artifact_versions: Dict[str, ArtifactVersionRequest] = {}
+        for (
+            output_name,
+            artifact_version_request,
+        ) in finalize_request.output_artifacts.items():
+            existing_id = existing_artifact_version_ids.get(
+                (
+                    artifact_version_request.artifact_store_id,
+                    artifact_version_request.uri,
+                )
+            )
+            if existing_id:
+                output_artifact_version_ids[output_name] = existing_id
+            else:
+                missing_artifact_versions[output_name] = (
+                    artifact_version_request
+                )
+
+        created_artifact_versions = self.batch_create_artifact_versions(
+            list(missing_artifact_versions.values())
+        )
+        output_artifact_version_ids.update(
+            zip(
+                missing_artifact_versions,
+                (
+                    artifact_version.id
+                    for artifact_version in created_artifact_versions
+                ),
+            )
+        )
+
+        if finalize_request.model_version_id:
+            for artifact_version_id in output_artifact_version_ids.values():
+                self.create_model_version_artifact_link(
+                    ModelVersionArtifactRequest(
+                        artifact_version=artifact_version_id,
+                        model_version=finalize_request.model_version_id,
+                    )
+                )
+
+        return self.update_run_step(
+            step_run_id=step_run_id,
+            step_run_update=StepRunUpdate(
+                status=finalize_request.status,
+                end_time=finalize_request.end_time,
+                outputs={
+                    output_name: [artifact_version_id]
+                    for output_name, artifact_version_id in (
+                        output_artifact_version_ids.items()
+                    )
+                },
+            ),
+        )
+
+    def stream_step_logs(
+        self, step_run_id: UUID, offset: int = 0, follow: bool = False
+    ) -> Iterator[str]:
+        """Streams the logs of a step run.
+
+        Args:
+            step_run_id: The ID of the step run.
+            offset: The offset from which to start reading. Negative offsets
+                are relative to the end of the logs.
+            follow: Whether to keep streaming new logs until the step run
+                finished.
+
+        Yields:
+            The logs of the step run as they are read.
+
+        Raises:
+            KeyError: if the step run doesn't have any logs.
+        """
+        from zenml.logging.step_logging import stream_logs
+
+        _, _, logs = self.get_run_step_logs(step_run_id)
+        if logs is None:
+            raise KeyError(f"No logs available for step run {step_run_id}.")
+
+        def _is_running() -> bool:
+            return not self.get_run_step_status(step_run_id).is_finished
+
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        for data in stream_logs(
+            zen_store=self,
+            artifact_store_id=logs.artifact_store_id,
+            logs_uri=logs.uri,
+            offset=offset,
+            is_running=_is_running if follow else None,
+        ):
+            if text := decoder.decode(data):
+                yield text
+        if text := decoder.decode(b"", final=True):
+            yield text
+
     def _get_step_run_input_type(
         self,
         input_name: str,
@@ -15,7 +15,7 @@
 
 import datetime
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from uuid import UUID
 
 from zenml.config.pipeline_run_configuration import PipelineRunConfiguration
@@ -127,6 +127,7 @@ from zenml.models import (
     StackResponse,
     StackUpdate,
     StepRunFilter,
+    StepRunFinalizeRequest,
     StepRunRequest,
     StepRunResponse,
     StepRunUpdate,
@@ -2355,6 +2356,43 @@ class ZenStoreInterface(ABC):
             KeyError: if the pipeline run doesn't exist.
         """
 
+    @abstractmethod
+    def batch_create_run_steps(
+        self, step_runs: List[StepRunRequest]
+    ) -> List[StepRunResponse]:
+        """Creates a batch of step runs.
+
+        Args:
+            step_runs: The step runs to create.
+
+        Returns:
+            The created step runs.
+
+        Raises:
+            EntityExistsError: if one of the step runs already exists.
+            KeyError: if the pipeline run of one of the step runs doesn't
+                exist.
+        """
+
+    @abstractmethod
+    def get_cached_step_runs(
+        self, cache_keys: List[str], workspace_id: UUID
+    ) -> Dict[str, StepRunResponse]:
+        """Gets the step runs that can be used as cache for the given keys.
+
+        For each cache key, this returns the latest successfully completed
+        step run in the workspace with this cache key.
+
+        Args:
+            cache_keys: The cache keys for which to get the step runs.
+            workspace_id: The ID of the workspace in which to look for step
+                runs.
+
+        Returns:
+            The hydrated cached step runs, keyed by their cache key. Cache
+            keys without any matching step run are not included.
+        """
+
     @abstractmethod
     def get_run_step(
         self, step_run_id: UUID, hydrate: bool = True
@@ -2410,6 +2448,49 @@ class ZenStoreInterface(ABC):
             KeyError: if the step run doesn't exist.
         """
 
+    @abstractmethod
+    def finalize_step_run(
+        self,
+        step_run_id: UUID,
+        finalize_request: StepRunFinalizeRequest,
+    ) -> StepRunResponse:
+        """Publishes the results of a step run in a single call.
+
+        Creates the output artifact versions and run metadata of the step run,
+        links the output artifact versions to a model version and updates the
+        status and outputs of the step run.
+
+        Args:
+            step_run_id: The ID of the step run to finalize.
+            finalize_request: The results of the step run.
+
+        Returns:
+            The updated step run.
+
+        Raises:
+            KeyError: if the step run doesn't exist.
+        """
+
+    @abstractmethod
+    def stream_step_logs(
+        self, step_run_id: UUID, offset: int = 0, follow: bool = False
+    ) -> Iterator[str]:
+        """Streams the logs of a step run.
+
+        Args:
+            step_run_id: The ID of the step run.
+            offset: The offset from which to start reading. Negative offsets
+                are relative to the end of the logs.
+            follow: Whether to keep streaming new logs until the step run
+                finished.
+
+        Returns:
+            An iterator over the logs of the step run.
+
+        Raises:
+            KeyError: if the step run or its logs don't exist.
+        """
+
     # -------------------- Triggers  --------------------
 
     @abstractmethod
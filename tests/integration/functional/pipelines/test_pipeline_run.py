@@ -58,6 +58,46 @@ def test_pipeline_run_computes_clientside_cache(clean_client, mocker):
     }
 
 
+@step
+def int_input_test_step(value: int) -> int:
+    return value
+
+
+def test_content_hash_caching_caches_steps_with_identical_inputs(
+    clean_client,
+):
+    """Tests that steps are cached if their inputs have the same content
+    but were produced by different step runs."""
+
+    @pipeline(enable_content_hash_caching=True)
+    def _pipeline():
+        value = constant_int_output_test_step()
+        int_input_test_step(value)
+
+    _pipeline()
+    run = _pipeline()
+
+    assert run.steps["constant_int_output_test_step"].status == "completed"
+    assert run.steps["int_input_test_step"].status == "cached"
+
+
+def test_pipeline_runs_without_content_hash_caching_dont_share_cache(
+    clean_client,
+):
+    """Tests that steps are not cached if their inputs were produced by
+    different step runs and content hash caching is disabled."""
+
+    @pipeline
+    def _pipeline():
+        value = constant_int_output_test_step()
+        int_input_test_step(value)
+
+    _pipeline()
+    run = _pipeline()
+
+    assert run.steps["int_input_test_step"].status == "completed"
+
+
 def test_fully_cached_pipeline_doesnt_call_orchestrator_implementation(
     clean_client, mocker
 ):
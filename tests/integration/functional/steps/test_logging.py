@@ -7,7 +7,7 @@ from zenml import pipeline, step
 from zenml.artifacts.utils import _load_file_from_artifact_store
 from zenml.client import Client
 from zenml.logger import get_logger
-from zenml.logging.step_logging import fetch_logs
+from zenml.logging.step_logging import LOGS_EXTENSION, fetch_logs
 
 logger = get_logger(__name__)
 
@@ -81,9 +81,13 @@ def test_that_small_files_are_merged_together():
         ret = _inner_1()  # this run will produce 2+ logs files as it go, proven by previous test
 
     artifact_store = Client().active_stack.artifact_store
-    files = artifact_store.listdir(
-        ret.steps["steps_writing_above_the_count_limit"].logs.uri
-    )
+    files = [
+        file
+        for file in artifact_store.listdir(
+            ret.steps["steps_writing_above_the_count_limit"].logs.uri
+        )
+        if str(file).endswith(LOGS_EXTENSION)
+    ]
     assert len(files) == 1
     content = str(
         _load_file_from_artifact_store(
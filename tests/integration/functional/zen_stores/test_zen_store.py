@@ -42,6 +42,7 @@ from tests.integration.functional.zen_stores.utils import (
     ServiceConnectorTypeContext,
     StackContext,
     UserContext,
+    count_queries,
     list_of_entities,
 )
 from tests.unit.pipelines.test_build_utils import (
@@ -115,6 +116,7 @@ from zenml.models import (
     StackRequest,
     StackUpdate,
     StepRunFilter,
+    StepRunFinalizeRequest,
     StepRunUpdate,
     TagFilter,
     TagRequest,
@@ -2851,6 +2853,72 @@ def test_list_runs_is_ordered():
         )
 
 
+def test_list_runs_and_steps_uses_bounded_number_of_queries():
+    """Tests that listing runs and steps doesn't issue queries per item."""
+    client = Client()
+    store = client.zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    def _count_list_queries(pipeline_name: str) -> Tuple[int, int]:
+        with count_queries(store.engine) as run_queries:
+            runs = store.list_runs(
+                PipelineRunFilter(name=f"startswith:{pipeline_name}"),
+                hydrate=True,
+            )
+        with count_queries(store.engine) as step_queries:
+            store.list_run_steps(
+                StepRunFilter(
+                    pipeline_run_id="oneof:"
+                    + json.dumps([str(run.id) for run in runs.items])
+                ),
+                hydrate=True,
+            )
+        return len(run_queries), len(step_queries)
+
+    with PipelineRunContext(1) as runs:
+        few_run_queries, few_step_queries = _count_list_queries(
+            runs[0].name.rsplit("_", 1)[0]
+        )
+
+    with PipelineRunContext(5) as runs:
+        many_run_queries, many_step_queries = _count_list_queries(
+            runs[0].name.rsplit("_", 1)[0]
+        )
+
+    # The number of queries must not grow with the number of listed items
+    assert many_run_queries - few_run_queries < 4
+    assert many_step_queries - few_step_queries < 4
+
+
+def test_list_runs_with_cursor():
+    """Tests that runs can be listed using cursor pagination."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(5) as runs:
+        pipeline_name = runs[0].name.rsplit("_", 1)[0]
+        run_filter = PipelineRunFilter(
+            name=f"startswith:{pipeline_name}", size=2
+        )
+        all_runs = store.list_runs(run_filter.model_copy(update={"size": 10}))
+        expected_ids = [run.id for run in all_runs.items]
+
+        page = store.list_runs(run_filter)
+        assert page.next_cursor is not None
+        listed_ids = [run.id for run in page.items]
+        while page.next_cursor:
+            page = store.list_runs(
+                run_filter.model_copy(
+                    update={"after": page.next_cursor, "skip_count": True}
+                )
+            )
+            listed_ids += [run.id for run in page.items]
+
+        assert listed_ids == expected_ids
+        assert page.next_cursor is None
+
+
 def test_count_runs():
     """Tests that the count runs command returns the correct amount."""
     client = Client()
@@ -3034,6 +3102,181 @@ def test_get_run_step_inputs_succeeds():
             assert len(run_step_inputs) == 1
 
 
+def test_batch_create_run_steps_is_atomic():
+    """Tests that no step run of a batch is created if one of them fails."""
+    client = Client()
+    store = client.zen_store
+
+    step_names = [sample_name("foo"), sample_name("foo")]
+    deployment = store.create_deployment(
+        PipelineDeploymentRequest(
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+            run_name_template=sample_name("foo"),
+            pipeline_configuration=PipelineConfiguration(
+                name=sample_name("foo")
+            ),
+            stack=client.active_stack.id,
+            client_version="0.1.0",
+            server_version="0.1.0",
+            step_configurations={
+                step_name: Step(
+                    spec=StepSpec(
+                        source=Source(
+                            module="acme.foo",
+                            type=SourceType.INTERNAL,
+                        ),
+                        upstream_steps=[],
+                    ),
+                    config=StepConfiguration(name=step_name),
+                )
+                for step_name in step_names
+            },
+        )
+    )
+    run = store.create_run(
+        PipelineRunRequest(
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+            id=uuid4(),
+            name=sample_name("foo"),
+            deployment=deployment.id,
+            status=ExecutionStatus.RUNNING,
+        )
+    )
+
+    def _step_run_request(step_name: str) -> StepRunRequest:
+        return StepRunRequest(
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+            name=step_name,
+            status=ExecutionStatus.RUNNING,
+            pipeline_run_id=run.id,
+            deployment=deployment.id,
+        )
+
+    try:
+        with pytest.raises(EntityExistsError):
+            store.batch_create_run_steps(
+                [
+                    _step_run_request(step_names[0]),
+                    _step_run_request(step_names[1]),
+                    _step_run_request(step_names[1]),
+                ]
+            )
+        assert (
+            store.list_run_steps(StepRunFilter(pipeline_run_id=run.id)).total
+            == 0
+        )
+
+        step_runs = store.batch_create_run_steps(
+            [_step_run_request(step_name) for step_name in step_names]
+        )
+        assert [step_run.name for step_run in step_runs] == step_names
+        assert (
+            store.list_run_steps(StepRunFilter(pipeline_run_id=run.id)).total
+            == 2
+        )
+    finally:
+        store.delete_run(run.id)
+        store.delete_deployment(deployment.id)
+
+
+def test_finalize_step_run_reuses_existing_output_artifact_versions():
+    """Tests that finalizing a step run again doesn't duplicate outputs."""
+    client = Client()
+    store = client.zen_store
+
+    step_name = sample_name("foo")
+    deployment = store.create_deployment(
+        PipelineDeploymentRequest(
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+            run_name_template=sample_name("foo"),
+            pipeline_configuration=PipelineConfiguration(
+                name=sample_name("foo")
+            ),
+            stack=client.active_stack.id,
+            client_version="0.1.0",
+            server_version="0.1.0",
+            step_configurations={
+                step_name: Step(
+                    spec=StepSpec(
+                        source=Source(
+                            module="acme.foo",
+                            type=SourceType.INTERNAL,
+                        ),
+                        upstream_steps=[],
+                    ),
+                    config=StepConfiguration(name=step_name),
+                )
+            },
+        )
+    )
+    run = store.create_run(
+        PipelineRunRequest(
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+            id=uuid4(),
+            name=sample_name("foo"),
+            deployment=deployment.id,
+            status=ExecutionStatus.RUNNING,
+        )
+    )
+    step_run = store.create_run_step(
+        StepRunRequest(
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+            name=step_name,
+            status=ExecutionStatus.RUNNING,
+            pipeline_run_id=run.id,
+            deployment=deployment.id,
+        )
+    )
+    artifact_name = sample_name("foo")
+    output_request = ArtifactVersionRequest(
+        artifact_name=artifact_name,
+        user=client.active_user.id,
+        workspace=client.active_workspace.id,
+        artifact_store_id=client.active_stack.artifact_store.id,
+        type=ArtifactType.DATA,
+        uri=sample_name("foo"),
+        materializer=Source(module="acme.foo", type=SourceType.INTERNAL),
+        data_type=Source(module="acme.foo", type=SourceType.INTERNAL),
+        save_type=ArtifactSaveType.STEP_OUTPUT,
+    )
+    try:
+        # Simulate a previous finalization that failed after storing the
+        # output artifact version
+        existing_version = store.create_artifact_version(
+            output_request.model_copy()
+        )
+        finalize_request = StepRunFinalizeRequest(
+            end_time=datetime.utcnow(),
+            output_artifacts={"output": output_request},
+        )
+
+        for _ in range(2):
+            finalized_step_run = store.finalize_step_run(
+                step_run.id, finalize_request
+            )
+            assert finalized_step_run.status == ExecutionStatus.COMPLETED
+            assert finalized_step_run.outputs["output"][0].id == (
+                existing_version.id
+            )
+
+        assert (
+            store.list_artifact_versions(
+                ArtifactVersionFilter(artifact_id=existing_version.artifact.id)
+            ).total
+            == 1
+        )
+    finally:
+        store.delete_run(run.id)
+        store.delete_deployment(deployment.id)
+        client.delete_artifact(artifact_name)
+
+
 # .-----------.
 # | Artifacts |
 # '-----------'
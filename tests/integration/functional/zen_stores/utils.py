@@ -12,12 +12,14 @@
 #  permissions and limitations under the License.
 import logging
 import uuid
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -27,6 +29,8 @@ from typing import (
 )
 
 from pydantic import BaseModel, Field, SecretStr
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from typing_extensions import Annotated
 
 from tests.integration.functional.utils import sample_name
@@ -142,6 +146,29 @@ def pipeline_instance():
     int_plus_one_test_step(constant_int_output_test_step())
 
 
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[List[str]]:
+    """Context manager that records the SQL statements executed on an engine.
+
+    Args:
+        engine: The engine to record the statements of.
+
+    Yields:
+        The list of executed statements, which is filled while the context
+        is active.
+    """
+    statements: List[str] = []
+
+    def _record_statement(conn, cursor, statement, *args, **kwargs):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record_statement)
+
+
 class PipelineRunContext:
     """Context manager that creates pipeline runs and cleans them up afterwards."""
 
@@ -12,6 +12,8 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+from tempfile import TemporaryDirectory
+
 import numpy as np
 
 from tests.unit.test_general import _test_materializer
@@ -86,3 +88,23 @@ def test_numpy_materializer():
     assert text_metadata["total_words"] == 7
     assert text_metadata["most_common_word"] == "world"
     assert text_metadata["most_common_count"] == 2
+
+
+def test_numpy_materializer_memory_mapped_loading(clean_client):
+    """Test that arrays can be loaded memory-mapped."""
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = NumpyMaterializer(uri=artifact_uri)
+        materializer.save(array)
+
+        result = materializer.load(data_type=np.memmap)
+        assert isinstance(result, np.memmap)
+        assert not result.flags.writeable
+        assert np.array_equal(result, array)
+
+        assert not isinstance(
+            materializer.load(data_type=np.ndarray), np.memmap
+        )
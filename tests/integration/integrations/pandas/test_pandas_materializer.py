@@ -13,10 +13,18 @@
 #  permissions and limitations under the License.
 
 import datetime
+from tempfile import TemporaryDirectory
 
 import pandas
+from typing_extensions import Annotated
 
 from tests.unit.test_general import _test_materializer
+from zenml import pipeline, step
+from zenml.artifacts.load_config import (
+    ArtifactLoadConfig,
+    artifact_load_config,
+)
+from zenml.enums import ExecutionStatus
 from zenml.integrations.pandas.materializers.pandas_materializer import (
     PandasMaterializer,
 )
@@ -102,3 +110,60 @@ def test_pandas_materializer_with_index():
         assert_visualization_exists=True,
     )
     assert df_datetime_indexed.equals(result)
+
+
+def test_pandas_materializer_with_load_config(clean_client):
+    """Test that the pandas materializer only loads the requested data."""
+    df = pandas.DataFrame(
+        {"A": [1, 2, 3, 4], "B": [4, 5, 6, 7], "C": ["a", "b", "c", "d"]}
+    )
+    load_config = ArtifactLoadConfig(
+        columns=["A", "C"], filters=[("B", ">=", 6)]
+    )
+
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = PandasMaterializer(uri=artifact_uri)
+        materializer.save(df)
+
+        with artifact_load_config(load_config):
+            result = materializer.load(data_type=pandas.DataFrame)
+
+    assert list(result.columns) == ["A", "C"]
+    assert result["A"].tolist() == [3, 4]
+
+
+@step
+def _produce_dataframe() -> pandas.DataFrame:
+    """Step that produces a dataframe."""
+    return pandas.DataFrame(
+        {"A": [1, 2, 3, 4], "B": [4, 5, 6, 7], "C": ["a", "b", "c", "d"]}
+    )
+
+
+@step
+def _consume_dataframe_partially(
+    df: Annotated[
+        pandas.DataFrame,
+        ArtifactLoadConfig(columns=["A"], filters=[("B", ">=", 6)]),
+    ],
+) -> int:
+    """Step that only loads parts of a dataframe."""
+    assert list(df.columns) == ["A"]
+    return int(df["A"].sum())
+
+
+@pipeline(enable_cache=False)
+def _partial_loading_pipeline():
+    """Pipeline that loads parts of a dataframe in a step."""
+    _consume_dataframe_partially(_produce_dataframe())
+
+
+def test_pandas_materializer_load_config_in_pipeline(clean_client):
+    """Test that steps can annotate inputs with a load config."""
+    run = _partial_loading_pipeline()
+
+    step_run = run.steps["_consume_dataframe_partially"]
+    assert step_run.status == ExecutionStatus.COMPLETED
+    assert step_run.output.load() == 7
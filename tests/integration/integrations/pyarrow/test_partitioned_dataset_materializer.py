@@ -0,0 +1,132 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+from tempfile import TemporaryDirectory
+
+import pyarrow as pa
+from typing_extensions import Annotated
+
+from zenml import pipeline, step
+from zenml.artifacts.load_config import (
+    ArtifactLoadConfig,
+    artifact_load_config,
+)
+from zenml.enums import ExecutionStatus
+from zenml.integrations.pyarrow.materializers.partitioned_dataset_materializer import (
+    PartitionedDatasetMaterializer,
+)
+from zenml.integrations.pyarrow.partitioned_dataset import PartitionedDataset
+
+
+def _batches():
+    for start in range(0, 10, 3):
+        values = list(range(start, min(start + 3, 10)))
+        yield pa.RecordBatch.from_pydict(
+            {"a": values, "b": [str(v) for v in values]}
+        )
+
+
+def test_partitioned_dataset_materializer(clean_client):
+    """Test the partitioned dataset materializer."""
+    dataset = PartitionedDataset(_batches(), rows_per_partition=4)
+
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = PartitionedDatasetMaterializer(uri=artifact_uri)
+        materializer.save(dataset)
+
+        assert (
+            len(
+                [f for f in os.listdir(artifact_uri) if f.endswith(".parquet")]
+            )
+            == 3
+        )
+        assert materializer.extract_metadata(dataset) == {
+            "num_partitions": 3,
+            "num_rows": 10,
+        }
+
+        result = materializer.load(data_type=PartitionedDataset)
+        # Loaded datasets can be iterated multiple times
+        for _ in range(2):
+            assert result.to_table().column("a").to_pylist() == list(range(10))
+
+        load_config = ArtifactLoadConfig(
+            columns=["b"], filters=[("a", ">=", 7)]
+        )
+        with artifact_load_config(load_config):
+            result = materializer.load(data_type=PartitionedDataset)
+
+        table = result.to_table()
+        assert table.column_names == ["b"]
+        assert table.column("b").to_pylist() == ["7", "8", "9"]
+
+
+def test_partitioned_dataset_materializer_with_empty_dataset(clean_client):
+    """Test that datasets without any partitions can be loaded."""
+    schema = pa.schema([("a", pa.int64()), ("b", pa.string())])
+
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = PartitionedDatasetMaterializer(uri=artifact_uri)
+        materializer.save(PartitionedDataset([], schema=schema))
+        assert materializer.extract_metadata(None) == {
+            "num_partitions": 0,
+            "num_rows": 0,
+        }
+
+        table = materializer.load(data_type=PartitionedDataset).to_table()
+        assert table.num_rows == 0
+        assert table.schema.equals(schema)
+
+        materializer.save(PartitionedDataset([]))
+        table = materializer.load(data_type=PartitionedDataset).to_table()
+        assert table.num_rows == 0
+        assert table.num_columns == 0
+
+
+@step
+def _produce_dataset() -> PartitionedDataset:
+    """Step that produces a partitioned dataset."""
+    return PartitionedDataset(_batches(), rows_per_partition=4)
+
+
+@step
+def _consume_dataset_partially(
+    dataset: Annotated[
+        PartitionedDataset,
+        ArtifactLoadConfig(columns=["a"], filters=[("a", ">", 7)]),
+    ],
+) -> int:
+    """Step that only loads parts of a partitioned dataset."""
+    table = dataset.to_table()
+    assert table.column_names == ["a"]
+    return sum(table.column("a").to_pylist())
+
+
+@pipeline(enable_cache=False)
+def _partial_loading_pipeline():
+    """Pipeline that loads parts of a partitioned dataset in a step."""
+    _consume_dataset_partially(_produce_dataset())
+
+
+def test_partitioned_dataset_load_config_in_pipeline(clean_client):
+    """Test that steps can annotate dataset inputs with a load config."""
+    run = _partial_loading_pipeline()
+
+    step_run = run.steps["_consume_dataset_partially"]
+    assert step_run.status == ExecutionStatus.COMPLETED
+    assert step_run.output.load() == 17
@@ -0,0 +1,121 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import io
+import os
+from uuid import uuid4
+
+from zenml.artifact_stores.artifact_cache import (
+    LocalArtifactCache,
+    cache_artifact_reads,
+    cached_open,
+)
+from zenml.constants import (
+    ENV_ZENML_ARTIFACT_CACHE_MAX_SIZE,
+    ENV_ZENML_ARTIFACT_CACHE_PATH,
+)
+
+
+def _write(content: bytes):
+    def _download(local_path: str) -> None:
+        with open(local_path, "wb") as f:
+            f.write(content)
+
+    return _download
+
+
+def test_artifact_cache_hits_and_misses(tmp_path):
+    """Tests that files are only downloaded once."""
+    cache = LocalArtifactCache(root=str(tmp_path), max_size=1024)
+    artifact_id = uuid4()
+    uri = "s3://bucket/artifact"
+
+    first = cache.get_file(
+        artifact_id, uri, f"{uri}/data.parquet", download=_write(b"aria")
+    )
+    second = cache.get_file(
+        artifact_id, uri, f"{uri}/data.parquet", download=_write(b"other")
+    )
+
+    assert first == second
+    with open(first, "rb") as f:
+        assert f.read() == b"aria"
+    assert cache.metrics == {"hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_artifact_cache_evicts_least_recently_used_entries(tmp_path):
+    """Tests that the cache evicts the least recently used entries."""
+    cache = LocalArtifactCache(root=str(tmp_path), max_size=10)
+    uri = "s3://bucket/artifact"
+
+    first = cache.get_file(
+        uuid4(), uri, f"{uri}/data", download=_write(b"x" * 8)
+    )
+    second = cache.get_file(
+        uuid4(), uri, f"{uri}/data", download=_write(b"y" * 8)
+    )
+
+    assert not os.path.exists(first)
+    assert os.path.exists(second)
+    assert cache.metrics["evictions"] == 1
+
+
+def test_artifact_cache_scans_directory_only_once(tmp_path, mocker):
+    """Tests that the cache keeps its entries in memory after the first
+    scan of the cache directory."""
+    uri = "s3://bucket/artifact"
+    existing = LocalArtifactCache(root=str(tmp_path), max_size=10).get_file(
+        uuid4(), uri, f"{uri}/data", download=_write(b"x" * 4)
+    )
+
+    cache = LocalArtifactCache(root=str(tmp_path), max_size=10)
+    get_entries = mocker.spy(cache, "_get_entries")
+    first = cache.get_file(
+        uuid4(), uri, f"{uri}/data", download=_write(b"y" * 4)
+    )
+    second = cache.get_file(
+        uuid4(), uri, f"{uri}/data", download=_write(b"z" * 4)
+    )
+
+    assert get_entries.call_count == 1
+    assert not os.path.exists(existing)
+    assert os.path.exists(first)
+    assert os.path.exists(second)
+    assert cache.metrics["evictions"] == 1
+
+
+def test_cached_open_only_serves_active_artifact(tmp_path, monkeypatch):
+    """Tests that reads are only cached while loading an artifact."""
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_CACHE_MAX_SIZE, "1")
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_CACHE_PATH, str(tmp_path))
+
+    remote_reads = []
+
+    def _remote_open(path, mode="r"):
+        remote_reads.append(path)
+        return io.BytesIO(b"aria")
+
+    open_ = cached_open(_remote_open)
+    uri = "s3://bucket/artifact"
+
+    assert open_(f"{uri}/data", "rb").read() == b"aria"
+    assert len(remote_reads) == 1
+
+    with cache_artifact_reads(artifact_version_id=uuid4(), uri=uri):
+        for _ in range(2):
+            with open_(f"{uri}/data", "rb") as f:
+                assert f.read() == b"aria"
+        # Files outside the artifact URI are not cached
+        open_("s3://bucket/other", "rb")
+
+    assert len(remote_reads) == 3
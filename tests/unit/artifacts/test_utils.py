@@ -19,13 +19,18 @@ import pytest
 from pydantic import BaseModel
 
 from zenml.artifacts.utils import (
+    _compute_artifact_content_hash,
     _load_artifact_from_uri,
+    get_artifact_visualization_size,
     load_artifact_from_response,
     load_model_from_metadata,
+    preview_artifact_visualization,
     save_model_metadata,
+    stream_artifact_visualization,
 )
 from zenml.client import Client
 from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
+from zenml.enums import VisualizationType
 from zenml.materializers.pydantic_materializer import DEFAULT_FILENAME
 from zenml.models import ArtifactVersionResponse
 
@@ -189,3 +194,89 @@ def test__load_artifact(builtin_type_file_uri):
     )
     assert artifact is not None
     assert isinstance(artifact, TempClass)
+
+
+def test_compute_artifact_content_hash(clean_client: "Client"):
+    """Test that the content hash only depends on the artifact files."""
+    artifact_store = clean_client.active_stack.artifact_store
+    root = os.path.join(artifact_store.path, "content_hash_test")
+
+    for name in ["artifact_1", "artifact_2"]:
+        os.makedirs(os.path.join(root, name, "subdir"))
+        with open(os.path.join(root, name, "data.txt"), "w") as f:
+            f.write("data")
+        with open(os.path.join(root, name, "subdir", "more.txt"), "w") as f:
+            f.write("more data")
+
+    hash_1 = _compute_artifact_content_hash(
+        uri=os.path.join(root, "artifact_1"), artifact_store=artifact_store
+    )
+    hash_2 = _compute_artifact_content_hash(
+        uri=os.path.join(root, "artifact_2"), artifact_store=artifact_store
+    )
+    assert hash_1 == hash_2
+
+    with open(
+        os.path.join(root, "artifact_2", "subdir", "more.txt"), "w"
+    ) as f:
+        f.write("new data")
+    hash_3 = _compute_artifact_content_hash(
+        uri=os.path.join(root, "artifact_2"), artifact_store=artifact_store
+    )
+    assert hash_1 != hash_3
+
+
+def test_artifact_content_hash_separates_paths_and_contents(
+    clean_client: "Client",
+):
+    """Test that moving bytes between path and content changes the hash."""
+    artifact_store = clean_client.active_stack.artifact_store
+    root = os.path.join(artifact_store.path, "content_hash_framing_test")
+
+    for name, file_name, content in [
+        ("artifact_1", "a", "bc"),
+        ("artifact_2", "ab", "c"),
+    ]:
+        os.makedirs(os.path.join(root, name))
+        with open(os.path.join(root, name, file_name), "w") as f:
+            f.write(content)
+
+    assert _compute_artifact_content_hash(
+        uri=os.path.join(root, "artifact_1"), artifact_store=artifact_store
+    ) != _compute_artifact_content_hash(
+        uri=os.path.join(root, "artifact_2"), artifact_store=artifact_store
+    )
+
+
+def test_stream_and_preview_artifact_visualization(
+    mocker, clean_client: "Client"
+):
+    """Test streaming ranges and previews of artifact visualizations."""
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "visualization_test", "data.csv")
+    os.makedirs(os.path.dirname(uri))
+    content = "a,b\n" + "".join(f"{i},{i * 2}\n" for i in range(100))
+    with open(uri, "w") as f:
+        f.write(content)
+
+    artifact = mocker.Mock(
+        spec=ArtifactVersionResponse,
+        id="123",
+        artifact_store_id=artifact_store.id,
+        visualizations=[mocker.Mock(type=VisualizationType.CSV, uri=uri)],
+    )
+
+    assert get_artifact_visualization_size(artifact) == len(content)
+    assert b"".join(stream_artifact_visualization(artifact)) == (
+        content.encode()
+    )
+    assert (
+        b"".join(stream_artifact_visualization(artifact, offset=4, length=6))
+        == content[4:10].encode()
+    )
+
+    assert preview_artifact_visualization(artifact, max_rows=2) == (
+        b"a,b\n0,0\n1,2\n"
+    )
+    assert preview_artifact_visualization(artifact, max_rows=100) is None
+    assert preview_artifact_visualization(artifact) is None
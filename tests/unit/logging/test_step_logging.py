@@ -0,0 +1,299 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import asyncio
+import io
+import os
+import threading
+from contextlib import nullcontext
+from unittest.mock import MagicMock
+
+import pytest
+
+from zenml.logging.step_logging import (
+    StepLogsStorage,
+    StepLogsStorageContext,
+    _get_active_logs_context,
+    _get_chunk_ranges,
+    _write_logs_index,
+    fetch_logs,
+    stream_logs,
+    stream_logs_async,
+)
+
+
+class _RecordingFile(io.StringIO):
+    """File which stores its content in a list once it is closed."""
+
+    def __init__(self, files):
+        super().__init__()
+        self.files = files
+
+    def __exit__(self, *args):
+        self.files.append(self.getvalue())
+        return super().__exit__(*args)
+
+
+def _get_artifact_store(files):
+    """Gets a mutable artifact store which records all written files."""
+    artifact_store = MagicMock()
+    artifact_store.config.IS_IMMUTABLE_FILESYSTEM = False
+    artifact_store.open.side_effect = lambda *args: _RecordingFile(files)
+    return artifact_store
+
+
+def test_step_logs_storage_writes_in_batches():
+    """Tests that messages are written in batches by the shipper thread."""
+    files = []
+    storage = StepLogsStorage(
+        logs_uri="logs.log",
+        artifact_store=_get_artifact_store(files),
+        max_messages=10,
+    )
+    for i in range(25):
+        storage.write(f"\x1b[31mmessage {i}\x1b[0m")
+
+    storage.save_to_file(force=True)
+    content = "".join(files)
+    assert content.count("\n") == 25
+    assert "\x1b" not in content
+    assert len(files) < 25
+
+    storage.write("last message")
+    storage.close()
+    assert "last message" in files[-1]
+    assert not storage._shipper.is_alive()
+
+    storage.write("ignored message")
+    assert "ignored message" not in "".join(files)
+
+
+def test_step_logs_storage_drops_messages_when_full():
+    """Tests that messages get dropped if the queue is full."""
+    files = []
+    artifact_store = _get_artifact_store(files)
+    storage = StepLogsStorage(
+        logs_uri="logs.log",
+        artifact_store=artifact_store,
+        queue_size=1,
+        drop_when_full=True,
+    )
+    storage._start_shipper = lambda: None
+    for i in range(5):
+        storage.write(f"message {i}")
+
+    assert storage.dropped_messages == 4
+    artifact_store.open.assert_not_called()
+
+
+def test_getting_chunk_ranges_from_logs_index():
+    """Tests getting the chunk ranges to read for a range of the logs."""
+    chunks = [
+        {"file": "1.log", "offset": 0, "size": 10},
+        {"file": "2.log", "offset": 10, "size": 5},
+        {"file": "3.log", "offset": 15, "size": 10},
+    ]
+
+    assert _get_chunk_ranges([], offset=0, length=10) == []
+    assert _get_chunk_ranges(chunks, offset=0, length=100) == [
+        ("1.log", 0, 10),
+        ("2.log", 0, 5),
+        ("3.log", 0, 10),
+    ]
+    assert _get_chunk_ranges(chunks, offset=12, length=5) == [
+        ("2.log", 2, 3),
+        ("3.log", 0, 2),
+    ]
+    assert _get_chunk_ranges(chunks, offset=-7, length=100) == [
+        ("3.log", 3, 7)
+    ]
+    assert _get_chunk_ranges(chunks, offset=-100, length=3) == [
+        ("1.log", 0, 3)
+    ]
+    assert _get_chunk_ranges(chunks, offset=30, length=10) == []
+
+
+async def _collect_async(blocks):
+    """Collects the blocks of an async iterator."""
+    return [block async for block in blocks]
+
+
+class _DictFile(io.BytesIO):
+    """File which stores its content in a dict once it is closed."""
+
+    def __init__(self, files, path):
+        super().__init__()
+        self.files = files
+        self.path = path
+
+    def close(self):
+        # Only store the content on the first close, files also get closed
+        # again when they are garbage collected
+        if not self.closed:
+            self.files[self.path] = self.getvalue()
+        super().close()
+
+
+def _get_immutable_artifact_store(mocker, files):
+    """Gets an immutable artifact store which keeps files in a dict."""
+
+    def _open(path, mode):
+        if "r" in mode:
+            return io.BytesIO(files[path])
+
+        return _DictFile(files, path)
+
+    artifact_store = MagicMock()
+    artifact_store.config.IS_IMMUTABLE_FILESYSTEM = True
+    artifact_store.isdir.return_value = True
+    artifact_store.open.side_effect = _open
+    artifact_store.listdir.side_effect = lambda uri: [
+        os.path.basename(path)
+        for path in files
+        if os.path.dirname(path) == uri
+    ]
+    artifact_store.remove.side_effect = files.pop
+    mocker.patch(
+        "zenml.logging.step_logging._use_artifact_store",
+        return_value=nullcontext(artifact_store),
+    )
+    return artifact_store
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_streaming_indexed_logs(mocker, asynchronous):
+    """Tests streaming logs from an indexed logs folder."""
+    files = {}
+    artifact_store = _get_immutable_artifact_store(mocker, files)
+    mocker.patch(
+        "zenml.logging.step_logging.STEP_LOGS_FOLLOW_INTERVAL_SECONDS", 0
+    )
+
+    def _add_chunk(name, data):
+        files[os.path.join("logs", name)] = data
+        chunks.append(
+            {"file": name, "size": len(data), "start_time": len(chunks)}
+        )
+        _write_logs_index("logs", artifact_store, chunks, writer_id="test")
+
+    chunks = []
+    _add_chunk("1.log", b"first\n")
+    _add_chunk("2.log", b"second\n")
+
+    def _stream(**kwargs):
+        kwargs.update(
+            zen_store=MagicMock(), artifact_store_id="id", logs_uri="logs"
+        )
+        if asynchronous:
+            return b"".join(
+                asyncio.run(_collect_async(stream_logs_async(**kwargs)))
+            )
+        return b"".join(stream_logs(**kwargs))
+
+    assert _stream() == b"first\nsecond\n"
+    assert _stream(offset=3) == b"st\nsecond\n"
+    assert _stream(offset=-4) == b"ond\n"
+
+    checks = []
+
+    def _is_running():
+        checks.append(None)
+        if len(checks) == 2:
+            _add_chunk("3.log", b"third\n")
+        return len(checks) < 3
+
+    assert _stream(offset=-7, is_running=_is_running) == b"second\nthird\n"
+
+    mocker.patch(
+        "zenml.logging.step_logging.STEP_LOGS_FOLLOW_MAX_IDLE_SECONDS", 0
+    )
+    assert _stream(offset=-6, is_running=lambda: True) == b"third\n"
+
+
+def test_logs_of_multiple_writers_are_merged(mocker):
+    """Tests that writers to the same logs folder keep each other's chunks."""
+    files = {}
+    artifact_store = _get_immutable_artifact_store(mocker, files)
+    launcher_storage = StepLogsStorage(
+        logs_uri="logs", artifact_store=artifact_store
+    )
+    operator_storage = StepLogsStorage(
+        logs_uri="logs", artifact_store=artifact_store
+    )
+
+    launcher_storage._write_messages([(1.0, "launching")])
+    operator_storage._write_messages([(2.0, "running")])
+    operator_storage._write_messages([(3.0, "done")])
+    operator_storage.merge_log_files()
+    launcher_storage._write_messages([(4.0, "finished")])
+    launcher_storage.merge_log_files()
+
+    logs = fetch_logs(
+        zen_store=MagicMock(), artifact_store_id="id", logs_uri="logs"
+    )
+    assert [line.split("] ")[1] for line in logs.splitlines()] == [
+        "launching",
+        "running",
+        "done",
+        "finished",
+    ]
+    # The chunks of the operator got merged, the ones of the launcher can't
+    # be merged without changing the order of the logs
+    assert len([file for file in files if file.endswith(".log")]) == 3
+
+
+def test_threads_without_logs_context_only_use_unambiguous_context():
+    """Tests which logs context receives the messages of threads that didn't
+    enter a logs context themselves."""
+
+    def _get_context_of_other_thread():
+        contexts = []
+        thread = threading.Thread(
+            target=lambda: contexts.append(_get_active_logs_context())
+        )
+        thread.start()
+        thread.join()
+        return contexts[0]
+
+    artifact_store = _get_artifact_store([])
+    outer_context = StepLogsStorageContext("outer.log", artifact_store)
+    inner_context = StepLogsStorageContext("inner.log", artifact_store)
+    parallel_context = StepLogsStorageContext("parallel.log", artifact_store)
+
+    with outer_context:
+        assert _get_context_of_other_thread() is outer_context
+        with inner_context:
+            assert _get_context_of_other_thread() is inner_context
+
+            entered = threading.Event()
+            finish = threading.Event()
+
+            def _run_parallel_step():
+                with parallel_context:
+                    entered.set()
+                    finish.wait()
+
+            parallel_thread = threading.Thread(target=_run_parallel_step)
+            parallel_thread.start()
+            entered.wait()
+            try:
+                assert _get_active_logs_context() is inner_context
+                assert _get_context_of_other_thread() is None
+            finally:
+                finish.set()
+                parallel_thread.join()
+
+            assert _get_context_of_other_thread() is inner_context
+
+    assert _get_context_of_other_thread() is None
@@ -29,6 +29,8 @@ from zenml.models.v2.base.filter import (
     NumericFilter,
     StrFilter,
     UUIDFilter,
+    decode_pagination_cursor,
+    encode_pagination_cursor,
 )
 
 
@@ -260,3 +262,36 @@ def test_string_filter_model():
         filter_value="a_random_string",
         ignore_operators=[GenericFilterOps.ONEOF],
     )
+
+
+@pytest.mark.parametrize(
+    "sort_value",
+    [None, 3, 1.5, "aria", datetime(2024, 1, 2, 3, 4, 5), uuid.uuid4()],
+)
+def test_pagination_cursor_round_trip(sort_value: Any):
+    """Test that pagination cursors preserve the sort value and ID."""
+    id_ = uuid.uuid4()
+    cursor = encode_pagination_cursor(sort_value, id_)
+
+    assert decode_pagination_cursor(cursor) == (sort_value, id_)
+
+
+def test_invalid_pagination_cursor_fails():
+    """Test that decoding an invalid pagination cursor fails."""
+    with pytest.raises(ValueError):
+        decode_pagination_cursor("not_a_cursor")
+
+
+def test_cursor_pagination_fails_for_custom_sorting():
+    """Test that cursors can't be used with custom sorting options."""
+
+    class CustomSortingFilterModel(BaseFilter):
+        CUSTOM_SORTING_OPTIONS = ["custom"]
+
+    filter_model = CustomSortingFilterModel(
+        sort_by="custom",
+        after=encode_pagination_cursor(1, uuid.uuid4()),
+    )
+    assert not filter_model.supports_cursor
+    with pytest.raises(ValueError):
+        filter_model.apply_cursor(query=None, table=None)
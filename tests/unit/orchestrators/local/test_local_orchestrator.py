@@ -12,7 +12,10 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from zenml.enums import StackComponentType
+import threading
+
+from zenml import get_step_context, pipeline, step
+from zenml.enums import ExecutionStatus, StackComponentType
 from zenml.orchestrators import LocalOrchestratorFlavor
 
 
@@ -23,3 +26,49 @@ def test_local_orchestrator_flavor_attributes():
     flavor = LocalOrchestratorFlavor()
     assert flavor.type == StackComponentType.ORCHESTRATOR
     assert flavor.name == "local"
+
+
+_BARRIER = threading.Barrier(2)
+
+
+@step
+def _parallel_step(barrier_timeout: float = 10.0) -> str:
+    """Step that can only finish if another step runs concurrently."""
+    step_name = get_step_context().step_run.name
+    print(f"Output of step {step_name}.")
+    _BARRIER.wait(timeout=barrier_timeout)
+    # Make sure the step context was not replaced by the other step
+    assert get_step_context().step_run.name == step_name
+    return step_name
+
+
+def test_local_orchestrator_runs_independent_steps_in_parallel(
+    clean_client,
+):
+    """Tests that the local orchestrator runs independent steps concurrently
+    and keeps their step context and logs separate."""
+
+    @pipeline(
+        enable_cache=False,
+        settings={"orchestrator": {"max_parallel_steps": 2}},
+    )
+    def _pipeline():
+        _parallel_step(id="step_1")
+        _parallel_step(id="step_2")
+
+    _BARRIER.reset()
+    run = _pipeline()
+
+    artifact_store = clean_client.active_stack.artifact_store
+    for step_name, other_step_name in [
+        ("step_1", "step_2"),
+        ("step_2", "step_1"),
+    ]:
+        step_run = run.steps[step_name]
+        assert step_run.status == ExecutionStatus.COMPLETED
+        assert step_run.output.load() == step_name
+
+        with artifact_store.open(step_run.logs.uri, "r") as f:
+            logs = f.read()
+        assert f"Output of step {step_name}." in logs
+        assert f"Output of step {other_step_name}." not in logs
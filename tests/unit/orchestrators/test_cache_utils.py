@@ -151,6 +151,25 @@ def test_generate_cache_key_considers_input_artifacts(
     assert key_1 != key_2
 
 
+def test_generate_cache_key_uses_input_artifact_content_hashes(
+    generate_cache_key_kwargs,
+):
+    """Check that input artifact content hashes replace the artifact IDs."""
+    generate_cache_key_kwargs["input_artifact_content_hashes"] = {
+        "input_1": "content_hash"
+    }
+    key_1 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    generate_cache_key_kwargs["input_artifact_ids"] = {"input_1": uuid4()}
+    key_2 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_1 == key_2
+
+    generate_cache_key_kwargs["input_artifact_content_hashes"] = {
+        "input_1": "other_content_hash"
+    }
+    key_3 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_1 != key_3
+
+
 def test_generate_cache_key_considers_output_artifacts(
     generate_cache_key_kwargs,
 ):
@@ -275,3 +294,101 @@ def test_fetching_cached_step_run_uses_latest_candidate(
 
     cached_step = cache_utils.get_cached_step_run(cache_key="cache_key")
     assert cached_step == response_2
+
+
+def test_fetching_multiple_cached_step_runs(
+    clean_client,
+    sample_pipeline_deployment_request_model,
+    sample_pipeline_run_request_model,
+    sample_step_request_model,
+):
+    """Tests fetching the cached step runs for multiple cache keys at once."""
+    assert cache_utils.get_cached_step_runs(cache_keys=[]) == {}
+
+    sample_step_request_model.workspace = clean_client.active_workspace.id
+    sample_pipeline_deployment_request_model.workspace = (
+        clean_client.active_workspace.id
+    )
+    sample_pipeline_run_request_model.workspace = (
+        clean_client.active_workspace.id
+    )
+    sample_pipeline_deployment_request_model.step_configurations = {
+        name: Step.model_validate(
+            {
+                "spec": {
+                    "source": "module.step_class",
+                    "upstream_steps": [],
+                    "inputs": {},
+                },
+                "config": {"name": name},
+            }
+        )
+        for name in ["step_1", "step_2", "step_3"]
+    }
+
+    deployment_response = clean_client.zen_store.create_deployment(
+        sample_pipeline_deployment_request_model
+    )
+    sample_pipeline_run_request_model.deployment = deployment_response.id
+    sample_step_request_model.deployment = deployment_response.id
+    run = clean_client.zen_store.create_run(sample_pipeline_run_request_model)
+    sample_step_request_model.pipeline_run_id = run.id
+
+    requests = []
+    for name, cache_key, status in [
+        ("step_1", "cache_key_1", ExecutionStatus.COMPLETED),
+        ("step_2", "cache_key_2", ExecutionStatus.COMPLETED),
+        ("step_3", "cache_key_3", ExecutionStatus.RUNNING),
+    ]:
+        request = sample_step_request_model.model_copy(
+            update={"name": name, "cache_key": cache_key, "status": status}
+        )
+        requests.append(request)
+
+    step_runs = clean_client.zen_store.batch_create_run_steps(requests)
+    assert [step_run.name for step_run in step_runs] == [
+        "step_1",
+        "step_2",
+        "step_3",
+    ]
+
+    cached_step_runs = cache_utils.get_cached_step_runs(
+        cache_keys=["cache_key_1", "cache_key_2", "cache_key_3", "unknown"]
+    )
+    assert set(cached_step_runs) == {"cache_key_1", "cache_key_2"}
+    assert cached_step_runs["cache_key_1"].id == step_runs[0].id
+    assert cached_step_runs["cache_key_2"].id == step_runs[1].id
+
+    other_run = clean_client.zen_store.create_run(
+        sample_pipeline_run_request_model.model_copy(
+            update={"name": "other_run"}
+        )
+    )
+    newer_step_run = clean_client.zen_store.create_run_step(
+        requests[0].model_copy(update={"pipeline_run_id": other_run.id})
+    )
+    assert (
+        clean_client.zen_store.get_cached_step_runs(
+            cache_keys=["cache_key_1"],
+            workspace_id=clean_client.active_workspace.id,
+        )["cache_key_1"].id
+        == newer_step_run.id
+    )
+
+    # Step runs of pipeline runs which are not allowed must not hide older
+    # step runs with the same cache key
+    cached_step_runs = clean_client.zen_store.get_cached_step_runs(
+        cache_keys=["cache_key_1", "cache_key_2"],
+        workspace_id=clean_client.active_workspace.id,
+        allowed_pipeline_run_ids={run.id},
+    )
+    assert cached_step_runs["cache_key_1"].id == step_runs[0].id
+    assert cached_step_runs["cache_key_2"].id == step_runs[1].id
+    assert (
+        clean_client.zen_store.get_cached_step_runs(
+            cache_keys=["cache_key_1"],
+            workspace_id=clean_client.active_workspace.id,
+            allowed_pipeline_run_ids=set(),
+        )
+        == {}
+    )
@@ -12,10 +12,19 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import asyncio
+import threading
+import time
 from contextlib import ExitStack as does_not_raise
 from typing import Dict, List
 
-from zenml.orchestrators.dag_runner import ThreadedDagRunner, reverse_dag
+import pytest
+
+from zenml.orchestrators.dag_runner import (
+    NodeStatus,
+    ThreadedDagRunner,
+    reverse_dag,
+)
 
 
 def test_reverse_dag():
@@ -41,6 +50,11 @@ def _test_runner(dag: Dict[str, List[str]], correct_results: List[int]):
         ThreadedDagRunner(dag, run_fn).run()
     assert run_fn.result in correct_results
 
+    run_fn = MockRunFn()
+    with does_not_raise():
+        asyncio.run(ThreadedDagRunner(dag, run_fn).run_async())
+    assert run_fn.result in correct_results
+
 
 def test_dag_runner_empty():  # {}
     """Test running a DAG with no nodes."""
@@ -68,3 +82,163 @@ def test_dag_runner_multi_path():  # 3->(2, 5)->1
 def test_dag_runner_cyclic():
     """Test that nothing happens for cyclic graphs, and no error is raised."""
     _test_runner({1: [2], 2: [1]}, correct_results=[0])
+
+
+def test_dag_runner_max_parallelism():
+    """Test that the DAG runner respects the maximum parallelism."""
+    lock = threading.Lock()
+    running_nodes = 0
+    max_running_nodes = 0
+
+    def run_fn(node) -> None:
+        nonlocal running_nodes, max_running_nodes
+        with lock:
+            running_nodes += 1
+            max_running_nodes = max(max_running_nodes, running_nodes)
+        time.sleep(0.05)
+        with lock:
+            running_nodes -= 1
+
+    dag = {node: [] for node in range(6)}
+    ThreadedDagRunner(dag, run_fn, max_parallelism=2).run()
+    assert max_running_nodes == 2
+
+    with pytest.raises(ValueError):
+        ThreadedDagRunner(dag, run_fn, max_parallelism=0)
+
+
+def test_dag_runner_prioritizes_critical_path():
+    """Test that nodes on the critical path get started first."""
+    # 1 -> 2 -> 3 is the critical path, 4 and 5 are independent nodes
+    dag = {4: [], 5: [], 1: [], 2: [1], 3: [2]}
+    started_nodes = []
+
+    ThreadedDagRunner(dag, started_nodes.append, max_parallelism=1).run()
+    assert started_nodes[:2] == [1, 2]
+    assert sorted(started_nodes) == [1, 2, 3, 4, 5]
+
+    started_nodes = []
+    ThreadedDagRunner(
+        dag,
+        started_nodes.append,
+        max_parallelism=1,
+        node_priorities={5: 10},
+    ).run()
+    assert started_nodes[0] == 5
+
+
+def _failing_run_fn(failing_node):
+    started_nodes = []
+
+    def run_fn(node) -> None:
+        started_nodes.append(node)
+        if node == failing_node:
+            raise RuntimeError("Node failed.")
+
+    return run_fn, started_nodes
+
+
+def test_dag_runner_skips_downstream_nodes_of_failed_node():
+    """Test that downstream nodes of a failed node are skipped."""
+    # 1 -> 2 -> 3, 4 -> 5
+    dag = {1: [], 2: [1], 3: [2], 4: [], 5: [4]}
+    run_fn, started_nodes = _failing_run_fn(failing_node=1)
+
+    runner = ThreadedDagRunner(dag, run_fn, max_parallelism=1)
+    with does_not_raise():
+        runner.run()
+
+    assert started_nodes == [1, 4, 5]
+    assert runner.node_states == {
+        1: NodeStatus.FAILED,
+        2: NodeStatus.SKIPPED,
+        3: NodeStatus.SKIPPED,
+        4: NodeStatus.COMPLETED,
+        5: NodeStatus.COMPLETED,
+    }
+
+
+def test_dag_runner_fail_fast():
+    """Test that no new nodes are started after a failure with fail fast."""
+    dag = {1: [], 2: [1], 3: [2], 4: [], 5: [4]}
+    run_fn, started_nodes = _failing_run_fn(failing_node=1)
+
+    runner = ThreadedDagRunner(dag, run_fn, max_parallelism=1, fail_fast=True)
+    runner.run()
+
+    assert started_nodes == [1]
+    assert runner.node_states[1] == NodeStatus.FAILED
+    assert all(
+        runner.node_states[node] == NodeStatus.SKIPPED for node in [2, 3, 4, 5]
+    )
+
+
+def test_dag_runner_run_async_with_coroutine_run_fn():
+    """Test that `run_async` awaits coroutine run functions.
+
+    The node dependencies and maximum parallelism must be respected.
+    """
+    # Each layer of 50 nodes depends on all nodes of the previous layer
+    layers = [[f"{i}_{j}" for j in range(50)] for i in range(10)]
+    dag = {node: [] for node in layers[0]}
+    for upstream_layer, layer in zip(layers, layers[1:]):
+        for node in layer:
+            dag[node] = upstream_layer
+
+    finished_nodes = set()
+    running_nodes = 0
+    max_running_nodes = 0
+
+    async def run_fn(node) -> None:
+        nonlocal running_nodes, max_running_nodes
+        assert all(
+            upstream_node in finished_nodes for upstream_node in dag[node]
+        )
+        running_nodes += 1
+        max_running_nodes = max(max_running_nodes, running_nodes)
+        await asyncio.sleep(0)
+        running_nodes -= 1
+        finished_nodes.add(node)
+
+    runner = ThreadedDagRunner(dag, run_fn, max_parallelism=20)
+    asyncio.run(runner.run_async())
+
+    assert finished_nodes == set(dag)
+    assert max_running_nodes == 20
+    assert all(
+        state == NodeStatus.COMPLETED for state in runner.node_states.values()
+    )
+
+
+def test_dag_runner_run_async_skips_downstream_nodes_of_failed_node():
+    """Test that `run_async` skips downstream nodes of a failed node."""
+    dag = {1: [], 2: [1], 3: [2], 4: [], 5: [4]}
+    run_fn, started_nodes = _failing_run_fn(failing_node=1)
+
+    runner = ThreadedDagRunner(dag, run_fn)
+    asyncio.run(runner.run_async())
+
+    assert sorted(started_nodes) == [1, 4, 5]
+    assert runner.node_states[2] == NodeStatus.SKIPPED
+    assert runner.node_states[3] == NodeStatus.SKIPPED
+
+
+@pytest.mark.parametrize(
+    "exception_type", [asyncio.CancelledError, KeyboardInterrupt]
+)
+def test_dag_runner_run_async_fails_nodes_on_base_exceptions(exception_type):
+    """Test that `run_async` fails nodes which raise a `BaseException`."""
+    dag = {1: [], 2: [1], 3: [2]}
+
+    async def run_fn(node) -> None:
+        if node == 1:
+            raise exception_type()
+
+    runner = ThreadedDagRunner(dag, run_fn)
+    asyncio.run(runner.run_async())
+
+    assert runner.node_states == {
+        1: NodeStatus.FAILED,
+        2: NodeStatus.SKIPPED,
+        3: NodeStatus.SKIPPED,
+    }
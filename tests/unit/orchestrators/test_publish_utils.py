@@ -135,3 +135,30 @@ def test_publish_step_run_metadata(mocker):
         step_run_metadata=step_run_metadata,
     )
     assert mock_create_run.call_count == 2  # once per run
+
+
+def test_finalize_successful_step_run(mocker):
+    """Unit test for `finalize_successful_step_run`."""
+    mock_finalize_step_run = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.finalize_step_run",
+    )
+    step_run_id = uuid4()
+    stack_component_id = uuid4()
+    model_version_id = uuid4()
+
+    publish_utils.finalize_successful_step_run(
+        step_run_id=step_run_id,
+        output_artifacts={},
+        step_run_metadata={stack_component_id: {"pi": 3.14}},
+        model_version_id=model_version_id,
+    )
+    _, call_kwargs = mock_finalize_step_run.call_args
+    finalize_request = call_kwargs["finalize_request"]
+    assert call_kwargs["step_run_id"] == step_run_id
+    assert finalize_request.status == ExecutionStatus.COMPLETED
+    assert finalize_request.model_version_id == model_version_id
+    assert len(finalize_request.run_metadata) == 1
+    run_metadata = finalize_request.run_metadata[0]
+    assert run_metadata.stack_component_id == stack_component_id
+    assert run_metadata.values == {"pi": 3.14}
+    assert run_metadata.resources[0].id == step_run_id
@@ -52,8 +52,8 @@ def test_running_a_successful_step(
         "zenml.artifacts.utils.save_artifact",
         return_value=uuid4(),
     )
-    mock_publish_successful_step_run = mocker.patch(
-        "zenml.orchestrators.step_runner.publish_successful_step_run"
+    mock_finalize_successful_step_run = mocker.patch(
+        "zenml.orchestrators.step_runner.finalize_successful_step_run"
     )
 
     step = Step.model_validate(
@@ -90,7 +90,7 @@ def test_running_a_successful_step(
     mock_cleanup_step_run.assert_called_with(
         info=step_run_info, step_failed=False
     )
-    mock_publish_successful_step_run.assert_called_once()
+    mock_finalize_successful_step_run.assert_called_once()
 
 
 def test_running_a_failing_step(
@@ -108,8 +108,8 @@ def test_running_a_failing_step(
         "zenml.artifacts.utils.save_artifact",
         return_value=uuid4(),
     )
-    mock_publish_successful_step_run = mocker.patch(
-        "zenml.orchestrators.step_runner.publish_successful_step_run"
+    mock_finalize_successful_step_run = mocker.patch(
+        "zenml.orchestrators.step_runner.finalize_successful_step_run"
     )
 
     step = Step.model_validate(
@@ -148,7 +148,7 @@ def test_running_a_failing_step(
     mock_cleanup_step_run.assert_called_with(
         info=step_run_info, step_failed=True
     )
-    mock_publish_successful_step_run.assert_not_called()
+    mock_finalize_successful_step_run.assert_not_called()
 
 
 def test_loading_unmaterialized_input_artifact(local_stack, clean_client):
@@ -18,9 +18,11 @@ from numpy import ndarray
 from typing_extensions import Annotated
 
 from zenml.artifacts.artifact_config import ArtifactConfig
+from zenml.artifacts.load_config import ArtifactLoadConfig
 from zenml.enums import ArtifactType
 from zenml.orchestrators.step_runner import OutputSignature
 from zenml.steps.utils import (
+    get_artifact_load_config_from_annotation_metadata,
     parse_return_type_annotations,
     resolve_type_annotation,
 )
@@ -326,3 +328,30 @@ def func_with_duplicate_output_name() -> Tuple[
 def test_invalid_step_output_annotations(func, exception):
     with pytest.raises(exception):
         parse_return_type_annotations(func, {})
+
+
+def test_input_load_config_annotation_parsing():
+    """Tests parsing artifact load configs from input annotations."""
+    load_config = ArtifactLoadConfig(columns=["a"], filters=[("b", ">", 1)])
+
+    assert get_artifact_load_config_from_annotation_metadata(int) is None
+    assert (
+        get_artifact_load_config_from_annotation_metadata(
+            Annotated[int, "name"]
+        )
+        is None
+    )
+    assert (
+        get_artifact_load_config_from_annotation_metadata(
+            Annotated[int, load_config]
+        )
+        == load_config
+    )
+
+    with pytest.raises(ValueError):
+        get_artifact_load_config_from_annotation_metadata(
+            Annotated[int, load_config, load_config]
+        )
+
+    with pytest.raises(ValueError):
+        ArtifactLoadConfig(filters=[("b", "~", 1)])
@@ -0,0 +1,81 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import math
+import threading
+from typing import Any, List
+
+import pytest
+
+from zenml.models import Page
+from zenml.utils.pagination_utils import depaginate, iter_depaginated
+
+ITEMS = list(range(23))
+PAGE_SIZE = 5
+
+
+def _list_items(page: int = 1, requested_pages: List[int] = None) -> Page[Any]:
+    if requested_pages is not None:
+        requested_pages.append(page)
+    offset = (page - 1) * PAGE_SIZE
+    return Page[Any](
+        index=page,
+        max_size=PAGE_SIZE,
+        total_pages=math.ceil(len(ITEMS) / PAGE_SIZE),
+        total=len(ITEMS),
+        items=ITEMS[offset : offset + PAGE_SIZE],
+    )
+
+
+@pytest.mark.parametrize("max_concurrent_requests", [1, 2, 10])
+def test_depaginate_returns_items_of_all_pages_in_order(
+    max_concurrent_requests: int,
+):
+    """Tests that depaginating returns all items in order."""
+    assert (
+        depaginate(
+            _list_items, max_concurrent_requests=max_concurrent_requests
+        )
+        == ITEMS
+    )
+
+
+def test_depaginate_fetches_pages_concurrently():
+    """Tests that the remaining pages are fetched concurrently."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _list_items_concurrently(page: int = 1) -> Page[Any]:
+        if page > 1:
+            # Fails if the pages are not requested at the same time
+            barrier.wait()
+        return _list_items(page=page)
+
+    assert (
+        depaginate(_list_items_concurrently, max_concurrent_requests=2)
+        == ITEMS
+    )
+
+
+def test_iter_depaginated_stops_requesting_pages_early():
+    """Tests that stopping the iteration doesn't fetch all pages."""
+    requested_pages = []
+    items = iter_depaginated(
+        _list_items,
+        max_concurrent_requests=2,
+        requested_pages=requested_pages,
+    )
+
+    assert next(items) == 0
+    items.close()
+
+    assert len(requested_pages) < math.ceil(len(ITEMS) / PAGE_SIZE)
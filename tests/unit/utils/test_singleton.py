@@ -12,7 +12,12 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from zenml.utils.singleton import SingletonMetaClass
+import threading
+
+from zenml.utils.singleton import (
+    SingletonMetaClass,
+    ThreadLocalSingletonMetaClass,
+)
 
 
 class SingletonClass(metaclass=SingletonMetaClass):
@@ -66,3 +71,80 @@ def test_singleton_metaclass_can_be_used_for_multiple_classes():
     assert SingletonClass() is not SecondSingletonClass()
     assert type(SingletonClass()) is SingletonClass
     assert type(SecondSingletonClass()) is SecondSingletonClass
+
+
+class ThreadLocalSingletonClass(metaclass=ThreadLocalSingletonMetaClass):
+    pass
+
+
+def test_thread_local_singleton_instances_are_separate_per_thread():
+    """Tests that each thread gets its own instance of a thread-local
+    singleton, and other threads fall back to the only remaining instance."""
+    ThreadLocalSingletonClass._clear()
+    main_instance = ThreadLocalSingletonClass()
+    assert ThreadLocalSingletonClass() is main_instance
+
+    thread_instances = []
+
+    def _create_instance() -> None:
+        ThreadLocalSingletonClass._clear()
+        thread_instances.append(ThreadLocalSingletonClass())
+        thread_instances.append(ThreadLocalSingletonClass())
+
+    thread = threading.Thread(target=_create_instance)
+    thread.start()
+    thread.join()
+
+    assert thread_instances[0] is thread_instances[1]
+    assert thread_instances[0] is not main_instance
+    assert ThreadLocalSingletonClass() is main_instance
+
+    # The instance of the finished thread was removed
+    fallback_instances = []
+    thread = threading.Thread(
+        target=lambda: fallback_instances.append(
+            ThreadLocalSingletonClass._instance()
+        )
+    )
+    thread.start()
+    thread.join()
+    assert fallback_instances == [main_instance]
+
+    ThreadLocalSingletonClass._clear()
+    assert ThreadLocalSingletonClass._exists() is False
+
+
+def test_thread_local_singleton_has_no_fallback_for_multiple_owners():
+    """Tests that threads don't fall back to an instance of another thread if
+    multiple threads own an instance."""
+    ThreadLocalSingletonClass._clear()
+    main_instance = ThreadLocalSingletonClass()
+
+    instance_created = threading.Event()
+    finish = threading.Event()
+
+    def _own_instance() -> None:
+        ThreadLocalSingletonClass._clear()
+        ThreadLocalSingletonClass()
+        instance_created.set()
+        finish.wait()
+
+    owner = threading.Thread(target=_own_instance)
+    owner.start()
+    instance_created.wait()
+
+    fallback_instances = []
+    thread = threading.Thread(
+        target=lambda: fallback_instances.append(
+            ThreadLocalSingletonClass._instance()
+        )
+    )
+    thread.start()
+    thread.join()
+
+    finish.set()
+    owner.join()
+
+    assert fallback_instances == [None]
+    assert ThreadLocalSingletonClass() is main_instance
+    ThreadLocalSingletonClass._clear()
@@ -0,0 +1,112 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from datetime import timedelta
+from uuid import uuid4
+
+from zenml.models import (
+    APIKeyInternalResponse,
+    APIKeyResponseBody,
+    APIKeyResponseMetadata,
+)
+from zenml.utils.time_utils import utc_now
+from zenml.utils.verification_cache import (
+    VerifiedCredentialCache,
+    get_bcrypt_context,
+    verified_credentials,
+)
+
+
+def test_verified_credential_cache_skips_repeated_verifications(mocker):
+    """Tests that successful verifications are cached."""
+    context = get_bcrypt_context()
+    secret_hash = context.hash("aria")
+    cache = VerifiedCredentialCache()
+    verify = mocker.spy(context, "verify")
+
+    assert cache.verify("aria", secret_hash)
+    assert cache.verify("aria", secret_hash)
+    assert verify.call_count == 1
+
+    # Failed verifications are never cached
+    assert not cache.verify("not_aria", secret_hash)
+    assert not cache.verify("not_aria", secret_hash)
+    assert verify.call_count == 3
+
+
+def test_verified_credential_cache_is_invalidated_by_new_hash():
+    """Tests that changing the stored hash invalidates cached results."""
+    context = get_bcrypt_context()
+    cache = VerifiedCredentialCache()
+
+    assert cache.verify("aria", context.hash("aria"))
+    assert not cache.verify("aria", context.hash("rotated"))
+    assert not cache.verify("aria", None)
+
+
+def test_verified_credential_cache_expires_and_evicts_entries(mocker):
+    """Tests that cached verifications expire and are evicted."""
+    context = get_bcrypt_context()
+    secret_hash = context.hash("aria")
+    verify = mocker.spy(context, "verify")
+
+    cache = VerifiedCredentialCache(ttl=0)
+    assert cache.verify("aria", secret_hash)
+    assert cache.verify("aria", secret_hash)
+    assert verify.call_count == 2
+
+    cache = VerifiedCredentialCache(max_size=1)
+    assert cache.verify("aria", secret_hash)
+    assert cache.verify("axl", context.hash("axl"))
+    assert len(cache._entries) == 1
+
+
+def _api_key(key_hash, previous_key_hash=None, active=True):
+    """Creates an API key model with the given key hashes."""
+    now = utc_now()
+    return APIKeyInternalResponse(
+        id=uuid4(),
+        name="aria",
+        previous_key=previous_key_hash,
+        body=APIKeyResponseBody.model_construct(
+            created=now, updated=now, key=key_hash, active=active
+        ),
+        metadata=APIKeyResponseMetadata(
+            description="",
+            retain_period_minutes=60,
+            last_rotated=now - timedelta(minutes=1),
+        ),
+    )
+
+
+def test_api_key_verification_uses_cache(mocker):
+    """Tests that verified API keys don't need another bcrypt run."""
+    context = get_bcrypt_context()
+    aria_hash, axl_hash = context.hash("aria"), context.hash("axl")
+    verified_credentials.clear()
+    verify = mocker.spy(context, "verify")
+
+    api_key = _api_key(aria_hash)
+    assert api_key.verify_key("aria")
+    assert api_key.verify_key("aria")
+    assert verify.call_count == 1
+
+    # Failures without a valid key still run a full verification
+    assert not api_key.verify_key("axl")
+    assert verify.call_count == 2
+    assert not _api_key(aria_hash, active=False).verify_key("aria")
+    assert verify.call_count > 2
+
+    rotated_api_key = _api_key(axl_hash, aria_hash)
+    assert rotated_api_key.verify_key("aria")
+    assert not rotated_api_key.verify_key("not_aria")
@@ -0,0 +1,105 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from zenml.zen_server.artifact_store_pool import ArtifactStorePool
+
+
+def _mock_pool(mocker, models):
+    """Mocks loading and instantiating artifact stores for the pool."""
+    mocker.patch(
+        "zenml.artifacts.utils._get_artifact_store_model",
+        side_effect=lambda artifact_store_id, zen_store: models[
+            artifact_store_id
+        ],
+    )
+
+    def _instantiate(model):
+        artifact_store = MagicMock()
+        artifact_store._connector_instance = None
+        return artifact_store
+
+    return mocker.patch(
+        "zenml.artifacts.utils._instantiate_artifact_store",
+        side_effect=_instantiate,
+    )
+
+
+def _model(updated):
+    model = MagicMock()
+    model.updated = updated
+    model.connector = None
+    return model
+
+
+def test_artifact_store_pool_reuses_artifact_stores(mocker):
+    """Tests that artifact stores are reused until they are updated."""
+    artifact_store_id = uuid4()
+    now = datetime.now()
+    models = {artifact_store_id: _model(now)}
+    instantiate = _mock_pool(mocker, models)
+    pool = ArtifactStorePool(max_size=2, ttl=60)
+
+    with pool.artifact_store(artifact_store_id, MagicMock()) as first:
+        pass
+    with pool.artifact_store(artifact_store_id, MagicMock()) as second:
+        pass
+
+    assert first is second
+    assert instantiate.call_count == 1
+    first.cleanup.assert_not_called()
+
+    models[artifact_store_id] = _model(now + timedelta(seconds=1))
+    with pool.artifact_store(artifact_store_id, MagicMock()) as third:
+        pass
+
+    assert third is not first
+    first.cleanup.assert_called_once()
+
+
+def test_artifact_store_pool_refreshes_expired_credentials(mocker):
+    """Tests that artifact stores with expired credentials are replaced."""
+    artifact_store_id = uuid4()
+    _mock_pool(mocker, {artifact_store_id: _model(datetime.now())})
+    pool = ArtifactStorePool(max_size=2, ttl=60)
+
+    with pool.artifact_store(artifact_store_id, MagicMock()) as first:
+        first._connector_instance = MagicMock()
+        first.connector_has_expired.return_value = True
+
+    with pool.artifact_store(artifact_store_id, MagicMock()) as second:
+        pass
+
+    assert second is not first
+    first.cleanup.assert_called_once()
+
+
+def test_artifact_store_pool_cleans_up_evicted_stores_after_use(mocker):
+    """Tests that evicted artifact stores are only cleaned up once unused."""
+    first_id, second_id = uuid4(), uuid4()
+    now = datetime.now()
+    _mock_pool(mocker, {first_id: _model(now), second_id: _model(now)})
+    pool = ArtifactStorePool(max_size=1, ttl=60)
+
+    with pool.artifact_store(first_id, MagicMock()) as first:
+        with pool.artifact_store(second_id, MagicMock()) as second:
+            first.cleanup.assert_not_called()
+        first.cleanup.assert_not_called()
+
+    first.cleanup.assert_called_once()
+
+    pool.clear()
+    second.cleanup.assert_called_once()
@@ -0,0 +1,26 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from zenml.zen_server.routers.artifact_version_endpoints import _etag_matches
+
+
+def test_etag_matching():
+    """Tests matching ETags against `If-None-Match` headers."""
+    etag = '"id-0"'
+
+    assert _etag_matches(etag, '"id-0"')
+    assert _etag_matches(etag, '"other", "id-0"')
+    assert _etag_matches(etag, 'W/"id-0"')
+    assert _etag_matches(etag, "*")
+    assert not _etag_matches(etag, '"other"')
+    assert not _etag_matches(etag, '"id-0-rows-10"')
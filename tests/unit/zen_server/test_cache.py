@@ -0,0 +1,73 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import time
+from uuid import uuid4
+
+from zenml.zen_server.cache import MemoryCache
+
+
+def test_memory_cache_namespaces_are_independent():
+    """Tests that namespaces store values and capacities separately."""
+    cache = MemoryCache(max_capacity=10, default_expiry=30, num_shards=1)
+    cache.register_namespace("small", max_capacity=1)
+    key = uuid4()
+
+    cache.set(key, "aria", namespace="small")
+    cache.set(key, "axl")
+    cache.set(uuid4(), "blupus", namespace="small")
+
+    assert cache.get(key, namespace="small") is None
+    assert cache.get(key) == "axl"
+
+    stats = cache.stats()
+    assert stats["small"]["size"] == 1
+    assert stats["small"]["evictions"] == 1
+    assert stats["small"]["misses"] == 1
+    assert stats["default"]["hits"] == 1
+
+
+def test_memory_cache_evicts_least_recently_used_entries():
+    """Tests that the least recently used entries are evicted."""
+    cache = MemoryCache(max_capacity=2, default_expiry=30, num_shards=1)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    cache.set(first, 1)
+    cache.set(second, 2)
+    assert cache.get(first) == 1
+    cache.set(third, 3)
+
+    assert cache.get(first) == 1
+    assert cache.get(second) is None
+    assert cache.get(third) == 3
+
+
+def test_memory_cache_removes_expired_entries(mocker):
+    """Tests that expired entries are removed."""
+    cache = MemoryCache(max_capacity=10, default_expiry=30, num_shards=1)
+    key = uuid4()
+    cache.set(key, "aria", expiry=1)
+    cache.set(uuid4(), "axl", expiry=100)
+
+    now = time.monotonic()
+    mocker.patch("time.monotonic", return_value=now + 10)
+    cache.set(uuid4(), "blupus")
+
+    assert cache.stats()["default"] == {
+        "size": 2,
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "expirations": 1,
+    }
+    assert cache.get(key) is None
@@ -0,0 +1,127 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import asyncio
+from typing import Dict, Optional, Tuple
+
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+
+from zenml.models import Page, UserResponse
+from zenml.zen_server.zen_server_api import ConditionalGetMiddleware
+
+
+def _get(
+    app: FastAPI, path: str, headers: Optional[Dict[str, str]] = None
+) -> Tuple[int, Dict[str, str], bytes]:
+    """Sends a GET request directly to an ASGI app."""
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (key.lower().encode(), value.encode())
+            for key, value in (headers or {}).items()
+        ],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    messages = []
+
+    async def _run() -> None:
+        requests = [{"type": "http.request", "body": b"", "more_body": False}]
+        response_sent = asyncio.Event()
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            await response_sent.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            messages.append(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                response_sent.set()
+
+        await app(scope, receive, send)
+
+    asyncio.run(_run())
+
+    start = messages[0]
+    response_headers = {
+        key.decode(): value.decode() for key, value in start["headers"]
+    }
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return start["status"], response_headers, body
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ConditionalGetMiddleware)
+
+    @app.get("/entity")
+    def get_entity():
+        return {"name": "aria"}
+
+    @app.get("/entities", response_model=Page[UserResponse])
+    def list_entities():
+        return Page(index=1, max_size=1, total_pages=0, total=0, items=[])
+
+    @app.get("/stream", response_class=StreamingResponse)
+    def stream():
+        return StreamingResponse(
+            iter([b'{"name":', b'"aria"}']), media_type="application/json"
+        )
+
+    @app.get("/tagged")
+    def tagged():
+        return Response(
+            b"{}", media_type="application/json", headers={"ETag": '"tag"'}
+        )
+
+    return app
+
+
+def test_conditional_get_middleware_revalidates_entities():
+    """Tests that entity responses get an ETag and can be revalidated."""
+    app = _create_app()
+
+    _, headers, _ = _get(app, "/entity")
+    etag = headers["etag"]
+
+    status, _, _ = _get(
+        app, "/entity", headers={"If-None-Match": f'"other", W/{etag}'}
+    )
+    assert status == 304
+
+    status, _, body = _get(
+        app, "/entity", headers={"If-None-Match": '"other"'}
+    )
+    assert status == 200
+    assert body == b'{"name":"aria"}'
+
+
+def test_conditional_get_middleware_skips_other_responses():
+    """Tests that list, streaming and already tagged responses are skipped."""
+    app = _create_app()
+
+    assert "etag" not in _get(app, "/entities")[1]
+    assert "etag" not in _get(app, "/stream")[1]
+    assert _get(app, "/tagged")[1]["etag"] == '"tag"'
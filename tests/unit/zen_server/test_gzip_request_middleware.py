@@ -0,0 +1,73 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import asyncio
+import gzip
+from typing import List, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from zenml.zen_server.zen_server_api import GZipRequestMiddleware
+
+
+async def _echo(scope, receive, send) -> None:
+    """ASGI app which responds with the request body."""
+    body = await Request(scope, receive).body()
+    await Response(body)(scope, receive, send)
+
+
+def _post(body_chunks: List[bytes], max_bytes: int) -> Tuple[int, bytes]:
+    """Sends gzip encoded request body chunks through the middleware."""
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"content-encoding", b"gzip")],
+    }
+    requests = [
+        {
+            "type": "http.request",
+            "body": chunk,
+            "more_body": i < len(body_chunks) - 1,
+        }
+        for i, chunk in enumerate(body_chunks)
+    ]
+    messages = []
+
+    async def receive():
+        return requests.pop(0)
+
+    async def send(message):
+        messages.append(message)
+
+    middleware = GZipRequestMiddleware(_echo, max_bytes=max_bytes)
+    asyncio.run(middleware(scope, receive, send))
+
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return messages[0]["status"], body
+
+
+def test_gzip_request_middleware_decompresses_bodies():
+    """Tests that gzip encoded request bodies get decompressed."""
+    data = b'{"name": "aria"}' * 10
+    compressed = gzip.compress(data)
+
+    assert _post([compressed[:10], compressed[10:]], max_bytes=1000) == (
+        200,
+        data,
+    )
+    assert _post([compressed], max_bytes=len(data) - 1)[0] == 413
+    assert _post([compressed[:-10]], max_bytes=1000)[0] == 400
+    assert _post([b"not gzip"], max_bytes=1000)[0] == 400
@@ -0,0 +1,83 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import json
+
+from zenml.config.pipeline_configurations import PipelineConfiguration
+from zenml.config.source import Source, SourceType
+from zenml.config.step_configurations import (
+    Step,
+    StepConfiguration,
+    StepSpec,
+)
+from zenml.zen_stores.schemas.pipeline_deployment_schemas import (
+    ParsedDeploymentConfiguration,
+)
+
+
+def _get_parsed_configuration() -> ParsedDeploymentConfiguration:
+    """Gets a parsed configuration of a deployment with a single step."""
+    step = Step(
+        spec=StepSpec(
+            source=Source(
+                module="steps", attribute="my_step", type=SourceType.USER
+            ),
+            upstream_steps=[],
+        ),
+        config=StepConfiguration(name="my_step", parameters={"a": 1}),
+    )
+    return ParsedDeploymentConfiguration(
+        pipeline_configuration=PipelineConfiguration(
+            name="pipeline"
+        ).model_dump_json(),
+        step_configurations=json.dumps(
+            {"my_step": step.model_dump(mode="json")}
+        ),
+    )
+
+
+def test_parsed_deployment_configuration_returns_independent_objects():
+    """Tests that modifying a parsed configuration does not affect others."""
+    parsed_configuration = _get_parsed_configuration()
+
+    first = parsed_configuration.get_step_configuration("my_step")
+    first.config.parameters["a"] = 2
+    first.config.parameters["b"] = 3
+
+    second = parsed_configuration.get_step_configuration("my_step")
+    assert second.config.parameters == {"a": 1}
+    assert parsed_configuration.get_step_configurations()[
+        "my_step"
+    ].config.parameters == {"a": 1}
+    assert parsed_configuration.get_step_configuration("other") is None
+
+    pipeline_configuration = parsed_configuration.pipeline_configuration
+    pipeline_configuration.extra["a"] = 1
+    assert parsed_configuration.pipeline_configuration.extra == {}
+
+
+def test_parsed_deployment_configuration_validates_only_once(mocker):
+    """Tests that the configurations are only validated on first access."""
+    parsed_configuration = _get_parsed_configuration()
+    pipeline_validate = mocker.spy(
+        PipelineConfiguration, "model_validate_json"
+    )
+    step_validate = mocker.spy(Step, "model_validate")
+
+    for _ in range(3):
+        assert parsed_configuration.pipeline_configuration.name == "pipeline"
+        assert parsed_configuration.get_step_configuration("my_step")
+        assert "my_step" in parsed_configuration.get_step_configurations()
+
+    assert pipeline_validate.call_count == 1
+    assert step_validate.call_count == 1